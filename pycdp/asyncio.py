@@ -13,7 +13,7 @@ from aiohttp.client_exceptions import (
 )
 from pycdp.exceptions import *
 from pycdp.base import IEventLoop
-from pycdp.utils import ContextLoggerMixin, LoggerMixin, SingleTaskWorker, retry_on
+from pycdp.utils import ContextLoggerMixin, LoggerMixin, SingleTaskWorker, json_dumps, json_loads, retry_on
 from pycdp import cdp
 
 
@@ -96,7 +96,7 @@ class CDPBase(LoggerMixin):
         if self._session_id:
             request['sessionId'] = self._session_id
         self._logger.debug('sending command %r', request)
-        request_str = json.dumps(request)
+        request_str = json_dumps(request)
         try:
             try:
                 await self._ws.send_str(request_str)
@@ -109,6 +109,19 @@ class CDPBase(LoggerMixin):
                 del self._inflight_cmd[cmd_id]
             raise
 
+    async def execute_many(self, *cmds: t.Generator[dict, dict, t.Any]) -> t.List[t.Any]:
+        '''
+        Execute several commands on the server and wait for all results.
+
+        CDP has no JSON-RPC batch requests, so each command is still sent in its
+        own message, but all of them are sent before waiting for any response.
+        This costs a single roundtrip instead of one roundtrip per command.
+
+        :param cmds: any CDP commands
+        :returns: a list with the CDP result of each command, in the same order
+        '''
+        return await asyncio.gather(*(self.execute(cmd) for cmd in cmds))
+
     def listen(self, *event_types: t.Type[T], buffer_size=100) -> t.AsyncIterator[T]:
         '''Return an async iterator that iterates over events matching the
         indicated types.'''
@@ -290,7 +303,7 @@ class CDPConnection(CDPBase, SingleTaskWorker):
             message = await self._ws.receive()
             if message.type == WSMsgType.TEXT:
                 try:
-                    data = json.loads(message.data)
+                    data = json_loads(message.data)
                 except json.JSONDecodeError:
                     raise CDPBrowserError({
                         'code': -32700,
@@ -302,7 +315,7 @@ class CDPConnection(CDPBase, SingleTaskWorker):
                     try:
                         session = self._sessions[session_id]
                     except KeyError:
-                        self._logger.debug(f'received message for unknown session: {data}')
+                        self._logger.debug('received message for unknown session: %s', data)
                         continue
                     session._handle_data(data)
                 else:
@@ -255,8 +255,8 @@ class AXValue:
         return cls(
             type_=AXValueType.from_json(json['type']),
             value=json['value'] if json.get('value', None) is not None else None,
-            related_nodes=[AXRelatedNode.from_json(i) for i in json['relatedNodes']] if json.get('relatedNodes', None) is not None else None,
-            sources=[AXValueSource.from_json(i) for i in json['sources']] if json.get('sources', None) is not None else None,
+            related_nodes=list(map(AXRelatedNode.from_json, json['relatedNodes'])) if json.get('relatedNodes', None) is not None else None,
+            sources=list(map(AXValueSource.from_json, json['sources'])) if json.get('sources', None) is not None else None,
         )
 
 
@@ -394,15 +394,15 @@ class AXNode:
         return cls(
             node_id=AXNodeId.from_json(json['nodeId']),
             ignored=bool(json['ignored']),
-            ignored_reasons=[AXProperty.from_json(i) for i in json['ignoredReasons']] if json.get('ignoredReasons', None) is not None else None,
+            ignored_reasons=list(map(AXProperty.from_json, json['ignoredReasons'])) if json.get('ignoredReasons', None) is not None else None,
             role=AXValue.from_json(json['role']) if json.get('role', None) is not None else None,
             chrome_role=AXValue.from_json(json['chromeRole']) if json.get('chromeRole', None) is not None else None,
             name=AXValue.from_json(json['name']) if json.get('name', None) is not None else None,
             description=AXValue.from_json(json['description']) if json.get('description', None) is not None else None,
             value=AXValue.from_json(json['value']) if json.get('value', None) is not None else None,
-            properties=[AXProperty.from_json(i) for i in json['properties']] if json.get('properties', None) is not None else None,
+            properties=list(map(AXProperty.from_json, json['properties'])) if json.get('properties', None) is not None else None,
             parent_id=AXNodeId.from_json(json['parentId']) if json.get('parentId', None) is not None else None,
-            child_ids=[AXNodeId.from_json(i) for i in json['childIds']] if json.get('childIds', None) is not None else None,
+            child_ids=list(map(AXNodeId.from_json, json['childIds'])) if json.get('childIds', None) is not None else None,
             backend_dom_node_id=dom.BackendNodeId.from_json(json['backendDOMNodeId']) if json.get('backendDOMNodeId', None) is not None else None,
             frame_id=page.FrameId.from_json(json['frameId']) if json.get('frameId', None) is not None else None,
         )
@@ -412,10 +412,9 @@ def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Disables the accessibility domain.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Accessibility.disable',
     }
-    json = yield cmd_dict
 
 
 def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -423,10 +422,9 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     Enables the accessibility domain which causes ``AXNodeId``'s to remain consistent between method calls.
     This turns on accessibility for the page, which can impact performance until accessibility is disabled.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Accessibility.enable',
     }
-    json = yield cmd_dict
 
 
 def get_partial_ax_tree(
@@ -455,12 +453,11 @@ def get_partial_ax_tree(
         params['objectId'] = object_id.to_json()
     if fetch_relatives is not None:
         params['fetchRelatives'] = fetch_relatives
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Accessibility.getPartialAXTree',
         'params': params,
     }
-    json = yield cmd_dict
-    return [AXNode.from_json(i) for i in json['nodes']]
+    return list(map(AXNode.from_json, json['nodes']))
 
 
 def get_full_ax_tree(
@@ -481,12 +478,11 @@ def get_full_ax_tree(
         params['depth'] = depth
     if frame_id is not None:
         params['frameId'] = frame_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Accessibility.getFullAXTree',
         'params': params,
     }
-    json = yield cmd_dict
-    return [AXNode.from_json(i) for i in json['nodes']]
+    return list(map(AXNode.from_json, json['nodes']))
 
 
 def get_root_ax_node(
@@ -504,11 +500,10 @@ def get_root_ax_node(
     params: T_JSON_DICT = dict()
     if frame_id is not None:
         params['frameId'] = frame_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Accessibility.getRootAXNode',
         'params': params,
     }
-    json = yield cmd_dict
     return AXNode.from_json(json['node'])
 
 
@@ -535,12 +530,11 @@ def get_ax_node_and_ancestors(
         params['backendNodeId'] = backend_node_id.to_json()
     if object_id is not None:
         params['objectId'] = object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Accessibility.getAXNodeAndAncestors',
         'params': params,
     }
-    json = yield cmd_dict
-    return [AXNode.from_json(i) for i in json['nodes']]
+    return list(map(AXNode.from_json, json['nodes']))
 
 
 def get_child_ax_nodes(
@@ -557,16 +551,16 @@ def get_child_ax_nodes(
     :param frame_id: *(Optional)* The frame in whose document the node resides. If omitted, the root frame is used.
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['id'] = id_.to_json()
+    params: T_JSON_DICT = {
+        'id': id_.to_json(),
+    }
     if frame_id is not None:
         params['frameId'] = frame_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Accessibility.getChildAXNodes',
         'params': params,
     }
-    json = yield cmd_dict
-    return [AXNode.from_json(i) for i in json['nodes']]
+    return list(map(AXNode.from_json, json['nodes']))
 
 
 def query_ax_tree(
@@ -603,12 +597,11 @@ def query_ax_tree(
         params['accessibleName'] = accessible_name
     if role is not None:
         params['role'] = role
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Accessibility.queryAXTree',
         'params': params,
     }
-    json = yield cmd_dict
-    return [AXNode.from_json(i) for i in json['nodes']]
+    return list(map(AXNode.from_json, json['nodes']))
 
 
 @event_class('Accessibility.loadComplete')
@@ -644,5 +637,5 @@ class NodesUpdated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NodesUpdated:
         return cls(
-            nodes=[AXNode.from_json(i) for i in json['nodes']]
+            nodes=list(map(AXNode.from_json, json['nodes']))
         )
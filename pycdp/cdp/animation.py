@@ -6,7 +6,6 @@
 # CDP domain: Animation (experimental)
 
 from __future__ import annotations
-import enum
 import typing
 from dataclasses import dataclass
 from .util import event_class, T_JSON_DICT
@@ -171,7 +170,7 @@ class KeyframesRule:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> KeyframesRule:
         return cls(
-            keyframes=[KeyframeStyle.from_json(i) for i in json['keyframes']],
+            keyframes=list(map(KeyframeStyle.from_json, json['keyframes'])),
             name=str(json['name']) if json.get('name', None) is not None else None,
         )
 
@@ -205,20 +204,18 @@ def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Disables animation domain notifications.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Animation.disable',
     }
-    json = yield cmd_dict
 
 
 def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Enables animation domain notifications.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Animation.enable',
     }
-    json = yield cmd_dict
 
 
 def get_current_time(
@@ -230,13 +227,13 @@ def get_current_time(
     :param id_: Id of animation.
     :returns: Current time of the page.
     '''
-    params: T_JSON_DICT = dict()
-    params['id'] = id_
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'id': id_,
+    }
+    json = yield {
         'method': 'Animation.getCurrentTime',
         'params': params,
     }
-    json = yield cmd_dict
     return float(json['currentTime'])
 
 
@@ -246,10 +243,9 @@ def get_playback_rate() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,float]:
 
     :returns: Playback rate for animations on page.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Animation.getPlaybackRate',
     }
-    json = yield cmd_dict
     return float(json['playbackRate'])
 
 
@@ -261,13 +257,13 @@ def release_animations(
 
     :param animations: List of animation ids to seek.
     '''
-    params: T_JSON_DICT = dict()
-    params['animations'] = [i for i in animations]
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'animations': [i for i in animations],
+    }
+    yield {
         'method': 'Animation.releaseAnimations',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def resolve_animation(
@@ -279,13 +275,13 @@ def resolve_animation(
     :param animation_id: Animation id.
     :returns: Corresponding remote object.
     '''
-    params: T_JSON_DICT = dict()
-    params['animationId'] = animation_id
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'animationId': animation_id,
+    }
+    json = yield {
         'method': 'Animation.resolveAnimation',
         'params': params,
     }
-    json = yield cmd_dict
     return runtime.RemoteObject.from_json(json['remoteObject'])
 
 
@@ -299,14 +295,14 @@ def seek_animations(
     :param animations: List of animation ids to seek.
     :param current_time: Set the current time of each animation.
     '''
-    params: T_JSON_DICT = dict()
-    params['animations'] = [i for i in animations]
-    params['currentTime'] = current_time
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'animations': [i for i in animations],
+        'currentTime': current_time,
+    }
+    yield {
         'method': 'Animation.seekAnimations',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_paused(
@@ -319,14 +315,14 @@ def set_paused(
     :param animations: Animations to set the pause state of.
     :param paused: Paused state to set to.
     '''
-    params: T_JSON_DICT = dict()
-    params['animations'] = [i for i in animations]
-    params['paused'] = paused
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'animations': [i for i in animations],
+        'paused': paused,
+    }
+    yield {
         'method': 'Animation.setPaused',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_playback_rate(
@@ -337,13 +333,13 @@ def set_playback_rate(
 
     :param playback_rate: Playback rate for animations on page
     '''
-    params: T_JSON_DICT = dict()
-    params['playbackRate'] = playback_rate
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'playbackRate': playback_rate,
+    }
+    yield {
         'method': 'Animation.setPlaybackRate',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_timing(
@@ -358,15 +354,15 @@ def set_timing(
     :param duration: Duration of the animation.
     :param delay: Delay of the animation.
     '''
-    params: T_JSON_DICT = dict()
-    params['animationId'] = animation_id
-    params['duration'] = duration
-    params['delay'] = delay
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'animationId': animation_id,
+        'duration': duration,
+        'delay': delay,
+    }
+    yield {
         'method': 'Animation.setTiming',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @event_class('Animation.animationCanceled')
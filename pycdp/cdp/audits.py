@@ -189,8 +189,8 @@ class CookieIssueDetails:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CookieIssueDetails:
         return cls(
-            cookie_warning_reasons=[CookieWarningReason.from_json(i) for i in json['cookieWarningReasons']],
-            cookie_exclusion_reasons=[CookieExclusionReason.from_json(i) for i in json['cookieExclusionReasons']],
+            cookie_warning_reasons=list(map(CookieWarningReason.from_json, json['cookieWarningReasons'])),
+            cookie_exclusion_reasons=list(map(CookieExclusionReason.from_json, json['cookieExclusionReasons'])),
             operation=CookieOperation.from_json(json['operation']),
             cookie=AffectedCookie.from_json(json['cookie']) if json.get('cookie', None) is not None else None,
             raw_cookie_line=str(json['rawCookieLine']) if json.get('rawCookieLine', None) is not None else None,
@@ -1277,18 +1277,18 @@ def get_encoded_response(
         1. **originalSize** - Size before re-encoding.
         2. **encodedSize** - Size after re-encoding.
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
-    params['encoding'] = encoding
+    params: T_JSON_DICT = {
+        'requestId': request_id.to_json(),
+        'encoding': encoding,
+    }
     if quality is not None:
         params['quality'] = quality
     if size_only is not None:
         params['sizeOnly'] = size_only
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Audits.getEncodedResponse',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         str(json['body']) if json.get('body', None) is not None else None,
         int(json['originalSize']),
@@ -1300,10 +1300,9 @@ def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Disables issues domain, prevents further issues from being reported to the client.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Audits.disable',
     }
-    json = yield cmd_dict
 
 
 def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1311,10 +1310,9 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     Enables issues domain, sends the issues collected so far to the client by means of the
     ``issueAdded`` event.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Audits.enable',
     }
-    json = yield cmd_dict
 
 
 def check_contrast(
@@ -1329,11 +1327,10 @@ def check_contrast(
     params: T_JSON_DICT = dict()
     if report_aaa is not None:
         params['reportAAA'] = report_aaa
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Audits.checkContrast',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def check_forms_issues() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[GenericIssueDetails]]:
@@ -1343,11 +1340,10 @@ def check_forms_issues() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List
 
     :returns: 
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Audits.checkFormsIssues',
     }
-    json = yield cmd_dict
-    return [GenericIssueDetails.from_json(i) for i in json['formIssues']]
+    return list(map(GenericIssueDetails.from_json, json['formIssues']))
 
 
 @event_class('Audits.issueAdded')
@@ -6,10 +6,9 @@
 # CDP domain: Autofill (experimental)
 
 from __future__ import annotations
-import enum
 import typing
 from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import T_JSON_DICT
 
 from . import dom
 from . import page
@@ -87,7 +86,7 @@ class Address:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Address:
         return cls(
-            fields=[AddressField.from_json(i) for i in json['fields']],
+            fields=list(map(AddressField.from_json, json['fields'])),
         )
 
 
@@ -104,16 +103,16 @@ def trigger(
     :param frame_id: *(Optional)* Identifies the frame that field belongs to.
     :param card: Credit card information to fill out the form. Credit card data is not saved.
     '''
-    params: T_JSON_DICT = dict()
-    params['fieldId'] = field_id.to_json()
+    params: T_JSON_DICT = {
+        'fieldId': field_id.to_json(),
+        'card': card.to_json(),
+    }
     if frame_id is not None:
         params['frameId'] = frame_id.to_json()
-    params['card'] = card.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Autofill.trigger',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_addresses(
@@ -124,10 +123,10 @@ def set_addresses(
 
     :param addresses:
     '''
-    params: T_JSON_DICT = dict()
-    params['addresses'] = [i.to_json() for i in addresses]
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'addresses': [i.to_json() for i in addresses],
+    }
+    yield {
         'method': 'Autofill.setAddresses',
         'params': params,
     }
-    json = yield cmd_dict
@@ -106,7 +106,7 @@ class BackgroundServiceEvent:
             service=ServiceName.from_json(json['service']),
             event_name=str(json['eventName']),
             instance_id=str(json['instanceId']),
-            event_metadata=[EventMetadata.from_json(i) for i in json['eventMetadata']],
+            event_metadata=list(map(EventMetadata.from_json, json['eventMetadata'])),
             storage_key=str(json['storageKey']),
         )
 
@@ -119,13 +119,13 @@ def start_observing(
 
     :param service:
     '''
-    params: T_JSON_DICT = dict()
-    params['service'] = service.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'service': service.to_json(),
+    }
+    yield {
         'method': 'BackgroundService.startObserving',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def stop_observing(
@@ -136,13 +136,13 @@ def stop_observing(
 
     :param service:
     '''
-    params: T_JSON_DICT = dict()
-    params['service'] = service.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'service': service.to_json(),
+    }
+    yield {
         'method': 'BackgroundService.stopObserving',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_recording(
@@ -155,14 +155,14 @@ def set_recording(
     :param should_record:
     :param service:
     '''
-    params: T_JSON_DICT = dict()
-    params['shouldRecord'] = should_record
-    params['service'] = service.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'shouldRecord': should_record,
+        'service': service.to_json(),
+    }
+    yield {
         'method': 'BackgroundService.setRecording',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def clear_events(
@@ -173,13 +173,13 @@ def clear_events(
 
     :param service:
     '''
-    params: T_JSON_DICT = dict()
-    params['service'] = service.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'service': service.to_json(),
+    }
+    yield {
         'method': 'BackgroundService.clearEvents',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @event_class('BackgroundService.recordingStateChanged')
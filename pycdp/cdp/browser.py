@@ -274,7 +274,7 @@ class Histogram:
             name=str(json['name']),
             sum_=int(json['sum']),
             count=int(json['count']),
-            buckets=[Bucket.from_json(i) for i in json['buckets']],
+            buckets=list(map(Bucket.from_json, json['buckets'])),
         )
 
 
@@ -294,18 +294,18 @@ def set_permission(
     :param origin: *(Optional)* Origin the permission applies to, all origins if not specified.
     :param browser_context_id: *(Optional)* Context to override. When omitted, default browser context is used.
     '''
-    params: T_JSON_DICT = dict()
-    params['permission'] = permission.to_json()
-    params['setting'] = setting.to_json()
+    params: T_JSON_DICT = {
+        'permission': permission.to_json(),
+        'setting': setting.to_json(),
+    }
     if origin is not None:
         params['origin'] = origin
     if browser_context_id is not None:
         params['browserContextId'] = browser_context_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Browser.setPermission',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def grant_permissions(
@@ -322,17 +322,17 @@ def grant_permissions(
     :param origin: *(Optional)* Origin the permission applies to, all origins if not specified.
     :param browser_context_id: *(Optional)* BrowserContext to override permissions. When omitted, default browser context is used.
     '''
-    params: T_JSON_DICT = dict()
-    params['permissions'] = [i.to_json() for i in permissions]
+    params: T_JSON_DICT = {
+        'permissions': [i.to_json() for i in permissions],
+    }
     if origin is not None:
         params['origin'] = origin
     if browser_context_id is not None:
         params['browserContextId'] = browser_context_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Browser.grantPermissions',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def reset_permissions(
@@ -348,11 +348,10 @@ def reset_permissions(
     params: T_JSON_DICT = dict()
     if browser_context_id is not None:
         params['browserContextId'] = browser_context_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Browser.resetPermissions',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_download_behavior(
@@ -371,19 +370,19 @@ def set_download_behavior(
     :param download_path: *(Optional)* The default path to save downloaded files to. This is required if behavior is set to 'allow' or 'allowAndName'.
     :param events_enabled: *(Optional)* Whether to emit download events (defaults to false).
     '''
-    params: T_JSON_DICT = dict()
-    params['behavior'] = behavior
+    params: T_JSON_DICT = {
+        'behavior': behavior,
+    }
     if browser_context_id is not None:
         params['browserContextId'] = browser_context_id.to_json()
     if download_path is not None:
         params['downloadPath'] = download_path
     if events_enabled is not None:
         params['eventsEnabled'] = events_enabled
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Browser.setDownloadBehavior',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def cancel_download(
@@ -398,25 +397,24 @@ def cancel_download(
     :param guid: Global unique identifier of the download.
     :param browser_context_id: *(Optional)* BrowserContext to perform the action in. When omitted, default browser context is used.
     '''
-    params: T_JSON_DICT = dict()
-    params['guid'] = guid
+    params: T_JSON_DICT = {
+        'guid': guid,
+    }
     if browser_context_id is not None:
         params['browserContextId'] = browser_context_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Browser.cancelDownload',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def close() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Close browser gracefully.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Browser.close',
     }
-    json = yield cmd_dict
 
 
 def crash() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -425,10 +423,9 @@ def crash() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Browser.crash',
     }
-    json = yield cmd_dict
 
 
 def crash_gpu_process() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -437,10 +434,9 @@ def crash_gpu_process() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Browser.crashGpuProcess',
     }
-    json = yield cmd_dict
 
 
 def get_version() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[str, str, str, str, str]]:
@@ -455,10 +451,9 @@ def get_version() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[str,
         3. **userAgent** - User-Agent.
         4. **jsVersion** - V8 version.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Browser.getVersion',
     }
-    json = yield cmd_dict
     return (
         str(json['protocolVersion']),
         str(json['product']),
@@ -477,10 +472,9 @@ def get_browser_command_line() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typin
 
     :returns: Commandline parameters
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Browser.getBrowserCommandLine',
     }
-    json = yield cmd_dict
     return [str(i) for i in json['arguments']]
 
 
@@ -502,12 +496,11 @@ def get_histograms(
         params['query'] = query
     if delta is not None:
         params['delta'] = delta
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Browser.getHistograms',
         'params': params,
     }
-    json = yield cmd_dict
-    return [Histogram.from_json(i) for i in json['histograms']]
+    return list(map(Histogram.from_json, json['histograms']))
 
 
 def get_histogram(
@@ -523,15 +516,15 @@ def get_histogram(
     :param delta: *(Optional)* If true, retrieve delta since last delta call.
     :returns: Histogram.
     '''
-    params: T_JSON_DICT = dict()
-    params['name'] = name
+    params: T_JSON_DICT = {
+        'name': name,
+    }
     if delta is not None:
         params['delta'] = delta
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Browser.getHistogram',
         'params': params,
     }
-    json = yield cmd_dict
     return Histogram.from_json(json['histogram'])
 
 
@@ -546,13 +539,13 @@ def get_window_bounds(
     :param window_id: Browser window id.
     :returns: Bounds information of the window. When window state is 'minimized', the restored window position and size are returned.
     '''
-    params: T_JSON_DICT = dict()
-    params['windowId'] = window_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'windowId': window_id.to_json(),
+    }
+    json = yield {
         'method': 'Browser.getWindowBounds',
         'params': params,
     }
-    json = yield cmd_dict
     return Bounds.from_json(json['bounds'])
 
 
@@ -573,11 +566,10 @@ def get_window_for_target(
     params: T_JSON_DICT = dict()
     if target_id is not None:
         params['targetId'] = target_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Browser.getWindowForTarget',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         WindowID.from_json(json['windowId']),
         Bounds.from_json(json['bounds'])
@@ -596,14 +588,14 @@ def set_window_bounds(
     :param window_id: Browser window id.
     :param bounds: New window bounds. The 'minimized', 'maximized' and 'fullscreen' states cannot be combined with 'left', 'top', 'width' or 'height'. Leaves unspecified fields unchanged.
     '''
-    params: T_JSON_DICT = dict()
-    params['windowId'] = window_id.to_json()
-    params['bounds'] = bounds.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'windowId': window_id.to_json(),
+        'bounds': bounds.to_json(),
+    }
+    yield {
         'method': 'Browser.setWindowBounds',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_dock_tile(
@@ -623,11 +615,10 @@ def set_dock_tile(
         params['badgeLabel'] = badge_label
     if image is not None:
         params['image'] = image
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Browser.setDockTile',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def execute_browser_command(
@@ -640,13 +631,13 @@ def execute_browser_command(
 
     :param command_id:
     '''
-    params: T_JSON_DICT = dict()
-    params['commandId'] = command_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'commandId': command_id.to_json(),
+    }
+    yield {
         'method': 'Browser.executeBrowserCommand',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def add_privacy_sandbox_enrollment_override(
@@ -658,13 +649,13 @@ def add_privacy_sandbox_enrollment_override(
 
     :param url:
     '''
-    params: T_JSON_DICT = dict()
-    params['url'] = url
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'url': url,
+    }
+    yield {
         'method': 'Browser.addPrivacySandboxEnrollmentOverride',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @event_class('Browser.downloadWillBegin')
@@ -9,7 +9,7 @@ from __future__ import annotations
 import enum
 import typing
 from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import T_JSON_DICT
 
 from . import storage
 
@@ -94,12 +94,12 @@ class DataEntry:
         return cls(
             request_url=str(json['requestURL']),
             request_method=str(json['requestMethod']),
-            request_headers=[Header.from_json(i) for i in json['requestHeaders']],
+            request_headers=list(map(Header.from_json, json['requestHeaders'])),
             response_time=float(json['responseTime']),
             response_status=int(json['responseStatus']),
             response_status_text=str(json['responseStatusText']),
             response_type=CachedResponseType.from_json(json['responseType']),
-            response_headers=[Header.from_json(i) for i in json['responseHeaders']],
+            response_headers=list(map(Header.from_json, json['responseHeaders'])),
         )
 
 
@@ -192,13 +192,13 @@ def delete_cache(
 
     :param cache_id: Id of cache for deletion.
     '''
-    params: T_JSON_DICT = dict()
-    params['cacheId'] = cache_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'cacheId': cache_id.to_json(),
+    }
+    yield {
         'method': 'CacheStorage.deleteCache',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def delete_entry(
@@ -211,14 +211,14 @@ def delete_entry(
     :param cache_id: Id of cache where the entry will be deleted.
     :param request: URL spec of the request.
     '''
-    params: T_JSON_DICT = dict()
-    params['cacheId'] = cache_id.to_json()
-    params['request'] = request
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'cacheId': cache_id.to_json(),
+        'request': request,
+    }
+    yield {
         'method': 'CacheStorage.deleteEntry',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def request_cache_names(
@@ -241,12 +241,11 @@ def request_cache_names(
         params['storageKey'] = storage_key
     if storage_bucket is not None:
         params['storageBucket'] = storage_bucket.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'CacheStorage.requestCacheNames',
         'params': params,
     }
-    json = yield cmd_dict
-    return [Cache.from_json(i) for i in json['caches']]
+    return list(map(Cache.from_json, json['caches']))
 
 
 def request_cached_response(
@@ -262,15 +261,15 @@ def request_cached_response(
     :param request_headers: headers of the request.
     :returns: Response read from the cache.
     '''
-    params: T_JSON_DICT = dict()
-    params['cacheId'] = cache_id.to_json()
-    params['requestURL'] = request_url
-    params['requestHeaders'] = [i.to_json() for i in request_headers]
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'cacheId': cache_id.to_json(),
+        'requestURL': request_url,
+        'requestHeaders': [i.to_json() for i in request_headers],
+    }
+    json = yield {
         'method': 'CacheStorage.requestCachedResponse',
         'params': params,
     }
-    json = yield cmd_dict
     return CachedResponse.from_json(json['response'])
 
 
@@ -292,20 +291,20 @@ def request_entries(
         0. **cacheDataEntries** - Array of object store data entries.
         1. **returnCount** - Count of returned entries from this storage. If pathFilter is empty, it is the count of all entries from this storage.
     '''
-    params: T_JSON_DICT = dict()
-    params['cacheId'] = cache_id.to_json()
+    params: T_JSON_DICT = {
+        'cacheId': cache_id.to_json(),
+    }
     if skip_count is not None:
         params['skipCount'] = skip_count
     if page_size is not None:
         params['pageSize'] = page_size
     if path_filter is not None:
         params['pathFilter'] = path_filter
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'CacheStorage.requestEntries',
         'params': params,
     }
-    json = yield cmd_dict
     return (
-        [DataEntry.from_json(i) for i in json['cacheDataEntries']],
+        list(map(DataEntry.from_json, json['cacheDataEntries'])),
         float(json['returnCount'])
     )
@@ -6,7 +6,6 @@
 # CDP domain: Cast (experimental)
 
 from __future__ import annotations
-import enum
 import typing
 from dataclasses import dataclass
 from .util import event_class, T_JSON_DICT
@@ -54,21 +53,19 @@ def enable(
     params: T_JSON_DICT = dict()
     if presentation_url is not None:
         params['presentationUrl'] = presentation_url
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Cast.enable',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Stops observing for sinks and issues.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Cast.disable',
     }
-    json = yield cmd_dict
 
 
 def set_sink_to_use(
@@ -80,13 +77,13 @@ def set_sink_to_use(
 
     :param sink_name:
     '''
-    params: T_JSON_DICT = dict()
-    params['sinkName'] = sink_name
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'sinkName': sink_name,
+    }
+    yield {
         'method': 'Cast.setSinkToUse',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def start_desktop_mirroring(
@@ -97,13 +94,13 @@ def start_desktop_mirroring(
 
     :param sink_name:
     '''
-    params: T_JSON_DICT = dict()
-    params['sinkName'] = sink_name
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'sinkName': sink_name,
+    }
+    yield {
         'method': 'Cast.startDesktopMirroring',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def start_tab_mirroring(
@@ -114,13 +111,13 @@ def start_tab_mirroring(
 
     :param sink_name:
     '''
-    params: T_JSON_DICT = dict()
-    params['sinkName'] = sink_name
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'sinkName': sink_name,
+    }
+    yield {
         'method': 'Cast.startTabMirroring',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def stop_casting(
@@ -131,13 +128,13 @@ def stop_casting(
 
     :param sink_name:
     '''
-    params: T_JSON_DICT = dict()
-    params['sinkName'] = sink_name
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'sinkName': sink_name,
+    }
+    yield {
         'method': 'Cast.stopCasting',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @event_class('Cast.sinksUpdated')
@@ -152,7 +149,7 @@ class SinksUpdated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SinksUpdated:
         return cls(
-            sinks=[Sink.from_json(i) for i in json['sinks']]
+            sinks=list(map(Sink.from_json, json['sinks']))
         )
 
 
@@ -6,7 +6,6 @@
 # CDP domain: Console
 
 from __future__ import annotations
-import enum
 import typing
 from dataclasses import dataclass
 from .util import event_class, T_JSON_DICT
@@ -64,20 +63,18 @@ def clear_messages() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Does nothing.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Console.clearMessages',
     }
-    json = yield cmd_dict
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Disables console domain, prevents further console messages from being reported to the client.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Console.disable',
     }
-    json = yield cmd_dict
 
 
 def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -85,10 +82,9 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     Enables console domain, sends the messages collected so far to the client by means of the
     ``messageAdded`` notification.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Console.enable',
     }
-    json = yield cmd_dict
 
 
 @event_class('Console.messageAdded')
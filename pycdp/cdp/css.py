@@ -72,7 +72,7 @@ class PseudoElementMatches:
     def from_json(cls, json: T_JSON_DICT) -> PseudoElementMatches:
         return cls(
             pseudo_type=dom.PseudoType.from_json(json['pseudoType']),
-            matches=[RuleMatch.from_json(i) for i in json['matches']],
+            matches=list(map(RuleMatch.from_json, json['matches'])),
             pseudo_identifier=str(json['pseudoIdentifier']) if json.get('pseudoIdentifier', None) is not None else None,
         )
 
@@ -98,7 +98,7 @@ class InheritedStyleEntry:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InheritedStyleEntry:
         return cls(
-            matched_css_rules=[RuleMatch.from_json(i) for i in json['matchedCSSRules']],
+            matched_css_rules=list(map(RuleMatch.from_json, json['matchedCSSRules'])),
             inline_style=CSSStyle.from_json(json['inlineStyle']) if json.get('inlineStyle', None) is not None else None,
         )
 
@@ -119,7 +119,7 @@ class InheritedPseudoElementMatches:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InheritedPseudoElementMatches:
         return cls(
-            pseudo_elements=[PseudoElementMatches.from_json(i) for i in json['pseudoElements']],
+            pseudo_elements=list(map(PseudoElementMatches.from_json, json['pseudoElements'])),
         )
 
 
@@ -232,7 +232,7 @@ class SelectorList:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SelectorList:
         return cls(
-            selectors=[Value.from_json(i) for i in json['selectors']],
+            selectors=list(map(Value.from_json, json['selectors'])),
             text=str(json['text']),
         )
 
@@ -428,12 +428,12 @@ class CSSRule:
             style=CSSStyle.from_json(json['style']),
             style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
             nesting_selectors=[str(i) for i in json['nestingSelectors']] if json.get('nestingSelectors', None) is not None else None,
-            media=[CSSMedia.from_json(i) for i in json['media']] if json.get('media', None) is not None else None,
-            container_queries=[CSSContainerQuery.from_json(i) for i in json['containerQueries']] if json.get('containerQueries', None) is not None else None,
-            supports=[CSSSupports.from_json(i) for i in json['supports']] if json.get('supports', None) is not None else None,
-            layers=[CSSLayer.from_json(i) for i in json['layers']] if json.get('layers', None) is not None else None,
-            scopes=[CSSScope.from_json(i) for i in json['scopes']] if json.get('scopes', None) is not None else None,
-            rule_types=[CSSRuleType.from_json(i) for i in json['ruleTypes']] if json.get('ruleTypes', None) is not None else None,
+            media=list(map(CSSMedia.from_json, json['media'])) if json.get('media', None) is not None else None,
+            container_queries=list(map(CSSContainerQuery.from_json, json['containerQueries'])) if json.get('containerQueries', None) is not None else None,
+            supports=list(map(CSSSupports.from_json, json['supports'])) if json.get('supports', None) is not None else None,
+            layers=list(map(CSSLayer.from_json, json['layers'])) if json.get('layers', None) is not None else None,
+            scopes=list(map(CSSScope.from_json, json['scopes'])) if json.get('scopes', None) is not None else None,
+            rule_types=list(map(CSSRuleType.from_json, json['ruleTypes'])) if json.get('ruleTypes', None) is not None else None,
         )
 
 
@@ -614,8 +614,8 @@ class CSSStyle:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSStyle:
         return cls(
-            css_properties=[CSSProperty.from_json(i) for i in json['cssProperties']],
-            shorthand_entries=[ShorthandEntry.from_json(i) for i in json['shorthandEntries']],
+            css_properties=list(map(CSSProperty.from_json, json['cssProperties'])),
+            shorthand_entries=list(map(ShorthandEntry.from_json, json['shorthandEntries'])),
             style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
             css_text=str(json['cssText']) if json.get('cssText', None) is not None else None,
             range_=SourceRange.from_json(json['range']) if json.get('range', None) is not None else None,
@@ -686,7 +686,7 @@ class CSSProperty:
             parsed_ok=bool(json['parsedOk']) if json.get('parsedOk', None) is not None else None,
             disabled=bool(json['disabled']) if json.get('disabled', None) is not None else None,
             range_=SourceRange.from_json(json['range']) if json.get('range', None) is not None else None,
-            longhand_properties=[CSSProperty.from_json(i) for i in json['longhandProperties']] if json.get('longhandProperties', None) is not None else None,
+            longhand_properties=list(map(CSSProperty.from_json, json['longhandProperties'])) if json.get('longhandProperties', None) is not None else None,
         )
 
 
@@ -739,7 +739,7 @@ class CSSMedia:
             source_url=str(json['sourceURL']) if json.get('sourceURL', None) is not None else None,
             range_=SourceRange.from_json(json['range']) if json.get('range', None) is not None else None,
             style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
-            media_list=[MediaQuery.from_json(i) for i in json['mediaList']] if json.get('mediaList', None) is not None else None,
+            media_list=list(map(MediaQuery.from_json, json['mediaList'])) if json.get('mediaList', None) is not None else None,
         )
 
 
@@ -763,7 +763,7 @@ class MediaQuery:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> MediaQuery:
         return cls(
-            expressions=[MediaQueryExpression.from_json(i) for i in json['expressions']],
+            expressions=list(map(MediaQueryExpression.from_json, json['expressions'])),
             active=bool(json['active']),
         )
 
@@ -993,7 +993,7 @@ class CSSLayerData:
         return cls(
             name=str(json['name']),
             order=float(json['order']),
-            sub_layers=[CSSLayerData.from_json(i) for i in json['subLayers']] if json.get('subLayers', None) is not None else None,
+            sub_layers=list(map(CSSLayerData.from_json, json['subLayers'])) if json.get('subLayers', None) is not None else None,
         )
 
 
@@ -1130,7 +1130,7 @@ class FontFace:
             unicode_range=str(json['unicodeRange']),
             src=str(json['src']),
             platform_font_family=str(json['platformFontFamily']),
-            font_variation_axes=[FontVariationAxis.from_json(i) for i in json['fontVariationAxes']] if json.get('fontVariationAxes', None) is not None else None,
+            font_variation_axes=list(map(FontVariationAxis.from_json, json['fontVariationAxes'])) if json.get('fontVariationAxes', None) is not None else None,
         )
 
 
@@ -1186,7 +1186,7 @@ class CSSPositionFallbackRule:
     def from_json(cls, json: T_JSON_DICT) -> CSSPositionFallbackRule:
         return cls(
             name=Value.from_json(json['name']),
-            try_rules=[CSSTryRule.from_json(i) for i in json['tryRules']],
+            try_rules=list(map(CSSTryRule.from_json, json['tryRules'])),
         )
 
 
@@ -1211,7 +1211,7 @@ class CSSKeyframesRule:
     def from_json(cls, json: T_JSON_DICT) -> CSSKeyframesRule:
         return cls(
             animation_name=Value.from_json(json['animationName']),
-            keyframes=[CSSKeyframeRule.from_json(i) for i in json['keyframes']],
+            keyframes=list(map(CSSKeyframeRule.from_json, json['keyframes'])),
         )
 
 
@@ -1296,15 +1296,15 @@ def add_rule(
     :param location: Text position of a new rule in the target style sheet.
     :returns: The newly created rule.
     '''
-    params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
-    params['ruleText'] = rule_text
-    params['location'] = location.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'styleSheetId': style_sheet_id.to_json(),
+        'ruleText': rule_text,
+        'location': location.to_json(),
+    }
+    json = yield {
         'method': 'CSS.addRule',
         'params': params,
     }
-    json = yield cmd_dict
     return CSSRule.from_json(json['rule'])
 
 
@@ -1317,13 +1317,13 @@ def collect_class_names(
     :param style_sheet_id:
     :returns: Class name list.
     '''
-    params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'styleSheetId': style_sheet_id.to_json(),
+    }
+    json = yield {
         'method': 'CSS.collectClassNames',
         'params': params,
     }
-    json = yield cmd_dict
     return [str(i) for i in json['classNames']]
 
 
@@ -1336,13 +1336,13 @@ def create_style_sheet(
     :param frame_id: Identifier of the frame where "via-inspector" stylesheet should be created.
     :returns: Identifier of the created "via-inspector" stylesheet.
     '''
-    params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'frameId': frame_id.to_json(),
+    }
+    json = yield {
         'method': 'CSS.createStyleSheet',
         'params': params,
     }
-    json = yield cmd_dict
     return StyleSheetId.from_json(json['styleSheetId'])
 
 
@@ -1350,10 +1350,9 @@ def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Disables the CSS agent for the given page.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'CSS.disable',
     }
-    json = yield cmd_dict
 
 
 def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1361,10 +1360,9 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     Enables the CSS agent for the given page. Clients should not assume that the CSS agent has been
     enabled until the result of this command is received.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'CSS.enable',
     }
-    json = yield cmd_dict
 
 
 def force_pseudo_state(
@@ -1378,14 +1376,14 @@ def force_pseudo_state(
     :param node_id: The element id for which to force the pseudo state.
     :param forced_pseudo_classes: Element pseudo classes to force when computing the element's style.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['forcedPseudoClasses'] = [i for i in forced_pseudo_classes]
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+        'forcedPseudoClasses': [i for i in forced_pseudo_classes],
+    }
+    yield {
         'method': 'CSS.forcePseudoState',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def get_background_colors(
@@ -1399,13 +1397,13 @@ def get_background_colors(
         1. **computedFontSize** - *(Optional)* The computed font size for this node, as a CSS computed value string (e.g. '12px').
         2. **computedFontWeight** - *(Optional)* The computed font weight for this node, as a CSS computed value string (e.g. 'normal' or '100').
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+    }
+    json = yield {
         'method': 'CSS.getBackgroundColors',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         [str(i) for i in json['backgroundColors']] if json.get('backgroundColors', None) is not None else None,
         str(json['computedFontSize']) if json.get('computedFontSize', None) is not None else None,
@@ -1422,14 +1420,14 @@ def get_computed_style_for_node(
     :param node_id:
     :returns: Computed style for the specified DOM node.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+    }
+    json = yield {
         'method': 'CSS.getComputedStyleForNode',
         'params': params,
     }
-    json = yield cmd_dict
-    return [CSSComputedStyleProperty.from_json(i) for i in json['computedStyle']]
+    return list(map(CSSComputedStyleProperty.from_json, json['computedStyle']))
 
 
 def get_inline_styles_for_node(
@@ -1445,13 +1443,13 @@ def get_inline_styles_for_node(
         0. **inlineStyle** - *(Optional)* Inline style for the specified DOM node.
         1. **attributesStyle** - *(Optional)* Attribute-defined element style (e.g. resulting from "width=20 height=100%").
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+    }
+    json = yield {
         'method': 'CSS.getInlineStylesForNode',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         CSSStyle.from_json(json['inlineStyle']) if json.get('inlineStyle', None) is not None else None,
         CSSStyle.from_json(json['attributesStyle']) if json.get('attributesStyle', None) is not None else None
@@ -1477,22 +1475,22 @@ def get_matched_styles_for_node(
         7. **cssPositionFallbackRules** - *(Optional)* A list of CSS position fallbacks matching this node.
         8. **parentLayoutNodeId** - *(Optional)* Id of the first parent element that does not have display: contents.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+    }
+    json = yield {
         'method': 'CSS.getMatchedStylesForNode',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         CSSStyle.from_json(json['inlineStyle']) if json.get('inlineStyle', None) is not None else None,
         CSSStyle.from_json(json['attributesStyle']) if json.get('attributesStyle', None) is not None else None,
-        [RuleMatch.from_json(i) for i in json['matchedCSSRules']] if json.get('matchedCSSRules', None) is not None else None,
-        [PseudoElementMatches.from_json(i) for i in json['pseudoElements']] if json.get('pseudoElements', None) is not None else None,
-        [InheritedStyleEntry.from_json(i) for i in json['inherited']] if json.get('inherited', None) is not None else None,
-        [InheritedPseudoElementMatches.from_json(i) for i in json['inheritedPseudoElements']] if json.get('inheritedPseudoElements', None) is not None else None,
-        [CSSKeyframesRule.from_json(i) for i in json['cssKeyframesRules']] if json.get('cssKeyframesRules', None) is not None else None,
-        [CSSPositionFallbackRule.from_json(i) for i in json['cssPositionFallbackRules']] if json.get('cssPositionFallbackRules', None) is not None else None,
+        list(map(RuleMatch.from_json, json['matchedCSSRules'])) if json.get('matchedCSSRules', None) is not None else None,
+        list(map(PseudoElementMatches.from_json, json['pseudoElements'])) if json.get('pseudoElements', None) is not None else None,
+        list(map(InheritedStyleEntry.from_json, json['inherited'])) if json.get('inherited', None) is not None else None,
+        list(map(InheritedPseudoElementMatches.from_json, json['inheritedPseudoElements'])) if json.get('inheritedPseudoElements', None) is not None else None,
+        list(map(CSSKeyframesRule.from_json, json['cssKeyframesRules'])) if json.get('cssKeyframesRules', None) is not None else None,
+        list(map(CSSPositionFallbackRule.from_json, json['cssPositionFallbackRules'])) if json.get('cssPositionFallbackRules', None) is not None else None,
         dom.NodeId.from_json(json['parentLayoutNodeId']) if json.get('parentLayoutNodeId', None) is not None else None
     )
 
@@ -1503,11 +1501,10 @@ def get_media_queries() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[
 
     :returns: 
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'CSS.getMediaQueries',
     }
-    json = yield cmd_dict
-    return [CSSMedia.from_json(i) for i in json['medias']]
+    return list(map(CSSMedia.from_json, json['medias']))
 
 
 def get_platform_fonts_for_node(
@@ -1520,14 +1517,14 @@ def get_platform_fonts_for_node(
     :param node_id:
     :returns: Usage statistics for every employed platform font.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+    }
+    json = yield {
         'method': 'CSS.getPlatformFontsForNode',
         'params': params,
     }
-    json = yield cmd_dict
-    return [PlatformFontUsage.from_json(i) for i in json['fonts']]
+    return list(map(PlatformFontUsage.from_json, json['fonts']))
 
 
 def get_style_sheet_text(
@@ -1539,13 +1536,13 @@ def get_style_sheet_text(
     :param style_sheet_id:
     :returns: The stylesheet text.
     '''
-    params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'styleSheetId': style_sheet_id.to_json(),
+    }
+    json = yield {
         'method': 'CSS.getStyleSheetText',
         'params': params,
     }
-    json = yield cmd_dict
     return str(json['text'])
 
 
@@ -1563,13 +1560,13 @@ def get_layers_for_node(
     :param node_id:
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+    }
+    json = yield {
         'method': 'CSS.getLayersForNode',
         'params': params,
     }
-    json = yield cmd_dict
     return CSSLayerData.from_json(json['rootLayer'])
 
 
@@ -1588,13 +1585,13 @@ def track_computed_style_updates(
 
     :param properties_to_track:
     '''
-    params: T_JSON_DICT = dict()
-    params['propertiesToTrack'] = [i.to_json() for i in properties_to_track]
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'propertiesToTrack': [i.to_json() for i in properties_to_track],
+    }
+    yield {
         'method': 'CSS.trackComputedStyleUpdates',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def take_computed_style_updates() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[dom.NodeId]]:
@@ -1605,11 +1602,10 @@ def take_computed_style_updates() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,ty
 
     :returns: The list of node Ids that have their tracked computed styles updated.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'CSS.takeComputedStyleUpdates',
     }
-    json = yield cmd_dict
-    return [dom.NodeId.from_json(i) for i in json['nodeIds']]
+    return list(map(dom.NodeId.from_json, json['nodeIds']))
 
 
 def set_effective_property_value_for_node(
@@ -1625,15 +1621,15 @@ def set_effective_property_value_for_node(
     :param property_name:
     :param value:
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['propertyName'] = property_name
-    params['value'] = value
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+        'propertyName': property_name,
+        'value': value,
+    }
+    yield {
         'method': 'CSS.setEffectivePropertyValueForNode',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_keyframe_key(
@@ -1649,15 +1645,15 @@ def set_keyframe_key(
     :param key_text:
     :returns: The resulting key text after modification.
     '''
-    params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
-    params['range'] = range_.to_json()
-    params['keyText'] = key_text
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'styleSheetId': style_sheet_id.to_json(),
+        'range': range_.to_json(),
+        'keyText': key_text,
+    }
+    json = yield {
         'method': 'CSS.setKeyframeKey',
         'params': params,
     }
-    json = yield cmd_dict
     return Value.from_json(json['keyText'])
 
 
@@ -1674,15 +1670,15 @@ def set_media_text(
     :param text:
     :returns: The resulting CSS media rule after modification.
     '''
-    params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
-    params['range'] = range_.to_json()
-    params['text'] = text
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'styleSheetId': style_sheet_id.to_json(),
+        'range': range_.to_json(),
+        'text': text,
+    }
+    json = yield {
         'method': 'CSS.setMediaText',
         'params': params,
     }
-    json = yield cmd_dict
     return CSSMedia.from_json(json['media'])
 
 
@@ -1701,15 +1697,15 @@ def set_container_query_text(
     :param text:
     :returns: The resulting CSS container query rule after modification.
     '''
-    params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
-    params['range'] = range_.to_json()
-    params['text'] = text
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'styleSheetId': style_sheet_id.to_json(),
+        'range': range_.to_json(),
+        'text': text,
+    }
+    json = yield {
         'method': 'CSS.setContainerQueryText',
         'params': params,
     }
-    json = yield cmd_dict
     return CSSContainerQuery.from_json(json['containerQuery'])
 
 
@@ -1728,15 +1724,15 @@ def set_supports_text(
     :param text:
     :returns: The resulting CSS Supports rule after modification.
     '''
-    params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
-    params['range'] = range_.to_json()
-    params['text'] = text
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'styleSheetId': style_sheet_id.to_json(),
+        'range': range_.to_json(),
+        'text': text,
+    }
+    json = yield {
         'method': 'CSS.setSupportsText',
         'params': params,
     }
-    json = yield cmd_dict
     return CSSSupports.from_json(json['supports'])
 
 
@@ -1755,15 +1751,15 @@ def set_scope_text(
     :param text:
     :returns: The resulting CSS Scope rule after modification.
     '''
-    params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
-    params['range'] = range_.to_json()
-    params['text'] = text
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'styleSheetId': style_sheet_id.to_json(),
+        'range': range_.to_json(),
+        'text': text,
+    }
+    json = yield {
         'method': 'CSS.setScopeText',
         'params': params,
     }
-    json = yield cmd_dict
     return CSSScope.from_json(json['scope'])
 
 
@@ -1780,15 +1776,15 @@ def set_rule_selector(
     :param selector:
     :returns: The resulting selector list after modification.
     '''
-    params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
-    params['range'] = range_.to_json()
-    params['selector'] = selector
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'styleSheetId': style_sheet_id.to_json(),
+        'range': range_.to_json(),
+        'selector': selector,
+    }
+    json = yield {
         'method': 'CSS.setRuleSelector',
         'params': params,
     }
-    json = yield cmd_dict
     return SelectorList.from_json(json['selectorList'])
 
 
@@ -1803,14 +1799,14 @@ def set_style_sheet_text(
     :param text:
     :returns: *(Optional)* URL of source map associated with script (if any).
     '''
-    params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
-    params['text'] = text
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'styleSheetId': style_sheet_id.to_json(),
+        'text': text,
+    }
+    json = yield {
         'method': 'CSS.setStyleSheetText',
         'params': params,
     }
-    json = yield cmd_dict
     return str(json['sourceMapURL']) if json.get('sourceMapURL', None) is not None else None
 
 
@@ -1823,24 +1819,23 @@ def set_style_texts(
     :param edits:
     :returns: The resulting styles after modification.
     '''
-    params: T_JSON_DICT = dict()
-    params['edits'] = [i.to_json() for i in edits]
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'edits': [i.to_json() for i in edits],
+    }
+    json = yield {
         'method': 'CSS.setStyleTexts',
         'params': params,
     }
-    json = yield cmd_dict
-    return [CSSStyle.from_json(i) for i in json['styles']]
+    return list(map(CSSStyle.from_json, json['styles']))
 
 
 def start_rule_usage_tracking() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Enables the selector recording.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'CSS.startRuleUsageTracking',
     }
-    json = yield cmd_dict
 
 
 def stop_rule_usage_tracking() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[RuleUsage]]:
@@ -1850,11 +1845,10 @@ def stop_rule_usage_tracking() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typin
 
     :returns: 
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'CSS.stopRuleUsageTracking',
     }
-    json = yield cmd_dict
-    return [RuleUsage.from_json(i) for i in json['ruleUsage']]
+    return list(map(RuleUsage.from_json, json['ruleUsage']))
 
 
 def take_coverage_delta() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.List[RuleUsage], float]]:
@@ -1867,12 +1861,11 @@ def take_coverage_delta() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tup
         0. **coverage** - 
         1. **timestamp** - Monotonically increasing time, in seconds.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'CSS.takeCoverageDelta',
     }
-    json = yield cmd_dict
     return (
-        [RuleUsage.from_json(i) for i in json['coverage']],
+        list(map(RuleUsage.from_json, json['coverage'])),
         float(json['timestamp'])
     )
 
@@ -1887,13 +1880,13 @@ def set_local_fonts_enabled(
 
     :param enabled: Whether rendering of local fonts is enabled.
     '''
-    params: T_JSON_DICT = dict()
-    params['enabled'] = enabled
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'enabled': enabled,
+    }
+    yield {
         'method': 'CSS.setLocalFontsEnabled',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @event_class('CSS.fontsUpdated')
@@ -6,7 +6,6 @@
 # CDP domain: Database (experimental)
 
 from __future__ import annotations
-import enum
 import typing
 from dataclasses import dataclass
 from .util import event_class, T_JSON_DICT
@@ -91,20 +90,18 @@ def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Disables database tracking, prevents database events from being sent to the client.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Database.disable',
     }
-    json = yield cmd_dict
 
 
 def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Enables database tracking, database events will now be delivered to the client.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Database.enable',
     }
-    json = yield cmd_dict
 
 
 def execute_sql(
@@ -120,14 +117,14 @@ def execute_sql(
         1. **values** - 
         2. **sqlError** - 
     '''
-    params: T_JSON_DICT = dict()
-    params['databaseId'] = database_id.to_json()
-    params['query'] = query
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'databaseId': database_id.to_json(),
+        'query': query,
+    }
+    json = yield {
         'method': 'Database.executeSQL',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         [str(i) for i in json['columnNames']] if json.get('columnNames', None) is not None else None,
         [i for i in json['values']] if json.get('values', None) is not None else None,
@@ -142,13 +139,13 @@ def get_database_table_names(
     :param database_id:
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['databaseId'] = database_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'databaseId': database_id.to_json(),
+    }
+    json = yield {
         'method': 'Database.getDatabaseTableNames',
         'params': params,
     }
-    json = yield cmd_dict
     return [str(i) for i in json['tableNames']]
 
 
@@ -186,7 +186,7 @@ class CallFrame:
             function_name=str(json['functionName']),
             location=Location.from_json(json['location']),
             url=str(json['url']),
-            scope_chain=[Scope.from_json(i) for i in json['scopeChain']],
+            scope_chain=list(map(Scope.from_json, json['scopeChain'])),
             this=runtime.RemoteObject.from_json(json['this']),
             function_location=Location.from_json(json['functionLocation']) if json.get('functionLocation', None) is not None else None,
             return_value=runtime.RemoteObject.from_json(json['returnValue']) if json.get('returnValue', None) is not None else None,
@@ -369,25 +369,24 @@ def continue_to_location(
     :param location: Location to continue to.
     :param target_call_frames: *(Optional)*
     '''
-    params: T_JSON_DICT = dict()
-    params['location'] = location.to_json()
+    params: T_JSON_DICT = {
+        'location': location.to_json(),
+    }
     if target_call_frames is not None:
         params['targetCallFrames'] = target_call_frames
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Debugger.continueToLocation',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Disables debugger for given page.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Debugger.disable',
     }
-    json = yield cmd_dict
 
 
 def enable(
@@ -403,11 +402,10 @@ def enable(
     params: T_JSON_DICT = dict()
     if max_scripts_cache_size is not None:
         params['maxScriptsCacheSize'] = max_scripts_cache_size
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Debugger.enable',
         'params': params,
     }
-    json = yield cmd_dict
     return runtime.UniqueDebuggerId.from_json(json['debuggerId'])
 
 
@@ -439,9 +437,10 @@ def evaluate_on_call_frame(
         0. **result** - Object wrapper for the evaluation result.
         1. **exceptionDetails** - *(Optional)* Exception details.
     '''
-    params: T_JSON_DICT = dict()
-    params['callFrameId'] = call_frame_id.to_json()
-    params['expression'] = expression
+    params: T_JSON_DICT = {
+        'callFrameId': call_frame_id.to_json(),
+        'expression': expression,
+    }
     if object_group is not None:
         params['objectGroup'] = object_group
     if include_command_line_api is not None:
@@ -456,11 +455,10 @@ def evaluate_on_call_frame(
         params['throwOnSideEffect'] = throw_on_side_effect
     if timeout is not None:
         params['timeout'] = timeout.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Debugger.evaluateOnCallFrame',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         runtime.RemoteObject.from_json(json['result']),
         runtime.ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
@@ -481,18 +479,18 @@ def get_possible_breakpoints(
     :param restrict_to_function: *(Optional)* Only consider locations which are in the same (non-nested) function as start.
     :returns: List of the possible breakpoint locations.
     '''
-    params: T_JSON_DICT = dict()
-    params['start'] = start.to_json()
+    params: T_JSON_DICT = {
+        'start': start.to_json(),
+    }
     if end is not None:
         params['end'] = end.to_json()
     if restrict_to_function is not None:
         params['restrictToFunction'] = restrict_to_function
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Debugger.getPossibleBreakpoints',
         'params': params,
     }
-    json = yield cmd_dict
-    return [BreakLocation.from_json(i) for i in json['locations']]
+    return list(map(BreakLocation.from_json, json['locations']))
 
 
 def get_script_source(
@@ -507,13 +505,13 @@ def get_script_source(
         0. **scriptSource** - Script source (empty in case of Wasm bytecode).
         1. **bytecode** - *(Optional)* Wasm bytecode. (Encoded as a base64 string when passed over JSON)
     '''
-    params: T_JSON_DICT = dict()
-    params['scriptId'] = script_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'scriptId': script_id.to_json(),
+    }
+    json = yield {
         'method': 'Debugger.getScriptSource',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         str(json['scriptSource']),
         str(json['bytecode']) if json.get('bytecode', None) is not None else None
@@ -536,13 +534,13 @@ def disassemble_wasm_module(
         2. **functionBodyOffsets** - The offsets of all function bodies, in the format [start1, end1, start2, end2, ...] where all ends are exclusive.
         3. **chunk** - The first chunk of disassembly.
     '''
-    params: T_JSON_DICT = dict()
-    params['scriptId'] = script_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'scriptId': script_id.to_json(),
+    }
+    json = yield {
         'method': 'Debugger.disassembleWasmModule',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         str(json['streamId']) if json.get('streamId', None) is not None else None,
         int(json['totalNumberOfLines']),
@@ -565,13 +563,13 @@ def next_wasm_disassembly_chunk(
     :param stream_id:
     :returns: The next chunk of disassembly.
     '''
-    params: T_JSON_DICT = dict()
-    params['streamId'] = stream_id
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'streamId': stream_id,
+    }
+    json = yield {
         'method': 'Debugger.nextWasmDisassemblyChunk',
         'params': params,
     }
-    json = yield cmd_dict
     return WasmDisassemblyChunk.from_json(json['chunk'])
 
 
@@ -587,13 +585,13 @@ def get_wasm_bytecode(
     :param script_id: Id of the Wasm script to get source for.
     :returns: Script source. (Encoded as a base64 string when passed over JSON)
     '''
-    params: T_JSON_DICT = dict()
-    params['scriptId'] = script_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'scriptId': script_id.to_json(),
+    }
+    json = yield {
         'method': 'Debugger.getWasmBytecode',
         'params': params,
     }
-    json = yield cmd_dict
     return str(json['bytecode'])
 
 
@@ -608,13 +606,13 @@ def get_stack_trace(
     :param stack_trace_id:
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['stackTraceId'] = stack_trace_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'stackTraceId': stack_trace_id.to_json(),
+    }
+    json = yield {
         'method': 'Debugger.getStackTrace',
         'params': params,
     }
-    json = yield cmd_dict
     return runtime.StackTrace.from_json(json['stackTrace'])
 
 
@@ -622,10 +620,9 @@ def pause() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Stops on the next JavaScript statement.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Debugger.pause',
     }
-    json = yield cmd_dict
 
 
 @deprecated(version="1.3")
@@ -641,13 +638,13 @@ def pause_on_async_call(
 
     :param parent_stack_trace_id: Debugger will pause when async call with given stack trace is started.
     '''
-    params: T_JSON_DICT = dict()
-    params['parentStackTraceId'] = parent_stack_trace_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'parentStackTraceId': parent_stack_trace_id.to_json(),
+    }
+    yield {
         'method': 'Debugger.pauseOnAsyncCall',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def remove_breakpoint(
@@ -658,13 +655,13 @@ def remove_breakpoint(
 
     :param breakpoint_id:
     '''
-    params: T_JSON_DICT = dict()
-    params['breakpointId'] = breakpoint_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'breakpointId': breakpoint_id.to_json(),
+    }
+    yield {
         'method': 'Debugger.removeBreakpoint',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def restart_frame(
@@ -694,17 +691,17 @@ def restart_frame(
         1. **asyncStackTrace** - *(Optional)* Async stack trace, if any.
         2. **asyncStackTraceId** - *(Optional)* Async stack trace, if any.
     '''
-    params: T_JSON_DICT = dict()
-    params['callFrameId'] = call_frame_id.to_json()
+    params: T_JSON_DICT = {
+        'callFrameId': call_frame_id.to_json(),
+    }
     if mode is not None:
         params['mode'] = mode
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Debugger.restartFrame',
         'params': params,
     }
-    json = yield cmd_dict
     return (
-        [CallFrame.from_json(i) for i in json['callFrames']],
+        list(map(CallFrame.from_json, json['callFrames'])),
         runtime.StackTrace.from_json(json['asyncStackTrace']) if json.get('asyncStackTrace', None) is not None else None,
         runtime.StackTraceId.from_json(json['asyncStackTraceId']) if json.get('asyncStackTraceId', None) is not None else None
     )
@@ -721,11 +718,10 @@ def resume(
     params: T_JSON_DICT = dict()
     if terminate_on_resume is not None:
         params['terminateOnResume'] = terminate_on_resume
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Debugger.resume',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def search_in_content(
@@ -743,19 +739,19 @@ def search_in_content(
     :param is_regex: *(Optional)* If true, treats string parameter as regex.
     :returns: List of search matches.
     '''
-    params: T_JSON_DICT = dict()
-    params['scriptId'] = script_id.to_json()
-    params['query'] = query
+    params: T_JSON_DICT = {
+        'scriptId': script_id.to_json(),
+        'query': query,
+    }
     if case_sensitive is not None:
         params['caseSensitive'] = case_sensitive
     if is_regex is not None:
         params['isRegex'] = is_regex
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Debugger.searchInContent',
         'params': params,
     }
-    json = yield cmd_dict
-    return [SearchMatch.from_json(i) for i in json['result']]
+    return list(map(SearchMatch.from_json, json['result']))
 
 
 def set_async_call_stack_depth(
@@ -766,13 +762,13 @@ def set_async_call_stack_depth(
 
     :param max_depth: Maximum depth of async call stacks. Setting to ```0``` will effectively disable collecting async call stacks (default).
     '''
-    params: T_JSON_DICT = dict()
-    params['maxDepth'] = max_depth
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'maxDepth': max_depth,
+    }
+    yield {
         'method': 'Debugger.setAsyncCallStackDepth',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_blackbox_patterns(
@@ -787,13 +783,13 @@ def set_blackbox_patterns(
 
     :param patterns: Array of regexps that will be used to check script url for blackbox state.
     '''
-    params: T_JSON_DICT = dict()
-    params['patterns'] = [i for i in patterns]
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'patterns': [i for i in patterns],
+    }
+    yield {
         'method': 'Debugger.setBlackboxPatterns',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_blackboxed_ranges(
@@ -811,14 +807,14 @@ def set_blackboxed_ranges(
     :param script_id: Id of the script.
     :param positions:
     '''
-    params: T_JSON_DICT = dict()
-    params['scriptId'] = script_id.to_json()
-    params['positions'] = [i.to_json() for i in positions]
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'scriptId': script_id.to_json(),
+        'positions': [i.to_json() for i in positions],
+    }
+    yield {
         'method': 'Debugger.setBlackboxedRanges',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_breakpoint(
@@ -835,15 +831,15 @@ def set_breakpoint(
         0. **breakpointId** - Id of the created breakpoint for further reference.
         1. **actualLocation** - Location this breakpoint resolved into.
     '''
-    params: T_JSON_DICT = dict()
-    params['location'] = location.to_json()
+    params: T_JSON_DICT = {
+        'location': location.to_json(),
+    }
     if condition is not None:
         params['condition'] = condition
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Debugger.setBreakpoint',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         BreakpointId.from_json(json['breakpointId']),
         Location.from_json(json['actualLocation'])
@@ -859,13 +855,13 @@ def set_instrumentation_breakpoint(
     :param instrumentation: Instrumentation name.
     :returns: Id of the created breakpoint for further reference.
     '''
-    params: T_JSON_DICT = dict()
-    params['instrumentation'] = instrumentation
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'instrumentation': instrumentation,
+    }
+    json = yield {
         'method': 'Debugger.setInstrumentationBreakpoint',
         'params': params,
     }
-    json = yield cmd_dict
     return BreakpointId.from_json(json['breakpointId'])
 
 
@@ -894,8 +890,9 @@ def set_breakpoint_by_url(
         0. **breakpointId** - Id of the created breakpoint for further reference.
         1. **locations** - List of the locations this breakpoint resolved into upon addition.
     '''
-    params: T_JSON_DICT = dict()
-    params['lineNumber'] = line_number
+    params: T_JSON_DICT = {
+        'lineNumber': line_number,
+    }
     if url is not None:
         params['url'] = url
     if url_regex is not None:
@@ -906,14 +903,13 @@ def set_breakpoint_by_url(
         params['columnNumber'] = column_number
     if condition is not None:
         params['condition'] = condition
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Debugger.setBreakpointByUrl',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         BreakpointId.from_json(json['breakpointId']),
-        [Location.from_json(i) for i in json['locations']]
+        list(map(Location.from_json, json['locations']))
     )
 
 
@@ -932,15 +928,15 @@ def set_breakpoint_on_function_call(
     :param condition: *(Optional)* Expression to use as a breakpoint condition. When specified, debugger will stop on the breakpoint if this expression evaluates to true.
     :returns: Id of the created breakpoint for further reference.
     '''
-    params: T_JSON_DICT = dict()
-    params['objectId'] = object_id.to_json()
+    params: T_JSON_DICT = {
+        'objectId': object_id.to_json(),
+    }
     if condition is not None:
         params['condition'] = condition
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Debugger.setBreakpointOnFunctionCall',
         'params': params,
     }
-    json = yield cmd_dict
     return BreakpointId.from_json(json['breakpointId'])
 
 
@@ -952,13 +948,13 @@ def set_breakpoints_active(
 
     :param active: New value for breakpoints active state.
     '''
-    params: T_JSON_DICT = dict()
-    params['active'] = active
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'active': active,
+    }
+    yield {
         'method': 'Debugger.setBreakpointsActive',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_pause_on_exceptions(
@@ -970,13 +966,13 @@ def set_pause_on_exceptions(
 
     :param state: Pause on exceptions mode.
     '''
-    params: T_JSON_DICT = dict()
-    params['state'] = state
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'state': state,
+    }
+    yield {
         'method': 'Debugger.setPauseOnExceptions',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_return_value(
@@ -989,13 +985,13 @@ def set_return_value(
 
     :param new_value: New return value.
     '''
-    params: T_JSON_DICT = dict()
-    params['newValue'] = new_value.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'newValue': new_value.to_json(),
+    }
+    yield {
         'method': 'Debugger.setReturnValue',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_script_source(
@@ -1026,20 +1022,20 @@ def set_script_source(
         4. **status** - Whether the operation was successful or not. Only `` Ok`` denotes a successful live edit while the other enum variants denote why the live edit failed.
         5. **exceptionDetails** - *(Optional)* Exception details if any. Only present when `` status`` is `` CompileError`.
     '''
-    params: T_JSON_DICT = dict()
-    params['scriptId'] = script_id.to_json()
-    params['scriptSource'] = script_source
+    params: T_JSON_DICT = {
+        'scriptId': script_id.to_json(),
+        'scriptSource': script_source,
+    }
     if dry_run is not None:
         params['dryRun'] = dry_run
     if allow_top_frame_editing is not None:
         params['allowTopFrameEditing'] = allow_top_frame_editing
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Debugger.setScriptSource',
         'params': params,
     }
-    json = yield cmd_dict
     return (
-        [CallFrame.from_json(i) for i in json['callFrames']] if json.get('callFrames', None) is not None else None,
+        list(map(CallFrame.from_json, json['callFrames'])) if json.get('callFrames', None) is not None else None,
         bool(json['stackChanged']) if json.get('stackChanged', None) is not None else None,
         runtime.StackTrace.from_json(json['asyncStackTrace']) if json.get('asyncStackTrace', None) is not None else None,
         runtime.StackTraceId.from_json(json['asyncStackTraceId']) if json.get('asyncStackTraceId', None) is not None else None,
@@ -1056,13 +1052,13 @@ def set_skip_all_pauses(
 
     :param skip: New value for skip pauses state.
     '''
-    params: T_JSON_DICT = dict()
-    params['skip'] = skip
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'skip': skip,
+    }
+    yield {
         'method': 'Debugger.setSkipAllPauses',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_variable_value(
@@ -1080,16 +1076,16 @@ def set_variable_value(
     :param new_value: New variable value.
     :param call_frame_id: Id of callframe that holds variable.
     '''
-    params: T_JSON_DICT = dict()
-    params['scopeNumber'] = scope_number
-    params['variableName'] = variable_name
-    params['newValue'] = new_value.to_json()
-    params['callFrameId'] = call_frame_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'scopeNumber': scope_number,
+        'variableName': variable_name,
+        'newValue': new_value.to_json(),
+        'callFrameId': call_frame_id.to_json(),
+    }
+    yield {
         'method': 'Debugger.setVariableValue',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def step_into(
@@ -1107,21 +1103,19 @@ def step_into(
         params['breakOnAsyncCall'] = break_on_async_call
     if skip_list is not None:
         params['skipList'] = [i.to_json() for i in skip_list]
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Debugger.stepInto',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def step_out() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Steps out of the function call.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Debugger.stepOut',
     }
-    json = yield cmd_dict
 
 
 def step_over(
@@ -1135,11 +1129,10 @@ def step_over(
     params: T_JSON_DICT = dict()
     if skip_list is not None:
         params['skipList'] = [i.to_json() for i in skip_list]
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Debugger.stepOver',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @event_class('Debugger.breakpointResolved')
@@ -1185,7 +1178,7 @@ class Paused:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Paused:
         return cls(
-            call_frames=[CallFrame.from_json(i) for i in json['callFrames']],
+            call_frames=list(map(CallFrame.from_json, json['callFrames'])),
             reason=str(json['reason']),
             data=dict(json['data']) if json.get('data', None) is not None else None,
             hit_breakpoints=[str(i) for i in json['hitBreakpoints']] if json.get('hitBreakpoints', None) is not None else None,
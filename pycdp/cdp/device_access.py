@@ -6,7 +6,6 @@
 # CDP domain: DeviceAccess (experimental)
 
 from __future__ import annotations
-import enum
 import typing
 from dataclasses import dataclass
 from .util import event_class, T_JSON_DICT
@@ -70,20 +69,18 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Enable events in this domain.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'DeviceAccess.enable',
     }
-    json = yield cmd_dict
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Disable events in this domain.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'DeviceAccess.disable',
     }
-    json = yield cmd_dict
 
 
 def select_prompt(
@@ -96,14 +93,14 @@ def select_prompt(
     :param id_:
     :param device_id:
     '''
-    params: T_JSON_DICT = dict()
-    params['id'] = id_.to_json()
-    params['deviceId'] = device_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'id': id_.to_json(),
+        'deviceId': device_id.to_json(),
+    }
+    yield {
         'method': 'DeviceAccess.selectPrompt',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def cancel_prompt(
@@ -114,13 +111,13 @@ def cancel_prompt(
 
     :param id_:
     '''
-    params: T_JSON_DICT = dict()
-    params['id'] = id_.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'id': id_.to_json(),
+    }
+    yield {
         'method': 'DeviceAccess.cancelPrompt',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @event_class('DeviceAccess.deviceRequestPrompted')
@@ -137,5 +134,5 @@ class DeviceRequestPrompted:
     def from_json(cls, json: T_JSON_DICT) -> DeviceRequestPrompted:
         return cls(
             id_=RequestId.from_json(json['id']),
-            devices=[PromptDevice.from_json(i) for i in json['devices']]
+            devices=list(map(PromptDevice.from_json, json['devices']))
         )
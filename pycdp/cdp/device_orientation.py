@@ -6,20 +6,17 @@
 # CDP domain: DeviceOrientation (experimental)
 
 from __future__ import annotations
-import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import T_JSON_DICT
 
 
 def clear_device_orientation_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Clears the overridden Device Orientation.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'DeviceOrientation.clearDeviceOrientationOverride',
     }
-    json = yield cmd_dict
 
 
 def set_device_orientation_override(
@@ -34,12 +31,12 @@ def set_device_orientation_override(
     :param beta: Mock beta
     :param gamma: Mock gamma
     '''
-    params: T_JSON_DICT = dict()
-    params['alpha'] = alpha
-    params['beta'] = beta
-    params['gamma'] = gamma
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'alpha': alpha,
+        'beta': beta,
+        'gamma': gamma,
+    }
+    yield {
         'method': 'DeviceOrientation.setDeviceOrientationOverride',
         'params': params,
     }
-    json = yield cmd_dict
@@ -351,7 +351,7 @@ class Node:
             node_value=str(json['nodeValue']),
             parent_id=NodeId.from_json(json['parentId']) if json.get('parentId', None) is not None else None,
             child_node_count=int(json['childNodeCount']) if json.get('childNodeCount', None) is not None else None,
-            children=[Node.from_json(i) for i in json['children']] if json.get('children', None) is not None else None,
+            children=list(map(Node.from_json, json['children'])) if json.get('children', None) is not None else None,
             attributes=[str(i) for i in json['attributes']] if json.get('attributes', None) is not None else None,
             document_url=str(json['documentURL']) if json.get('documentURL', None) is not None else None,
             base_url=str(json['baseURL']) if json.get('baseURL', None) is not None else None,
@@ -366,11 +366,11 @@ class Node:
             shadow_root_type=ShadowRootType.from_json(json['shadowRootType']) if json.get('shadowRootType', None) is not None else None,
             frame_id=page.FrameId.from_json(json['frameId']) if json.get('frameId', None) is not None else None,
             content_document=Node.from_json(json['contentDocument']) if json.get('contentDocument', None) is not None else None,
-            shadow_roots=[Node.from_json(i) for i in json['shadowRoots']] if json.get('shadowRoots', None) is not None else None,
+            shadow_roots=list(map(Node.from_json, json['shadowRoots'])) if json.get('shadowRoots', None) is not None else None,
             template_content=Node.from_json(json['templateContent']) if json.get('templateContent', None) is not None else None,
-            pseudo_elements=[Node.from_json(i) for i in json['pseudoElements']] if json.get('pseudoElements', None) is not None else None,
+            pseudo_elements=list(map(Node.from_json, json['pseudoElements'])) if json.get('pseudoElements', None) is not None else None,
             imported_document=Node.from_json(json['importedDocument']) if json.get('importedDocument', None) is not None else None,
-            distributed_nodes=[BackendNode.from_json(i) for i in json['distributedNodes']] if json.get('distributedNodes', None) is not None else None,
+            distributed_nodes=list(map(BackendNode.from_json, json['distributedNodes'])) if json.get('distributedNodes', None) is not None else None,
             is_svg=bool(json['isSVG']) if json.get('isSVG', None) is not None else None,
             compatibility_mode=CompatibilityMode.from_json(json['compatibilityMode']) if json.get('compatibilityMode', None) is not None else None,
             assigned_slot=BackendNode.from_json(json['assignedSlot']) if json.get('assignedSlot', None) is not None else None,
@@ -577,13 +577,13 @@ def collect_class_names_from_subtree(
     :param node_id: Id of the node to collect class names.
     :returns: Class name list.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+    }
+    json = yield {
         'method': 'DOM.collectClassNamesFromSubtree',
         'params': params,
     }
-    json = yield cmd_dict
     return [str(i) for i in json['classNames']]
 
 
@@ -603,16 +603,16 @@ def copy_to(
     :param insert_before_node_id: *(Optional)* Drop the copy before this node (if absent, the copy becomes the last child of ```targetNodeId```).
     :returns: Id of the node clone.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['targetNodeId'] = target_node_id.to_json()
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+        'targetNodeId': target_node_id.to_json(),
+    }
     if insert_before_node_id is not None:
         params['insertBeforeNodeId'] = insert_before_node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'DOM.copyTo',
         'params': params,
     }
-    json = yield cmd_dict
     return NodeId.from_json(json['nodeId'])
 
 
@@ -645,11 +645,10 @@ def describe_node(
         params['depth'] = depth
     if pierce is not None:
         params['pierce'] = pierce
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'DOM.describeNode',
         'params': params,
     }
-    json = yield cmd_dict
     return Node.from_json(json['node'])
 
 
@@ -680,21 +679,19 @@ def scroll_into_view_if_needed(
         params['objectId'] = object_id.to_json()
     if rect is not None:
         params['rect'] = rect.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'DOM.scrollIntoViewIfNeeded',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Disables DOM agent for the given page.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'DOM.disable',
     }
-    json = yield cmd_dict
 
 
 def discard_search_results(
@@ -708,13 +705,13 @@ def discard_search_results(
 
     :param search_id: Unique search session identifier.
     '''
-    params: T_JSON_DICT = dict()
-    params['searchId'] = search_id
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'searchId': search_id,
+    }
+    yield {
         'method': 'DOM.discardSearchResults',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def enable(
@@ -728,11 +725,10 @@ def enable(
     params: T_JSON_DICT = dict()
     if include_whitespace is not None:
         params['includeWhitespace'] = include_whitespace
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'DOM.enable',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def focus(
@@ -754,11 +750,10 @@ def focus(
         params['backendNodeId'] = backend_node_id.to_json()
     if object_id is not None:
         params['objectId'] = object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'DOM.focus',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def get_attributes(
@@ -770,13 +765,13 @@ def get_attributes(
     :param node_id: Id of the node to retrieve attibutes for.
     :returns: An interleaved array of node attribute names and values.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+    }
+    json = yield {
         'method': 'DOM.getAttributes',
         'params': params,
     }
-    json = yield cmd_dict
     return [str(i) for i in json['attributes']]
 
 
@@ -800,11 +795,10 @@ def get_box_model(
         params['backendNodeId'] = backend_node_id.to_json()
     if object_id is not None:
         params['objectId'] = object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'DOM.getBoxModel',
         'params': params,
     }
-    json = yield cmd_dict
     return BoxModel.from_json(json['model'])
 
 
@@ -831,12 +825,11 @@ def get_content_quads(
         params['backendNodeId'] = backend_node_id.to_json()
     if object_id is not None:
         params['objectId'] = object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'DOM.getContentQuads',
         'params': params,
     }
-    json = yield cmd_dict
-    return [Quad.from_json(i) for i in json['quads']]
+    return list(map(Quad.from_json, json['quads']))
 
 
 def get_document(
@@ -856,11 +849,10 @@ def get_document(
         params['depth'] = depth
     if pierce is not None:
         params['pierce'] = pierce
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'DOM.getDocument',
         'params': params,
     }
-    json = yield cmd_dict
     return Node.from_json(json['root'])
 
 
@@ -885,12 +877,11 @@ def get_flattened_document(
         params['depth'] = depth
     if pierce is not None:
         params['pierce'] = pierce
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'DOM.getFlattenedDocument',
         'params': params,
     }
-    json = yield cmd_dict
-    return [Node.from_json(i) for i in json['nodes']]
+    return list(map(Node.from_json, json['nodes']))
 
 
 def get_nodes_for_subtree_by_style(
@@ -908,17 +899,17 @@ def get_nodes_for_subtree_by_style(
     :param pierce: *(Optional)* Whether or not iframes and shadow roots in the same target should be traversed when returning the results (default is false).
     :returns: Resulting nodes.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['computedStyles'] = [i.to_json() for i in computed_styles]
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+        'computedStyles': [i.to_json() for i in computed_styles],
+    }
     if pierce is not None:
         params['pierce'] = pierce
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'DOM.getNodesForSubtreeByStyle',
         'params': params,
     }
-    json = yield cmd_dict
-    return [NodeId.from_json(i) for i in json['nodeIds']]
+    return list(map(NodeId.from_json, json['nodeIds']))
 
 
 def get_node_for_location(
@@ -941,18 +932,18 @@ def get_node_for_location(
         1. **frameId** - Frame this node belongs to.
         2. **nodeId** - *(Optional)* Id of the node at given coordinates, only when enabled and requested document.
     '''
-    params: T_JSON_DICT = dict()
-    params['x'] = x
-    params['y'] = y
+    params: T_JSON_DICT = {
+        'x': x,
+        'y': y,
+    }
     if include_user_agent_shadow_dom is not None:
         params['includeUserAgentShadowDOM'] = include_user_agent_shadow_dom
     if ignore_pointer_events_none is not None:
         params['ignorePointerEventsNone'] = ignore_pointer_events_none
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'DOM.getNodeForLocation',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         BackendNodeId.from_json(json['backendNodeId']),
         page.FrameId.from_json(json['frameId']),
@@ -980,11 +971,10 @@ def get_outer_html(
         params['backendNodeId'] = backend_node_id.to_json()
     if object_id is not None:
         params['objectId'] = object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'DOM.getOuterHTML',
         'params': params,
     }
-    json = yield cmd_dict
     return str(json['outerHTML'])
 
 
@@ -999,13 +989,13 @@ def get_relayout_boundary(
     :param node_id: Id of the node.
     :returns: Relayout boundary node id for the given node.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+    }
+    json = yield {
         'method': 'DOM.getRelayoutBoundary',
         'params': params,
     }
-    json = yield cmd_dict
     return NodeId.from_json(json['nodeId'])
 
 
@@ -1025,46 +1015,43 @@ def get_search_results(
     :param to_index: End index of the search result to be returned.
     :returns: Ids of the search result nodes.
     '''
-    params: T_JSON_DICT = dict()
-    params['searchId'] = search_id
-    params['fromIndex'] = from_index
-    params['toIndex'] = to_index
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'searchId': search_id,
+        'fromIndex': from_index,
+        'toIndex': to_index,
+    }
+    json = yield {
         'method': 'DOM.getSearchResults',
         'params': params,
     }
-    json = yield cmd_dict
-    return [NodeId.from_json(i) for i in json['nodeIds']]
+    return list(map(NodeId.from_json, json['nodeIds']))
 
 
 def hide_highlight() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Hides any highlight.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'DOM.hideHighlight',
     }
-    json = yield cmd_dict
 
 
 def highlight_node() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Highlights DOM node.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'DOM.highlightNode',
     }
-    json = yield cmd_dict
 
 
 def highlight_rect() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Highlights given rectangle.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'DOM.highlightRect',
     }
-    json = yield cmd_dict
 
 
 def mark_undoable_state() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1073,10 +1060,9 @@ def mark_undoable_state() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'DOM.markUndoableState',
     }
-    json = yield cmd_dict
 
 
 def move_to(
@@ -1092,16 +1078,16 @@ def move_to(
     :param insert_before_node_id: *(Optional)* Drop node before this one (if absent, the moved node becomes the last child of ```targetNodeId```).
     :returns: New id of the moved node.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['targetNodeId'] = target_node_id.to_json()
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+        'targetNodeId': target_node_id.to_json(),
+    }
     if insert_before_node_id is not None:
         params['insertBeforeNodeId'] = insert_before_node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'DOM.moveTo',
         'params': params,
     }
-    json = yield cmd_dict
     return NodeId.from_json(json['nodeId'])
 
 
@@ -1122,15 +1108,15 @@ def perform_search(
         0. **searchId** - Unique search session identifier.
         1. **resultCount** - Number of search results.
     '''
-    params: T_JSON_DICT = dict()
-    params['query'] = query
+    params: T_JSON_DICT = {
+        'query': query,
+    }
     if include_user_agent_shadow_dom is not None:
         params['includeUserAgentShadowDOM'] = include_user_agent_shadow_dom
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'DOM.performSearch',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         str(json['searchId']),
         int(json['resultCount'])
@@ -1148,13 +1134,13 @@ def push_node_by_path_to_frontend(
     :param path: Path to node in the proprietary format.
     :returns: Id of the node for given path.
     '''
-    params: T_JSON_DICT = dict()
-    params['path'] = path
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'path': path,
+    }
+    json = yield {
         'method': 'DOM.pushNodeByPathToFrontend',
         'params': params,
     }
-    json = yield cmd_dict
     return NodeId.from_json(json['nodeId'])
 
 
@@ -1169,14 +1155,14 @@ def push_nodes_by_backend_ids_to_frontend(
     :param backend_node_ids: The array of backend node ids.
     :returns: The array of ids of pushed nodes that correspond to the backend ids specified in backendNodeIds.
     '''
-    params: T_JSON_DICT = dict()
-    params['backendNodeIds'] = [i.to_json() for i in backend_node_ids]
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'backendNodeIds': [i.to_json() for i in backend_node_ids],
+    }
+    json = yield {
         'method': 'DOM.pushNodesByBackendIdsToFrontend',
         'params': params,
     }
-    json = yield cmd_dict
-    return [NodeId.from_json(i) for i in json['nodeIds']]
+    return list(map(NodeId.from_json, json['nodeIds']))
 
 
 def query_selector(
@@ -1190,14 +1176,14 @@ def query_selector(
     :param selector: Selector string.
     :returns: Query selector result.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['selector'] = selector
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+        'selector': selector,
+    }
+    json = yield {
         'method': 'DOM.querySelector',
         'params': params,
     }
-    json = yield cmd_dict
     return NodeId.from_json(json['nodeId'])
 
 
@@ -1212,15 +1198,15 @@ def query_selector_all(
     :param selector: Selector string.
     :returns: Query selector result.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['selector'] = selector
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+        'selector': selector,
+    }
+    json = yield {
         'method': 'DOM.querySelectorAll',
         'params': params,
     }
-    json = yield cmd_dict
-    return [NodeId.from_json(i) for i in json['nodeIds']]
+    return list(map(NodeId.from_json, json['nodeIds']))
 
 
 def get_top_layer_elements() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[NodeId]]:
@@ -1233,11 +1219,10 @@ def get_top_layer_elements() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.
 
     :returns: NodeIds of top layer elements
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'DOM.getTopLayerElements',
     }
-    json = yield cmd_dict
-    return [NodeId.from_json(i) for i in json['nodeIds']]
+    return list(map(NodeId.from_json, json['nodeIds']))
 
 
 def redo() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1246,10 +1231,9 @@ def redo() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'DOM.redo',
     }
-    json = yield cmd_dict
 
 
 def remove_attribute(
@@ -1262,14 +1246,14 @@ def remove_attribute(
     :param node_id: Id of the element to remove attribute from.
     :param name: Name of the attribute to remove.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['name'] = name
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+        'name': name,
+    }
+    yield {
         'method': 'DOM.removeAttribute',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def remove_node(
@@ -1280,13 +1264,13 @@ def remove_node(
 
     :param node_id: Id of the node to remove.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+    }
+    yield {
         'method': 'DOM.removeNode',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def request_child_nodes(
@@ -1303,17 +1287,17 @@ def request_child_nodes(
     :param depth: *(Optional)* The maximum depth at which children should be retrieved, defaults to 1. Use -1 for the entire subtree or provide an integer larger than 0.
     :param pierce: *(Optional)* Whether or not iframes and shadow roots should be traversed when returning the sub-tree (default is false).
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+    }
     if depth is not None:
         params['depth'] = depth
     if pierce is not None:
         params['pierce'] = pierce
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'DOM.requestChildNodes',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def request_node(
@@ -1327,13 +1311,13 @@ def request_node(
     :param object_id: JavaScript object id to convert into node.
     :returns: Node id for given object.
     '''
-    params: T_JSON_DICT = dict()
-    params['objectId'] = object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'objectId': object_id.to_json(),
+    }
+    json = yield {
         'method': 'DOM.requestNode',
         'params': params,
     }
-    json = yield cmd_dict
     return NodeId.from_json(json['nodeId'])
 
 
@@ -1361,11 +1345,10 @@ def resolve_node(
         params['objectGroup'] = object_group
     if execution_context_id is not None:
         params['executionContextId'] = execution_context_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'DOM.resolveNode',
         'params': params,
     }
-    json = yield cmd_dict
     return runtime.RemoteObject.from_json(json['object'])
 
 
@@ -1381,15 +1364,15 @@ def set_attribute_value(
     :param name: Attribute name.
     :param value: Attribute value.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['name'] = name
-    params['value'] = value
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+        'name': name,
+        'value': value,
+    }
+    yield {
         'method': 'DOM.setAttributeValue',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_attributes_as_text(
@@ -1405,16 +1388,16 @@ def set_attributes_as_text(
     :param text: Text with a number of attributes. Will parse this text using HTML parser.
     :param name: *(Optional)* Attribute name to replace with new attributes derived from text in case text parsed successfully.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['text'] = text
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+        'text': text,
+    }
     if name is not None:
         params['name'] = name
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'DOM.setAttributesAsText',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_file_input_files(
@@ -1431,19 +1414,19 @@ def set_file_input_files(
     :param backend_node_id: *(Optional)* Identifier of the backend node.
     :param object_id: *(Optional)* JavaScript object id of the node wrapper.
     '''
-    params: T_JSON_DICT = dict()
-    params['files'] = [i for i in files]
+    params: T_JSON_DICT = {
+        'files': [i for i in files],
+    }
     if node_id is not None:
         params['nodeId'] = node_id.to_json()
     if backend_node_id is not None:
         params['backendNodeId'] = backend_node_id.to_json()
     if object_id is not None:
         params['objectId'] = object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'DOM.setFileInputFiles',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_node_stack_traces_enabled(
@@ -1456,13 +1439,13 @@ def set_node_stack_traces_enabled(
 
     :param enable: Enable or disable.
     '''
-    params: T_JSON_DICT = dict()
-    params['enable'] = enable
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'enable': enable,
+    }
+    yield {
         'method': 'DOM.setNodeStackTracesEnabled',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def get_node_stack_traces(
@@ -1476,13 +1459,13 @@ def get_node_stack_traces(
     :param node_id: Id of the node to get stack traces for.
     :returns: *(Optional)* Creation stack trace, if available.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+    }
+    json = yield {
         'method': 'DOM.getNodeStackTraces',
         'params': params,
     }
-    json = yield cmd_dict
     return runtime.StackTrace.from_json(json['creation']) if json.get('creation', None) is not None else None
 
 
@@ -1498,13 +1481,13 @@ def get_file_info(
     :param object_id: JavaScript object id of the node wrapper.
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['objectId'] = object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'objectId': object_id.to_json(),
+    }
+    json = yield {
         'method': 'DOM.getFileInfo',
         'params': params,
     }
-    json = yield cmd_dict
     return str(json['path'])
 
 
@@ -1519,13 +1502,13 @@ def set_inspected_node(
 
     :param node_id: DOM node id to be accessible by means of $x command line API.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+    }
+    yield {
         'method': 'DOM.setInspectedNode',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_node_name(
@@ -1539,14 +1522,14 @@ def set_node_name(
     :param name: New node's name.
     :returns: New node's id.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['name'] = name
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+        'name': name,
+    }
+    json = yield {
         'method': 'DOM.setNodeName',
         'params': params,
     }
-    json = yield cmd_dict
     return NodeId.from_json(json['nodeId'])
 
 
@@ -1560,14 +1543,14 @@ def set_node_value(
     :param node_id: Id of the node to set value for.
     :param value: New node's value.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['value'] = value
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+        'value': value,
+    }
+    yield {
         'method': 'DOM.setNodeValue',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_outer_html(
@@ -1580,14 +1563,14 @@ def set_outer_html(
     :param node_id: Id of the node to set markup for.
     :param outer_html: Outer HTML markup to set.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['outerHTML'] = outer_html
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+        'outerHTML': outer_html,
+    }
+    yield {
         'method': 'DOM.setOuterHTML',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def undo() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1596,10 +1579,9 @@ def undo() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'DOM.undo',
     }
-    json = yield cmd_dict
 
 
 def get_frame_owner(
@@ -1616,13 +1598,13 @@ def get_frame_owner(
         0. **backendNodeId** - Resulting node.
         1. **nodeId** - *(Optional)* Id of the node at given coordinates, only when enabled and requested document.
     '''
-    params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'frameId': frame_id.to_json(),
+    }
+    json = yield {
         'method': 'DOM.getFrameOwner',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         BackendNodeId.from_json(json['backendNodeId']),
         NodeId.from_json(json['nodeId']) if json.get('nodeId', None) is not None else None
@@ -1649,19 +1631,19 @@ def get_container_for_node(
     :param logical_axes: *(Optional)*
     :returns: *(Optional)* The container node for the given node, or null if not found.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+    }
     if container_name is not None:
         params['containerName'] = container_name
     if physical_axes is not None:
         params['physicalAxes'] = physical_axes.to_json()
     if logical_axes is not None:
         params['logicalAxes'] = logical_axes.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'DOM.getContainerForNode',
         'params': params,
     }
-    json = yield cmd_dict
     return NodeId.from_json(json['nodeId']) if json.get('nodeId', None) is not None else None
 
 
@@ -1677,14 +1659,14 @@ def get_querying_descendants_for_container(
     :param node_id: Id of the container node to find querying descendants from.
     :returns: Descendant nodes with container queries against the given container.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+    }
+    json = yield {
         'method': 'DOM.getQueryingDescendantsForContainer',
         'params': params,
     }
-    json = yield cmd_dict
-    return [NodeId.from_json(i) for i in json['nodeIds']]
+    return list(map(NodeId.from_json, json['nodeIds']))
 
 
 @event_class('DOM.attributeModified')
@@ -1824,7 +1806,7 @@ class DistributedNodesUpdated:
     def from_json(cls, json: T_JSON_DICT) -> DistributedNodesUpdated:
         return cls(
             insertion_point_id=NodeId.from_json(json['insertionPointId']),
-            distributed_nodes=[BackendNode.from_json(i) for i in json['distributedNodes']]
+            distributed_nodes=list(map(BackendNode.from_json, json['distributedNodes']))
         )
 
 
@@ -1857,7 +1839,7 @@ class InlineStyleInvalidated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InlineStyleInvalidated:
         return cls(
-            node_ids=[NodeId.from_json(i) for i in json['nodeIds']]
+            node_ids=list(map(NodeId.from_json, json['nodeIds']))
         )
 
 
@@ -1936,7 +1918,7 @@ class SetChildNodes:
     def from_json(cls, json: T_JSON_DICT) -> SetChildNodes:
         return cls(
             parent_id=NodeId.from_json(json['parentId']),
-            nodes=[Node.from_json(i) for i in json['nodes']]
+            nodes=list(map(Node.from_json, json['nodes']))
         )
 
 
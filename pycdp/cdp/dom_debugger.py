@@ -9,7 +9,7 @@ from __future__ import annotations
 import enum
 import typing
 from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import T_JSON_DICT
 
 from . import dom
 from . import runtime
@@ -127,18 +127,18 @@ def get_event_listeners(
     :param pierce: *(Optional)* Whether or not iframes and shadow roots should be traversed when returning the subtree (default is false). Reports listeners for all contexts if pierce is enabled.
     :returns: Array of relevant listeners.
     '''
-    params: T_JSON_DICT = dict()
-    params['objectId'] = object_id.to_json()
+    params: T_JSON_DICT = {
+        'objectId': object_id.to_json(),
+    }
     if depth is not None:
         params['depth'] = depth
     if pierce is not None:
         params['pierce'] = pierce
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'DOMDebugger.getEventListeners',
         'params': params,
     }
-    json = yield cmd_dict
-    return [EventListener.from_json(i) for i in json['listeners']]
+    return list(map(EventListener.from_json, json['listeners']))
 
 
 def remove_dom_breakpoint(
@@ -151,14 +151,14 @@ def remove_dom_breakpoint(
     :param node_id: Identifier of the node to remove breakpoint from.
     :param type_: Type of the breakpoint to remove.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['type'] = type_.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+        'type': type_.to_json(),
+    }
+    yield {
         'method': 'DOMDebugger.removeDOMBreakpoint',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def remove_event_listener_breakpoint(
@@ -171,15 +171,15 @@ def remove_event_listener_breakpoint(
     :param event_name: Event name.
     :param target_name: **(EXPERIMENTAL)** *(Optional)* EventTarget interface name.
     '''
-    params: T_JSON_DICT = dict()
-    params['eventName'] = event_name
+    params: T_JSON_DICT = {
+        'eventName': event_name,
+    }
     if target_name is not None:
         params['targetName'] = target_name
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'DOMDebugger.removeEventListenerBreakpoint',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def remove_instrumentation_breakpoint(
@@ -192,13 +192,13 @@ def remove_instrumentation_breakpoint(
 
     :param event_name: Instrumentation name to stop on.
     '''
-    params: T_JSON_DICT = dict()
-    params['eventName'] = event_name
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'eventName': event_name,
+    }
+    yield {
         'method': 'DOMDebugger.removeInstrumentationBreakpoint',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def remove_xhr_breakpoint(
@@ -209,13 +209,13 @@ def remove_xhr_breakpoint(
 
     :param url: Resource URL substring.
     '''
-    params: T_JSON_DICT = dict()
-    params['url'] = url
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'url': url,
+    }
+    yield {
         'method': 'DOMDebugger.removeXHRBreakpoint',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_break_on_csp_violation(
@@ -228,13 +228,13 @@ def set_break_on_csp_violation(
 
     :param violation_types: CSP Violations to stop upon.
     '''
-    params: T_JSON_DICT = dict()
-    params['violationTypes'] = [i.to_json() for i in violation_types]
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'violationTypes': [i.to_json() for i in violation_types],
+    }
+    yield {
         'method': 'DOMDebugger.setBreakOnCSPViolation',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_dom_breakpoint(
@@ -247,14 +247,14 @@ def set_dom_breakpoint(
     :param node_id: Identifier of the node to set breakpoint on.
     :param type_: Type of the operation to stop upon.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['type'] = type_.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+        'type': type_.to_json(),
+    }
+    yield {
         'method': 'DOMDebugger.setDOMBreakpoint',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_event_listener_breakpoint(
@@ -267,15 +267,15 @@ def set_event_listener_breakpoint(
     :param event_name: DOM Event name to stop on (any DOM event will do).
     :param target_name: **(EXPERIMENTAL)** *(Optional)* EventTarget interface name to stop on. If equal to ```"*"``` or not provided, will stop on any EventTarget.
     '''
-    params: T_JSON_DICT = dict()
-    params['eventName'] = event_name
+    params: T_JSON_DICT = {
+        'eventName': event_name,
+    }
     if target_name is not None:
         params['targetName'] = target_name
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'DOMDebugger.setEventListenerBreakpoint',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_instrumentation_breakpoint(
@@ -288,13 +288,13 @@ def set_instrumentation_breakpoint(
 
     :param event_name: Instrumentation name to stop on.
     '''
-    params: T_JSON_DICT = dict()
-    params['eventName'] = event_name
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'eventName': event_name,
+    }
+    yield {
         'method': 'DOMDebugger.setInstrumentationBreakpoint',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_xhr_breakpoint(
@@ -305,10 +305,10 @@ def set_xhr_breakpoint(
 
     :param url: Resource URL substring. All XHRs having this substring in the URL will get stopped upon.
     '''
-    params: T_JSON_DICT = dict()
-    params['url'] = url
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'url': url,
+    }
+    yield {
         'method': 'DOMDebugger.setXHRBreakpoint',
         'params': params,
     }
-    json = yield cmd_dict
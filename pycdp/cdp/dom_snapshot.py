@@ -6,10 +6,9 @@
 # CDP domain: DOMSnapshot (experimental)
 
 from __future__ import annotations
-import enum
 import typing
 from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import T_JSON_DICT
 
 from . import dom
 from . import dom_debugger
@@ -179,7 +178,7 @@ class DOMNode:
             input_checked=bool(json['inputChecked']) if json.get('inputChecked', None) is not None else None,
             option_selected=bool(json['optionSelected']) if json.get('optionSelected', None) is not None else None,
             child_node_indexes=[int(i) for i in json['childNodeIndexes']] if json.get('childNodeIndexes', None) is not None else None,
-            attributes=[NameValue.from_json(i) for i in json['attributes']] if json.get('attributes', None) is not None else None,
+            attributes=list(map(NameValue.from_json, json['attributes'])) if json.get('attributes', None) is not None else None,
             pseudo_element_indexes=[int(i) for i in json['pseudoElementIndexes']] if json.get('pseudoElementIndexes', None) is not None else None,
             layout_node_index=int(json['layoutNodeIndex']) if json.get('layoutNodeIndex', None) is not None else None,
             document_url=str(json['documentURL']) if json.get('documentURL', None) is not None else None,
@@ -193,7 +192,7 @@ class DOMNode:
             pseudo_type=dom.PseudoType.from_json(json['pseudoType']) if json.get('pseudoType', None) is not None else None,
             shadow_root_type=dom.ShadowRootType.from_json(json['shadowRootType']) if json.get('shadowRootType', None) is not None else None,
             is_clickable=bool(json['isClickable']) if json.get('isClickable', None) is not None else None,
-            event_listeners=[dom_debugger.EventListener.from_json(i) for i in json['eventListeners']] if json.get('eventListeners', None) is not None else None,
+            event_listeners=list(map(dom_debugger.EventListener.from_json, json['eventListeners'])) if json.get('eventListeners', None) is not None else None,
             current_source_url=str(json['currentSourceURL']) if json.get('currentSourceURL', None) is not None else None,
             origin_url=str(json['originURL']) if json.get('originURL', None) is not None else None,
             scroll_offset_x=float(json['scrollOffsetX']) if json.get('scrollOffsetX', None) is not None else None,
@@ -284,7 +283,7 @@ class LayoutTreeNode:
             dom_node_index=int(json['domNodeIndex']),
             bounding_box=dom.Rect.from_json(json['boundingBox']),
             layout_text=str(json['layoutText']) if json.get('layoutText', None) is not None else None,
-            inline_text_nodes=[InlineTextBox.from_json(i) for i in json['inlineTextNodes']] if json.get('inlineTextNodes', None) is not None else None,
+            inline_text_nodes=list(map(InlineTextBox.from_json, json['inlineTextNodes'])) if json.get('inlineTextNodes', None) is not None else None,
             style_index=int(json['styleIndex']) if json.get('styleIndex', None) is not None else None,
             paint_order=int(json['paintOrder']) if json.get('paintOrder', None) is not None else None,
             is_stacking_context=bool(json['isStackingContext']) if json.get('isStackingContext', None) is not None else None,
@@ -307,7 +306,7 @@ class ComputedStyle:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ComputedStyle:
         return cls(
-            properties=[NameValue.from_json(i) for i in json['properties']],
+            properties=list(map(NameValue.from_json, json['properties'])),
         )
 
 
@@ -385,7 +384,7 @@ class RareStringData:
     def from_json(cls, json: T_JSON_DICT) -> RareStringData:
         return cls(
             index=[int(i) for i in json['index']],
-            value=[StringIndex.from_json(i) for i in json['value']],
+            value=list(map(StringIndex.from_json, json['value'])),
         )
 
 
@@ -634,10 +633,10 @@ class NodeTreeSnapshot:
             parent_index=[int(i) for i in json['parentIndex']] if json.get('parentIndex', None) is not None else None,
             node_type=[int(i) for i in json['nodeType']] if json.get('nodeType', None) is not None else None,
             shadow_root_type=RareStringData.from_json(json['shadowRootType']) if json.get('shadowRootType', None) is not None else None,
-            node_name=[StringIndex.from_json(i) for i in json['nodeName']] if json.get('nodeName', None) is not None else None,
-            node_value=[StringIndex.from_json(i) for i in json['nodeValue']] if json.get('nodeValue', None) is not None else None,
-            backend_node_id=[dom.BackendNodeId.from_json(i) for i in json['backendNodeId']] if json.get('backendNodeId', None) is not None else None,
-            attributes=[ArrayOfStrings.from_json(i) for i in json['attributes']] if json.get('attributes', None) is not None else None,
+            node_name=list(map(StringIndex.from_json, json['nodeName'])) if json.get('nodeName', None) is not None else None,
+            node_value=list(map(StringIndex.from_json, json['nodeValue'])) if json.get('nodeValue', None) is not None else None,
+            backend_node_id=list(map(dom.BackendNodeId.from_json, json['backendNodeId'])) if json.get('backendNodeId', None) is not None else None,
+            attributes=list(map(ArrayOfStrings.from_json, json['attributes'])) if json.get('attributes', None) is not None else None,
             text_value=RareStringData.from_json(json['textValue']) if json.get('textValue', None) is not None else None,
             input_value=RareStringData.from_json(json['inputValue']) if json.get('inputValue', None) is not None else None,
             input_checked=RareBooleanData.from_json(json['inputChecked']) if json.get('inputChecked', None) is not None else None,
@@ -716,15 +715,15 @@ class LayoutTreeSnapshot:
     def from_json(cls, json: T_JSON_DICT) -> LayoutTreeSnapshot:
         return cls(
             node_index=[int(i) for i in json['nodeIndex']],
-            styles=[ArrayOfStrings.from_json(i) for i in json['styles']],
-            bounds=[Rectangle.from_json(i) for i in json['bounds']],
-            text=[StringIndex.from_json(i) for i in json['text']],
+            styles=list(map(ArrayOfStrings.from_json, json['styles'])),
+            bounds=list(map(Rectangle.from_json, json['bounds'])),
+            text=list(map(StringIndex.from_json, json['text'])),
             stacking_contexts=RareBooleanData.from_json(json['stackingContexts']),
             paint_orders=[int(i) for i in json['paintOrders']] if json.get('paintOrders', None) is not None else None,
-            offset_rects=[Rectangle.from_json(i) for i in json['offsetRects']] if json.get('offsetRects', None) is not None else None,
-            scroll_rects=[Rectangle.from_json(i) for i in json['scrollRects']] if json.get('scrollRects', None) is not None else None,
-            client_rects=[Rectangle.from_json(i) for i in json['clientRects']] if json.get('clientRects', None) is not None else None,
-            blended_background_colors=[StringIndex.from_json(i) for i in json['blendedBackgroundColors']] if json.get('blendedBackgroundColors', None) is not None else None,
+            offset_rects=list(map(Rectangle.from_json, json['offsetRects'])) if json.get('offsetRects', None) is not None else None,
+            scroll_rects=list(map(Rectangle.from_json, json['scrollRects'])) if json.get('scrollRects', None) is not None else None,
+            client_rects=list(map(Rectangle.from_json, json['clientRects'])) if json.get('clientRects', None) is not None else None,
+            blended_background_colors=list(map(StringIndex.from_json, json['blendedBackgroundColors'])) if json.get('blendedBackgroundColors', None) is not None else None,
             text_color_opacities=[float(i) for i in json['textColorOpacities']] if json.get('textColorOpacities', None) is not None else None,
         )
 
@@ -761,7 +760,7 @@ class TextBoxSnapshot:
     def from_json(cls, json: T_JSON_DICT) -> TextBoxSnapshot:
         return cls(
             layout_index=[int(i) for i in json['layoutIndex']],
-            bounds=[Rectangle.from_json(i) for i in json['bounds']],
+            bounds=list(map(Rectangle.from_json, json['bounds'])),
             start=[int(i) for i in json['start']],
             length=[int(i) for i in json['length']],
         )
@@ -771,20 +770,18 @@ def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Disables DOM snapshot agent for the given page.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'DOMSnapshot.disable',
     }
-    json = yield cmd_dict
 
 
 def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Enables DOM snapshot agent for the given page.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'DOMSnapshot.enable',
     }
-    json = yield cmd_dict
 
 
 @deprecated(version="1.3")
@@ -812,23 +809,23 @@ def get_snapshot(
         1. **layoutTreeNodes** - The nodes in the layout tree.
         2. **computedStyles** - Whitelisted ComputedStyle properties for each node in the layout tree.
     '''
-    params: T_JSON_DICT = dict()
-    params['computedStyleWhitelist'] = [i for i in computed_style_whitelist]
+    params: T_JSON_DICT = {
+        'computedStyleWhitelist': [i for i in computed_style_whitelist],
+    }
     if include_event_listeners is not None:
         params['includeEventListeners'] = include_event_listeners
     if include_paint_order is not None:
         params['includePaintOrder'] = include_paint_order
     if include_user_agent_shadow_tree is not None:
         params['includeUserAgentShadowTree'] = include_user_agent_shadow_tree
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'DOMSnapshot.getSnapshot',
         'params': params,
     }
-    json = yield cmd_dict
     return (
-        [DOMNode.from_json(i) for i in json['domNodes']],
-        [LayoutTreeNode.from_json(i) for i in json['layoutTreeNodes']],
-        [ComputedStyle.from_json(i) for i in json['computedStyles']]
+        list(map(DOMNode.from_json, json['domNodes'])),
+        list(map(LayoutTreeNode.from_json, json['layoutTreeNodes'])),
+        list(map(ComputedStyle.from_json, json['computedStyles']))
     )
 
 
@@ -855,8 +852,9 @@ def capture_snapshot(
         0. **documents** - The nodes in the DOM tree. The DOMNode at index 0 corresponds to the root document.
         1. **strings** - Shared string table that all string properties refer to with indexes.
     '''
-    params: T_JSON_DICT = dict()
-    params['computedStyles'] = [i for i in computed_styles]
+    params: T_JSON_DICT = {
+        'computedStyles': [i for i in computed_styles],
+    }
     if include_paint_order is not None:
         params['includePaintOrder'] = include_paint_order
     if include_dom_rects is not None:
@@ -865,12 +863,11 @@ def capture_snapshot(
         params['includeBlendedBackgroundColors'] = include_blended_background_colors
     if include_text_color_opacities is not None:
         params['includeTextColorOpacities'] = include_text_color_opacities
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'DOMSnapshot.captureSnapshot',
         'params': params,
     }
-    json = yield cmd_dict
     return (
-        [DocumentSnapshot.from_json(i) for i in json['documents']],
+        list(map(DocumentSnapshot.from_json, json['documents'])),
         [str(i) for i in json['strings']]
     )
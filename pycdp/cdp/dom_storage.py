@@ -6,7 +6,6 @@
 # CDP domain: DOMStorage (experimental)
 
 from __future__ import annotations
-import enum
 import typing
 from dataclasses import dataclass
 from .util import event_class, T_JSON_DICT
@@ -77,33 +76,31 @@ def clear(
     '''
     :param storage_id:
     '''
-    params: T_JSON_DICT = dict()
-    params['storageId'] = storage_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'storageId': storage_id.to_json(),
+    }
+    yield {
         'method': 'DOMStorage.clear',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Disables storage tracking, prevents storage events from being sent to the client.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'DOMStorage.disable',
     }
-    json = yield cmd_dict
 
 
 def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Enables storage tracking, storage events will now be delivered to the client.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'DOMStorage.enable',
     }
-    json = yield cmd_dict
 
 
 def get_dom_storage_items(
@@ -113,14 +110,14 @@ def get_dom_storage_items(
     :param storage_id:
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['storageId'] = storage_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'storageId': storage_id.to_json(),
+    }
+    json = yield {
         'method': 'DOMStorage.getDOMStorageItems',
         'params': params,
     }
-    json = yield cmd_dict
-    return [Item.from_json(i) for i in json['entries']]
+    return list(map(Item.from_json, json['entries']))
 
 
 def remove_dom_storage_item(
@@ -131,14 +128,14 @@ def remove_dom_storage_item(
     :param storage_id:
     :param key:
     '''
-    params: T_JSON_DICT = dict()
-    params['storageId'] = storage_id.to_json()
-    params['key'] = key
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'storageId': storage_id.to_json(),
+        'key': key,
+    }
+    yield {
         'method': 'DOMStorage.removeDOMStorageItem',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_dom_storage_item(
@@ -151,15 +148,15 @@ def set_dom_storage_item(
     :param key:
     :param value:
     '''
-    params: T_JSON_DICT = dict()
-    params['storageId'] = storage_id.to_json()
-    params['key'] = key
-    params['value'] = value
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'storageId': storage_id.to_json(),
+        'key': key,
+        'value': value,
+    }
+    yield {
         'method': 'DOMStorage.setDOMStorageItem',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @event_class('DOMStorage.domStorageItemAdded')
@@ -189,8 +189,8 @@ class UserAgentMetadata:
             architecture=str(json['architecture']),
             model=str(json['model']),
             mobile=bool(json['mobile']),
-            brands=[UserAgentBrandVersion.from_json(i) for i in json['brands']] if json.get('brands', None) is not None else None,
-            full_version_list=[UserAgentBrandVersion.from_json(i) for i in json['fullVersionList']] if json.get('fullVersionList', None) is not None else None,
+            brands=list(map(UserAgentBrandVersion.from_json, json['brands'])) if json.get('brands', None) is not None else None,
+            full_version_list=list(map(UserAgentBrandVersion.from_json, json['fullVersionList'])) if json.get('fullVersionList', None) is not None else None,
             full_version=str(json['fullVersion']) if json.get('fullVersion', None) is not None else None,
             bitness=str(json['bitness']) if json.get('bitness', None) is not None else None,
             wow64=bool(json['wow64']) if json.get('wow64', None) is not None else None,
@@ -218,10 +218,9 @@ def can_emulate() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool]:
 
     :returns: True if emulation is supported.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Emulation.canEmulate',
     }
-    json = yield cmd_dict
     return bool(json['result'])
 
 
@@ -229,20 +228,18 @@ def clear_device_metrics_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,
     '''
     Clears the overridden device metrics.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Emulation.clearDeviceMetricsOverride',
     }
-    json = yield cmd_dict
 
 
 def clear_geolocation_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Clears the overridden Geolocation Position and Error.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Emulation.clearGeolocationOverride',
     }
-    json = yield cmd_dict
 
 
 def reset_page_scale_factor() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -251,10 +248,9 @@ def reset_page_scale_factor() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Emulation.resetPageScaleFactor',
     }
-    json = yield cmd_dict
 
 
 def set_focus_emulation_enabled(
@@ -267,13 +263,13 @@ def set_focus_emulation_enabled(
 
     :param enabled: Whether to enable to disable focus emulation.
     '''
-    params: T_JSON_DICT = dict()
-    params['enabled'] = enabled
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'enabled': enabled,
+    }
+    yield {
         'method': 'Emulation.setFocusEmulationEnabled',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_auto_dark_mode_override(
@@ -289,11 +285,10 @@ def set_auto_dark_mode_override(
     params: T_JSON_DICT = dict()
     if enabled is not None:
         params['enabled'] = enabled
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Emulation.setAutoDarkModeOverride',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_cpu_throttling_rate(
@@ -306,13 +301,13 @@ def set_cpu_throttling_rate(
 
     :param rate: Throttling rate as a slowdown factor (1 is no throttle, 2 is 2x slowdown, etc).
     '''
-    params: T_JSON_DICT = dict()
-    params['rate'] = rate
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'rate': rate,
+    }
+    yield {
         'method': 'Emulation.setCPUThrottlingRate',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_default_background_color_override(
@@ -327,11 +322,10 @@ def set_default_background_color_override(
     params: T_JSON_DICT = dict()
     if color is not None:
         params['color'] = color.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Emulation.setDefaultBackgroundColorOverride',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_device_metrics_override(
@@ -368,11 +362,12 @@ def set_device_metrics_override(
     :param viewport: **(EXPERIMENTAL)** *(Optional)* If set, the visible area of the page will be overridden to this viewport. This viewport change is not observed by the page, e.g. viewport-relative elements do not change positions.
     :param display_feature: **(EXPERIMENTAL)** *(Optional)* If set, the display feature of a multi-segment screen. If not set, multi-segment support is turned-off.
     '''
-    params: T_JSON_DICT = dict()
-    params['width'] = width
-    params['height'] = height
-    params['deviceScaleFactor'] = device_scale_factor
-    params['mobile'] = mobile
+    params: T_JSON_DICT = {
+        'width': width,
+        'height': height,
+        'deviceScaleFactor': device_scale_factor,
+        'mobile': mobile,
+    }
     if scale is not None:
         params['scale'] = scale
     if screen_width is not None:
@@ -391,11 +386,10 @@ def set_device_metrics_override(
         params['viewport'] = viewport.to_json()
     if display_feature is not None:
         params['displayFeature'] = display_feature.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Emulation.setDeviceMetricsOverride',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_scrollbars_hidden(
@@ -408,13 +402,13 @@ def set_scrollbars_hidden(
 
     :param hidden: Whether scrollbars should be always hidden.
     '''
-    params: T_JSON_DICT = dict()
-    params['hidden'] = hidden
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'hidden': hidden,
+    }
+    yield {
         'method': 'Emulation.setScrollbarsHidden',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_document_cookie_disabled(
@@ -427,13 +421,13 @@ def set_document_cookie_disabled(
 
     :param disabled: Whether document.coookie API should be disabled.
     '''
-    params: T_JSON_DICT = dict()
-    params['disabled'] = disabled
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'disabled': disabled,
+    }
+    yield {
         'method': 'Emulation.setDocumentCookieDisabled',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_emit_touch_events_for_mouse(
@@ -448,15 +442,15 @@ def set_emit_touch_events_for_mouse(
     :param enabled: Whether touch emulation based on mouse input should be enabled.
     :param configuration: *(Optional)* Touch/gesture events configuration. Default: current platform.
     '''
-    params: T_JSON_DICT = dict()
-    params['enabled'] = enabled
+    params: T_JSON_DICT = {
+        'enabled': enabled,
+    }
     if configuration is not None:
         params['configuration'] = configuration
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Emulation.setEmitTouchEventsForMouse',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_emulated_media(
@@ -474,11 +468,10 @@ def set_emulated_media(
         params['media'] = media
     if features is not None:
         params['features'] = [i.to_json() for i in features]
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Emulation.setEmulatedMedia',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_emulated_vision_deficiency(
@@ -491,13 +484,13 @@ def set_emulated_vision_deficiency(
 
     :param type_: Vision deficiency to emulate. Order: best-effort emulations come first, followed by any physiologically accurate emulations for medically recognized color vision deficiencies.
     '''
-    params: T_JSON_DICT = dict()
-    params['type'] = type_
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'type': type_,
+    }
+    yield {
         'method': 'Emulation.setEmulatedVisionDeficiency',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_geolocation_override(
@@ -520,11 +513,10 @@ def set_geolocation_override(
         params['longitude'] = longitude
     if accuracy is not None:
         params['accuracy'] = accuracy
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Emulation.setGeolocationOverride',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_idle_override(
@@ -539,14 +531,14 @@ def set_idle_override(
     :param is_user_active: Mock isUserActive
     :param is_screen_unlocked: Mock isScreenUnlocked
     '''
-    params: T_JSON_DICT = dict()
-    params['isUserActive'] = is_user_active
-    params['isScreenUnlocked'] = is_screen_unlocked
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'isUserActive': is_user_active,
+        'isScreenUnlocked': is_screen_unlocked,
+    }
+    yield {
         'method': 'Emulation.setIdleOverride',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def clear_idle_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -555,10 +547,9 @@ def clear_idle_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Emulation.clearIdleOverride',
     }
-    json = yield cmd_dict
 
 
 @deprecated(version="1.3")
@@ -574,13 +565,13 @@ def set_navigator_overrides(
 
     :param platform: The platform navigator.platform should return.
     '''
-    params: T_JSON_DICT = dict()
-    params['platform'] = platform
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'platform': platform,
+    }
+    yield {
         'method': 'Emulation.setNavigatorOverrides',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_page_scale_factor(
@@ -593,13 +584,13 @@ def set_page_scale_factor(
 
     :param page_scale_factor: Page scale factor.
     '''
-    params: T_JSON_DICT = dict()
-    params['pageScaleFactor'] = page_scale_factor
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'pageScaleFactor': page_scale_factor,
+    }
+    yield {
         'method': 'Emulation.setPageScaleFactor',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_script_execution_disabled(
@@ -610,13 +601,13 @@ def set_script_execution_disabled(
 
     :param value: Whether script execution should be disabled in the page.
     '''
-    params: T_JSON_DICT = dict()
-    params['value'] = value
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'value': value,
+    }
+    yield {
         'method': 'Emulation.setScriptExecutionDisabled',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_touch_emulation_enabled(
@@ -629,15 +620,15 @@ def set_touch_emulation_enabled(
     :param enabled: Whether the touch event emulation should be enabled.
     :param max_touch_points: *(Optional)* Maximum touch points supported. Defaults to one.
     '''
-    params: T_JSON_DICT = dict()
-    params['enabled'] = enabled
+    params: T_JSON_DICT = {
+        'enabled': enabled,
+    }
     if max_touch_points is not None:
         params['maxTouchPoints'] = max_touch_points
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Emulation.setTouchEmulationEnabled',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_virtual_time_policy(
@@ -658,19 +649,19 @@ def set_virtual_time_policy(
     :param initial_virtual_time: *(Optional)* If set, base::Time::Now will be overridden to initially return this value.
     :returns: Absolute timestamp at which virtual time was first enabled (up time in milliseconds).
     '''
-    params: T_JSON_DICT = dict()
-    params['policy'] = policy.to_json()
+    params: T_JSON_DICT = {
+        'policy': policy.to_json(),
+    }
     if budget is not None:
         params['budget'] = budget
     if max_virtual_time_task_starvation_count is not None:
         params['maxVirtualTimeTaskStarvationCount'] = max_virtual_time_task_starvation_count
     if initial_virtual_time is not None:
         params['initialVirtualTime'] = initial_virtual_time.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Emulation.setVirtualTimePolicy',
         'params': params,
     }
-    json = yield cmd_dict
     return float(json['virtualTimeTicksBase'])
 
 
@@ -687,11 +678,10 @@ def set_locale_override(
     params: T_JSON_DICT = dict()
     if locale is not None:
         params['locale'] = locale
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Emulation.setLocaleOverride',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_timezone_override(
@@ -704,13 +694,13 @@ def set_timezone_override(
 
     :param timezone_id: The timezone identifier. If empty, disables the override and restores default host system timezone.
     '''
-    params: T_JSON_DICT = dict()
-    params['timezoneId'] = timezone_id
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'timezoneId': timezone_id,
+    }
+    yield {
         'method': 'Emulation.setTimezoneOverride',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @deprecated(version="1.3")
@@ -730,14 +720,14 @@ def set_visible_size(
     :param width: Frame width (DIP).
     :param height: Frame height (DIP).
     '''
-    params: T_JSON_DICT = dict()
-    params['width'] = width
-    params['height'] = height
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'width': width,
+        'height': height,
+    }
+    yield {
         'method': 'Emulation.setVisibleSize',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_disabled_image_types(
@@ -750,13 +740,13 @@ def set_disabled_image_types(
 
     :param image_types: Image types to disable.
     '''
-    params: T_JSON_DICT = dict()
-    params['imageTypes'] = [i.to_json() for i in image_types]
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'imageTypes': [i.to_json() for i in image_types],
+    }
+    yield {
         'method': 'Emulation.setDisabledImageTypes',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_hardware_concurrency_override(
@@ -769,13 +759,13 @@ def set_hardware_concurrency_override(
 
     :param hardware_concurrency: Hardware concurrency to report
     '''
-    params: T_JSON_DICT = dict()
-    params['hardwareConcurrency'] = hardware_concurrency
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'hardwareConcurrency': hardware_concurrency,
+    }
+    yield {
         'method': 'Emulation.setHardwareConcurrencyOverride',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_user_agent_override(
@@ -792,19 +782,19 @@ def set_user_agent_override(
     :param platform: *(Optional)* The platform navigator.platform should return.
     :param user_agent_metadata: **(EXPERIMENTAL)** *(Optional)* To be sent in Sec-CH-UA-* headers and returned in navigator.userAgentData
     '''
-    params: T_JSON_DICT = dict()
-    params['userAgent'] = user_agent
+    params: T_JSON_DICT = {
+        'userAgent': user_agent,
+    }
     if accept_language is not None:
         params['acceptLanguage'] = accept_language
     if platform is not None:
         params['platform'] = platform
     if user_agent_metadata is not None:
         params['userAgentMetadata'] = user_agent_metadata.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Emulation.setUserAgentOverride',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_automation_override(
@@ -817,13 +807,13 @@ def set_automation_override(
 
     :param enabled: Whether the override should be enabled.
     '''
-    params: T_JSON_DICT = dict()
-    params['enabled'] = enabled
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'enabled': enabled,
+    }
+    yield {
         'method': 'Emulation.setAutomationOverride',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @event_class('Emulation.virtualTimeBudgetExpired')
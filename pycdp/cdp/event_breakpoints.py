@@ -6,10 +6,8 @@
 # CDP domain: EventBreakpoints (experimental)
 
 from __future__ import annotations
-import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import T_JSON_DICT
 
 
 def set_instrumentation_breakpoint(
@@ -20,13 +18,13 @@ def set_instrumentation_breakpoint(
 
     :param event_name: Instrumentation name to stop on.
     '''
-    params: T_JSON_DICT = dict()
-    params['eventName'] = event_name
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'eventName': event_name,
+    }
+    yield {
         'method': 'EventBreakpoints.setInstrumentationBreakpoint',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def remove_instrumentation_breakpoint(
@@ -37,10 +35,10 @@ def remove_instrumentation_breakpoint(
 
     :param event_name: Instrumentation name to stop on.
     '''
-    params: T_JSON_DICT = dict()
-    params['eventName'] = event_name
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'eventName': event_name,
+    }
+    yield {
         'method': 'EventBreakpoints.removeInstrumentationBreakpoint',
         'params': params,
     }
-    json = yield cmd_dict
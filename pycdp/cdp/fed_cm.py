@@ -110,19 +110,17 @@ def enable(
     params: T_JSON_DICT = dict()
     if disable_rejection_delay is not None:
         params['disableRejectionDelay'] = disable_rejection_delay
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'FedCm.enable',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'FedCm.disable',
     }
-    json = yield cmd_dict
 
 
 def select_account(
@@ -133,14 +131,14 @@ def select_account(
     :param dialog_id:
     :param account_index:
     '''
-    params: T_JSON_DICT = dict()
-    params['dialogId'] = dialog_id
-    params['accountIndex'] = account_index
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'dialogId': dialog_id,
+        'accountIndex': account_index,
+    }
+    yield {
         'method': 'FedCm.selectAccount',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def dismiss_dialog(
@@ -151,15 +149,15 @@ def dismiss_dialog(
     :param dialog_id:
     :param trigger_cooldown: *(Optional)*
     '''
-    params: T_JSON_DICT = dict()
-    params['dialogId'] = dialog_id
+    params: T_JSON_DICT = {
+        'dialogId': dialog_id,
+    }
     if trigger_cooldown is not None:
         params['triggerCooldown'] = trigger_cooldown
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'FedCm.dismissDialog',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def reset_cooldown() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -167,10 +165,9 @@ def reset_cooldown() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     Resets the cooldown time, if any, to allow the next FedCM call to show
     a dialog even if one was recently dismissed by the user.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'FedCm.resetCooldown',
     }
-    json = yield cmd_dict
 
 
 @event_class('FedCm.dialogShown')
@@ -189,7 +186,7 @@ class DialogShown:
         return cls(
             dialog_id=str(json['dialogId']),
             dialog_type=DialogType.from_json(json['dialogType']),
-            accounts=[Account.from_json(i) for i in json['accounts']],
+            accounts=list(map(Account.from_json, json['accounts'])),
             title=str(json['title']),
             subtitle=str(json['subtitle']) if json.get('subtitle', None) is not None else None
         )
@@ -178,10 +178,9 @@ def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Disables the fetch domain.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Fetch.disable',
     }
-    json = yield cmd_dict
 
 
 def enable(
@@ -200,11 +199,10 @@ def enable(
         params['patterns'] = [i.to_json() for i in patterns]
     if handle_auth_requests is not None:
         params['handleAuthRequests'] = handle_auth_requests
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Fetch.enable',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def fail_request(
@@ -217,14 +215,14 @@ def fail_request(
     :param request_id: An id the client received in requestPaused event.
     :param error_reason: Causes the request to fail with the given reason.
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
-    params['errorReason'] = error_reason.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'requestId': request_id.to_json(),
+        'errorReason': error_reason.to_json(),
+    }
+    yield {
         'method': 'Fetch.failRequest',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def fulfill_request(
@@ -245,9 +243,10 @@ def fulfill_request(
     :param body: *(Optional)* A response body. If absent, original response body will be used if the request is intercepted at the response stage and empty body will be used if the request is intercepted at the request stage. (Encoded as a base64 string when passed over JSON)
     :param response_phrase: *(Optional)* A textual representation of responseCode. If absent, a standard phrase matching responseCode is used.
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
-    params['responseCode'] = response_code
+    params: T_JSON_DICT = {
+        'requestId': request_id.to_json(),
+        'responseCode': response_code,
+    }
     if response_headers is not None:
         params['responseHeaders'] = [i.to_json() for i in response_headers]
     if binary_response_headers is not None:
@@ -256,11 +255,10 @@ def fulfill_request(
         params['body'] = body
     if response_phrase is not None:
         params['responsePhrase'] = response_phrase
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Fetch.fulfillRequest',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def continue_request(
@@ -281,8 +279,9 @@ def continue_request(
     :param headers: *(Optional)* If set, overrides the request headers. Note that the overrides do not extend to subsequent redirect hops, if a redirect happens. Another override may be applied to a different request produced by a redirect.
     :param intercept_response: **(EXPERIMENTAL)** *(Optional)* If set, overrides response interception behavior for this request.
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
+    params: T_JSON_DICT = {
+        'requestId': request_id.to_json(),
+    }
     if url is not None:
         params['url'] = url
     if method is not None:
@@ -293,11 +292,10 @@ def continue_request(
         params['headers'] = [i.to_json() for i in headers]
     if intercept_response is not None:
         params['interceptResponse'] = intercept_response
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Fetch.continueRequest',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def continue_with_auth(
@@ -310,14 +308,14 @@ def continue_with_auth(
     :param request_id: An id the client received in authRequired event.
     :param auth_challenge_response: Response to  with an authChallenge.
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
-    params['authChallengeResponse'] = auth_challenge_response.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'requestId': request_id.to_json(),
+        'authChallengeResponse': auth_challenge_response.to_json(),
+    }
+    yield {
         'method': 'Fetch.continueWithAuth',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def continue_response(
@@ -340,8 +338,9 @@ def continue_response(
     :param response_headers: *(Optional)* Response headers. If absent, original response headers will be used.
     :param binary_response_headers: *(Optional)* Alternative way of specifying response headers as a \0-separated series of name: value pairs. Prefer the above method unless you need to represent some non-UTF8 values that can't be transmitted over the protocol as text. (Encoded as a base64 string when passed over JSON)
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
+    params: T_JSON_DICT = {
+        'requestId': request_id.to_json(),
+    }
     if response_code is not None:
         params['responseCode'] = response_code
     if response_phrase is not None:
@@ -350,11 +349,10 @@ def continue_response(
         params['responseHeaders'] = [i.to_json() for i in response_headers]
     if binary_response_headers is not None:
         params['binaryResponseHeaders'] = binary_response_headers
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Fetch.continueResponse',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def get_response_body(
@@ -378,13 +376,13 @@ def get_response_body(
         0. **body** - Response body.
         1. **base64Encoded** - True, if content was sent as base64.
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'requestId': request_id.to_json(),
+    }
+    json = yield {
         'method': 'Fetch.getResponseBody',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         str(json['body']),
         bool(json['base64Encoded'])
@@ -409,13 +407,13 @@ def take_response_body_as_stream(
     :param request_id:
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'requestId': request_id.to_json(),
+    }
+    json = yield {
         'method': 'Fetch.takeResponseBodyAsStream',
         'params': params,
     }
-    json = yield cmd_dict
     return io.StreamHandle.from_json(json['stream'])
 
 
@@ -468,7 +466,7 @@ class RequestPaused:
             response_error_reason=network.ErrorReason.from_json(json['responseErrorReason']) if json.get('responseErrorReason', None) is not None else None,
             response_status_code=int(json['responseStatusCode']) if json.get('responseStatusCode', None) is not None else None,
             response_status_text=str(json['responseStatusText']) if json.get('responseStatusText', None) is not None else None,
-            response_headers=[HeaderEntry.from_json(i) for i in json['responseHeaders']] if json.get('responseHeaders', None) is not None else None,
+            response_headers=list(map(HeaderEntry.from_json, json['responseHeaders'])) if json.get('responseHeaders', None) is not None else None,
             network_id=network.RequestId.from_json(json['networkId']) if json.get('networkId', None) is not None else None,
             redirected_request_id=RequestId.from_json(json['redirectedRequestId']) if json.get('redirectedRequestId', None) is not None else None
         )
@@ -6,10 +6,9 @@
 # CDP domain: HeadlessExperimental (experimental)
 
 from __future__ import annotations
-import enum
 import typing
 from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import T_JSON_DICT
 
 
 from deprecated.sphinx import deprecated # type: ignore
@@ -78,11 +77,10 @@ def begin_frame(
         params['noDisplayUpdates'] = no_display_updates
     if screenshot is not None:
         params['screenshot'] = screenshot.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'HeadlessExperimental.beginFrame',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         bool(json['hasDamage']),
         str(json['screenshotData']) if json.get('screenshotData', None) is not None else None
@@ -96,10 +94,9 @@ def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
     .. deprecated:: 1.3
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'HeadlessExperimental.disable',
     }
-    json = yield cmd_dict
 
 
 @deprecated(version="1.3")
@@ -109,7 +106,6 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
     .. deprecated:: 1.3
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'HeadlessExperimental.enable',
     }
-    json = yield cmd_dict
@@ -6,7 +6,6 @@
 # CDP domain: HeapProfiler (experimental)
 
 from __future__ import annotations
-import enum
 import typing
 from dataclasses import dataclass
 from .util import event_class, T_JSON_DICT
@@ -60,7 +59,7 @@ class SamplingHeapProfileNode:
             call_frame=runtime.CallFrame.from_json(json['callFrame']),
             self_size=float(json['selfSize']),
             id_=int(json['id']),
-            children=[SamplingHeapProfileNode.from_json(i) for i in json['children']],
+            children=list(map(SamplingHeapProfileNode.from_json, json['children'])),
         )
 
 
@@ -114,7 +113,7 @@ class SamplingHeapProfile:
     def from_json(cls, json: T_JSON_DICT) -> SamplingHeapProfile:
         return cls(
             head=SamplingHeapProfileNode.from_json(json['head']),
-            samples=[SamplingHeapProfileSample.from_json(i) for i in json['samples']],
+            samples=list(map(SamplingHeapProfileSample.from_json, json['samples'])),
         )
 
 
@@ -127,37 +126,34 @@ def add_inspected_heap_object(
 
     :param heap_object_id: Heap snapshot object id to be accessible by means of $x command line API.
     '''
-    params: T_JSON_DICT = dict()
-    params['heapObjectId'] = heap_object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'heapObjectId': heap_object_id.to_json(),
+    }
+    yield {
         'method': 'HeapProfiler.addInspectedHeapObject',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def collect_garbage() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'HeapProfiler.collectGarbage',
     }
-    json = yield cmd_dict
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'HeapProfiler.disable',
     }
-    json = yield cmd_dict
 
 
 def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'HeapProfiler.enable',
     }
-    json = yield cmd_dict
 
 
 def get_heap_object_id(
@@ -167,13 +163,13 @@ def get_heap_object_id(
     :param object_id: Identifier of the object to get heap object id for.
     :returns: Id of the heap snapshot object corresponding to the passed remote object id.
     '''
-    params: T_JSON_DICT = dict()
-    params['objectId'] = object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'objectId': object_id.to_json(),
+    }
+    json = yield {
         'method': 'HeapProfiler.getHeapObjectId',
         'params': params,
     }
-    json = yield cmd_dict
     return HeapSnapshotObjectId.from_json(json['heapSnapshotObjectId'])
 
 
@@ -186,15 +182,15 @@ def get_object_by_heap_object_id(
     :param object_group: *(Optional)* Symbolic group name that can be used to release multiple objects.
     :returns: Evaluation result.
     '''
-    params: T_JSON_DICT = dict()
-    params['objectId'] = object_id.to_json()
+    params: T_JSON_DICT = {
+        'objectId': object_id.to_json(),
+    }
     if object_group is not None:
         params['objectGroup'] = object_group
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'HeapProfiler.getObjectByHeapObjectId',
         'params': params,
     }
-    json = yield cmd_dict
     return runtime.RemoteObject.from_json(json['result'])
 
 
@@ -204,10 +200,9 @@ def get_sampling_profile() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SamplingH
 
     :returns: Return the sampling profile being collected.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'HeapProfiler.getSamplingProfile',
     }
-    json = yield cmd_dict
     return SamplingHeapProfile.from_json(json['profile'])
 
 
@@ -228,11 +223,10 @@ def start_sampling(
         params['includeObjectsCollectedByMajorGC'] = include_objects_collected_by_major_gc
     if include_objects_collected_by_minor_gc is not None:
         params['includeObjectsCollectedByMinorGC'] = include_objects_collected_by_minor_gc
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'HeapProfiler.startSampling',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def start_tracking_heap_objects(
@@ -244,11 +238,10 @@ def start_tracking_heap_objects(
     params: T_JSON_DICT = dict()
     if track_allocations is not None:
         params['trackAllocations'] = track_allocations
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'HeapProfiler.startTrackingHeapObjects',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def stop_sampling() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SamplingHeapProfile]:
@@ -257,10 +250,9 @@ def stop_sampling() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SamplingHeapProf
 
     :returns: Recorded sampling heap profile.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'HeapProfiler.stopSampling',
     }
-    json = yield cmd_dict
     return SamplingHeapProfile.from_json(json['profile'])
 
 
@@ -285,11 +277,10 @@ def stop_tracking_heap_objects(
         params['captureNumericValue'] = capture_numeric_value
     if expose_internals is not None:
         params['exposeInternals'] = expose_internals
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'HeapProfiler.stopTrackingHeapObjects',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def take_heap_snapshot(
@@ -313,11 +304,10 @@ def take_heap_snapshot(
         params['captureNumericValue'] = capture_numeric_value
     if expose_internals is not None:
         params['exposeInternals'] = expose_internals
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'HeapProfiler.takeHeapSnapshot',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @event_class('HeapProfiler.addHeapSnapshotChunk')
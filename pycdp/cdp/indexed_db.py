@@ -6,10 +6,9 @@
 # CDP domain: IndexedDB (experimental)
 
 from __future__ import annotations
-import enum
 import typing
 from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import T_JSON_DICT
 
 from . import runtime
 from . import storage
@@ -42,7 +41,7 @@ class DatabaseWithObjectStores:
         return cls(
             name=str(json['name']),
             version=float(json['version']),
-            object_stores=[ObjectStore.from_json(i) for i in json['objectStores']],
+            object_stores=list(map(ObjectStore.from_json, json['objectStores'])),
         )
 
 
@@ -77,7 +76,7 @@ class ObjectStore:
             name=str(json['name']),
             key_path=KeyPath.from_json(json['keyPath']),
             auto_increment=bool(json['autoIncrement']),
-            indexes=[ObjectStoreIndex.from_json(i) for i in json['indexes']],
+            indexes=list(map(ObjectStoreIndex.from_json, json['indexes'])),
         )
 
 
@@ -156,7 +155,7 @@ class Key:
             number=float(json['number']) if json.get('number', None) is not None else None,
             string=str(json['string']) if json.get('string', None) is not None else None,
             date=float(json['date']) if json.get('date', None) is not None else None,
-            array=[Key.from_json(i) for i in json['array']] if json.get('array', None) is not None else None,
+            array=list(map(Key.from_json, json['array'])) if json.get('array', None) is not None else None,
         )
 
 
@@ -275,20 +274,20 @@ def clear_object_store(
     :param database_name: Database name.
     :param object_store_name: Object store name.
     '''
-    params: T_JSON_DICT = dict()
+    params: T_JSON_DICT = {
+        'databaseName': database_name,
+        'objectStoreName': object_store_name,
+    }
     if security_origin is not None:
         params['securityOrigin'] = security_origin
     if storage_key is not None:
         params['storageKey'] = storage_key
     if storage_bucket is not None:
         params['storageBucket'] = storage_bucket.to_json()
-    params['databaseName'] = database_name
-    params['objectStoreName'] = object_store_name
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'IndexedDB.clearObjectStore',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def delete_database(
@@ -305,19 +304,19 @@ def delete_database(
     :param storage_bucket: *(Optional)* Storage bucket. If not specified, it uses the default bucket.
     :param database_name: Database name.
     '''
-    params: T_JSON_DICT = dict()
+    params: T_JSON_DICT = {
+        'databaseName': database_name,
+    }
     if security_origin is not None:
         params['securityOrigin'] = security_origin
     if storage_key is not None:
         params['storageKey'] = storage_key
     if storage_bucket is not None:
         params['storageBucket'] = storage_bucket.to_json()
-    params['databaseName'] = database_name
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'IndexedDB.deleteDatabase',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def delete_object_store_entries(
@@ -338,41 +337,39 @@ def delete_object_store_entries(
     :param object_store_name:
     :param key_range: Range of entry keys to delete
     '''
-    params: T_JSON_DICT = dict()
+    params: T_JSON_DICT = {
+        'databaseName': database_name,
+        'objectStoreName': object_store_name,
+        'keyRange': key_range.to_json(),
+    }
     if security_origin is not None:
         params['securityOrigin'] = security_origin
     if storage_key is not None:
         params['storageKey'] = storage_key
     if storage_bucket is not None:
         params['storageBucket'] = storage_bucket.to_json()
-    params['databaseName'] = database_name
-    params['objectStoreName'] = object_store_name
-    params['keyRange'] = key_range.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'IndexedDB.deleteObjectStoreEntries',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Disables events from backend.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'IndexedDB.disable',
     }
-    json = yield cmd_dict
 
 
 def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Enables events from backend.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'IndexedDB.enable',
     }
-    json = yield cmd_dict
 
 
 def request_data(
@@ -403,27 +400,27 @@ def request_data(
         0. **objectStoreDataEntries** - Array of object store data entries.
         1. **hasMore** - If true, there are more entries to fetch in the given range.
     '''
-    params: T_JSON_DICT = dict()
+    params: T_JSON_DICT = {
+        'databaseName': database_name,
+        'objectStoreName': object_store_name,
+        'indexName': index_name,
+        'skipCount': skip_count,
+        'pageSize': page_size,
+    }
     if security_origin is not None:
         params['securityOrigin'] = security_origin
     if storage_key is not None:
         params['storageKey'] = storage_key
     if storage_bucket is not None:
         params['storageBucket'] = storage_bucket.to_json()
-    params['databaseName'] = database_name
-    params['objectStoreName'] = object_store_name
-    params['indexName'] = index_name
-    params['skipCount'] = skip_count
-    params['pageSize'] = page_size
     if key_range is not None:
         params['keyRange'] = key_range.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'IndexedDB.requestData',
         'params': params,
     }
-    json = yield cmd_dict
     return (
-        [DataEntry.from_json(i) for i in json['objectStoreDataEntries']],
+        list(map(DataEntry.from_json, json['objectStoreDataEntries'])),
         bool(json['hasMore'])
     )
 
@@ -448,20 +445,20 @@ def get_metadata(
         0. **entriesCount** - the entries count
         1. **keyGeneratorValue** - the current value of key generator, to become the next inserted key into the object store. Valid if objectStore.autoIncrement is true.
     '''
-    params: T_JSON_DICT = dict()
+    params: T_JSON_DICT = {
+        'databaseName': database_name,
+        'objectStoreName': object_store_name,
+    }
     if security_origin is not None:
         params['securityOrigin'] = security_origin
     if storage_key is not None:
         params['storageKey'] = storage_key
     if storage_bucket is not None:
         params['storageBucket'] = storage_bucket.to_json()
-    params['databaseName'] = database_name
-    params['objectStoreName'] = object_store_name
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'IndexedDB.getMetadata',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         float(json['entriesCount']),
         float(json['keyGeneratorValue'])
@@ -483,19 +480,19 @@ def request_database(
     :param database_name: Database name.
     :returns: Database with an array of object stores.
     '''
-    params: T_JSON_DICT = dict()
+    params: T_JSON_DICT = {
+        'databaseName': database_name,
+    }
     if security_origin is not None:
         params['securityOrigin'] = security_origin
     if storage_key is not None:
         params['storageKey'] = storage_key
     if storage_bucket is not None:
         params['storageBucket'] = storage_bucket.to_json()
-    params['databaseName'] = database_name
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'IndexedDB.requestDatabase',
         'params': params,
     }
-    json = yield cmd_dict
     return DatabaseWithObjectStores.from_json(json['databaseWithObjectStores'])
 
 
@@ -519,9 +516,8 @@ def request_database_names(
         params['storageKey'] = storage_key
     if storage_bucket is not None:
         params['storageBucket'] = storage_bucket.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'IndexedDB.requestDatabaseNames',
         'params': params,
     }
-    json = yield cmd_dict
     return [str(i) for i in json['databaseNames']]
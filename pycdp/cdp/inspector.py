@@ -6,7 +6,6 @@
 # CDP domain: Inspector (experimental)
 
 from __future__ import annotations
-import enum
 import typing
 from dataclasses import dataclass
 from .util import event_class, T_JSON_DICT
@@ -16,20 +15,18 @@ def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Disables inspector domain notifications.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Inspector.disable',
     }
-    json = yield cmd_dict
 
 
 def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Enables inspector domain notifications.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Inspector.enable',
     }
-    json = yield cmd_dict
 
 
 @event_class('Inspector.detached')
@@ -6,10 +6,8 @@
 # CDP domain: IO
 
 from __future__ import annotations
-import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import T_JSON_DICT
 
 from . import runtime
 
@@ -38,13 +36,13 @@ def close(
 
     :param handle: Handle of the stream to close.
     '''
-    params: T_JSON_DICT = dict()
-    params['handle'] = handle.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'handle': handle.to_json(),
+    }
+    yield {
         'method': 'IO.close',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def read(
@@ -64,17 +62,17 @@ def read(
         1. **data** - Data that were read.
         2. **eof** - Set if the end-of-file condition occurred while reading.
     '''
-    params: T_JSON_DICT = dict()
-    params['handle'] = handle.to_json()
+    params: T_JSON_DICT = {
+        'handle': handle.to_json(),
+    }
     if offset is not None:
         params['offset'] = offset
     if size is not None:
         params['size'] = size
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'IO.read',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         bool(json['base64Encoded']) if json.get('base64Encoded', None) is not None else None,
         str(json['data']),
@@ -91,11 +89,11 @@ def resolve_blob(
     :param object_id: Object id of a Blob object wrapper.
     :returns: UUID of the specified Blob.
     '''
-    params: T_JSON_DICT = dict()
-    params['objectId'] = object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'objectId': object_id.to_json(),
+    }
+    json = yield {
         'method': 'IO.resolveBlob',
         'params': params,
     }
-    json = yield cmd_dict
     return str(json['uuid'])
@@ -6,7 +6,6 @@
 # CDP domain: LayerTree (experimental)
 
 from __future__ import annotations
-import enum
 import typing
 from dataclasses import dataclass
 from .util import event_class, T_JSON_DICT
@@ -236,7 +235,7 @@ class Layer:
             anchor_y=float(json['anchorY']) if json.get('anchorY', None) is not None else None,
             anchor_z=float(json['anchorZ']) if json.get('anchorZ', None) is not None else None,
             invisible=bool(json['invisible']) if json.get('invisible', None) is not None else None,
-            scroll_rects=[ScrollRect.from_json(i) for i in json['scrollRects']] if json.get('scrollRects', None) is not None else None,
+            scroll_rects=list(map(ScrollRect.from_json, json['scrollRects'])) if json.get('scrollRects', None) is not None else None,
             sticky_position_constraint=StickyPositionConstraint.from_json(json['stickyPositionConstraint']) if json.get('stickyPositionConstraint', None) is not None else None,
         )
 
@@ -268,13 +267,13 @@ def compositing_reasons(
         0. **compositingReasons** - A list of strings specifying reasons for the given layer to become composited.
         1. **compositingReasonIds** - A list of strings specifying reason IDs for the given layer to become composited.
     '''
-    params: T_JSON_DICT = dict()
-    params['layerId'] = layer_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'layerId': layer_id.to_json(),
+    }
+    json = yield {
         'method': 'LayerTree.compositingReasons',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         [str(i) for i in json['compositingReasons']],
         [str(i) for i in json['compositingReasonIds']]
@@ -285,20 +284,18 @@ def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Disables compositing tree inspection.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'LayerTree.disable',
     }
-    json = yield cmd_dict
 
 
 def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Enables compositing tree inspection.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'LayerTree.enable',
     }
-    json = yield cmd_dict
 
 
 def load_snapshot(
@@ -310,13 +307,13 @@ def load_snapshot(
     :param tiles: An array of tiles composing the snapshot.
     :returns: The id of the snapshot.
     '''
-    params: T_JSON_DICT = dict()
-    params['tiles'] = [i.to_json() for i in tiles]
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'tiles': [i.to_json() for i in tiles],
+    }
+    json = yield {
         'method': 'LayerTree.loadSnapshot',
         'params': params,
     }
-    json = yield cmd_dict
     return SnapshotId.from_json(json['snapshotId'])
 
 
@@ -329,13 +326,13 @@ def make_snapshot(
     :param layer_id: The id of the layer.
     :returns: The id of the layer snapshot.
     '''
-    params: T_JSON_DICT = dict()
-    params['layerId'] = layer_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'layerId': layer_id.to_json(),
+    }
+    json = yield {
         'method': 'LayerTree.makeSnapshot',
         'params': params,
     }
-    json = yield cmd_dict
     return SnapshotId.from_json(json['snapshotId'])
 
 
@@ -352,20 +349,20 @@ def profile_snapshot(
     :param clip_rect: *(Optional)* The clip rectangle to apply when replaying the snapshot.
     :returns: The array of paint profiles, one per run.
     '''
-    params: T_JSON_DICT = dict()
-    params['snapshotId'] = snapshot_id.to_json()
+    params: T_JSON_DICT = {
+        'snapshotId': snapshot_id.to_json(),
+    }
     if min_repeat_count is not None:
         params['minRepeatCount'] = min_repeat_count
     if min_duration is not None:
         params['minDuration'] = min_duration
     if clip_rect is not None:
         params['clipRect'] = clip_rect.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'LayerTree.profileSnapshot',
         'params': params,
     }
-    json = yield cmd_dict
-    return [PaintProfile.from_json(i) for i in json['timings']]
+    return list(map(PaintProfile.from_json, json['timings']))
 
 
 def release_snapshot(
@@ -376,13 +373,13 @@ def release_snapshot(
 
     :param snapshot_id: The id of the layer snapshot.
     '''
-    params: T_JSON_DICT = dict()
-    params['snapshotId'] = snapshot_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'snapshotId': snapshot_id.to_json(),
+    }
+    yield {
         'method': 'LayerTree.releaseSnapshot',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def replay_snapshot(
@@ -400,19 +397,19 @@ def replay_snapshot(
     :param scale: *(Optional)* The scale to apply while replaying (defaults to 1).
     :returns: A data: URL for resulting image.
     '''
-    params: T_JSON_DICT = dict()
-    params['snapshotId'] = snapshot_id.to_json()
+    params: T_JSON_DICT = {
+        'snapshotId': snapshot_id.to_json(),
+    }
     if from_step is not None:
         params['fromStep'] = from_step
     if to_step is not None:
         params['toStep'] = to_step
     if scale is not None:
         params['scale'] = scale
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'LayerTree.replaySnapshot',
         'params': params,
     }
-    json = yield cmd_dict
     return str(json['dataURL'])
 
 
@@ -425,13 +422,13 @@ def snapshot_command_log(
     :param snapshot_id: The id of the layer snapshot.
     :returns: The array of canvas function calls.
     '''
-    params: T_JSON_DICT = dict()
-    params['snapshotId'] = snapshot_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'snapshotId': snapshot_id.to_json(),
+    }
+    json = yield {
         'method': 'LayerTree.snapshotCommandLog',
         'params': params,
     }
-    json = yield cmd_dict
     return [dict(i) for i in json['commandLog']]
 
 
@@ -460,5 +457,5 @@ class LayerTreeDidChange:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LayerTreeDidChange:
         return cls(
-            layers=[Layer.from_json(i) for i in json['layers']] if json.get('layers', None) is not None else None
+            layers=list(map(Layer.from_json, json['layers'])) if json.get('layers', None) is not None else None
         )
@@ -6,7 +6,6 @@
 # CDP domain: Log
 
 from __future__ import annotations
-import enum
 import typing
 from dataclasses import dataclass
 from .util import event_class, T_JSON_DICT
@@ -87,7 +86,7 @@ class LogEntry:
             stack_trace=runtime.StackTrace.from_json(json['stackTrace']) if json.get('stackTrace', None) is not None else None,
             network_request_id=network.RequestId.from_json(json['networkRequestId']) if json.get('networkRequestId', None) is not None else None,
             worker_id=str(json['workerId']) if json.get('workerId', None) is not None else None,
-            args=[runtime.RemoteObject.from_json(i) for i in json['args']] if json.get('args', None) is not None else None,
+            args=list(map(runtime.RemoteObject.from_json, json['args'])) if json.get('args', None) is not None else None,
         )
 
 
@@ -120,20 +119,18 @@ def clear() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Clears the log.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Log.clear',
     }
-    json = yield cmd_dict
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Disables log domain, prevents further log entries from being reported to the client.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Log.disable',
     }
-    json = yield cmd_dict
 
 
 def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -141,10 +138,9 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     Enables log domain, sends the entries collected so far to the client by means of the
     ``entryAdded`` notification.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Log.enable',
     }
-    json = yield cmd_dict
 
 
 def start_violations_report(
@@ -155,23 +151,22 @@ def start_violations_report(
 
     :param config: Configuration for violations.
     '''
-    params: T_JSON_DICT = dict()
-    params['config'] = [i.to_json() for i in config]
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'config': [i.to_json() for i in config],
+    }
+    yield {
         'method': 'Log.startViolationsReport',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def stop_violations_report() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Stop violation reporting.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Log.stopViolationsReport',
     }
-    json = yield cmd_dict
 
 
 @event_class('Log.entryAdded')
@@ -6,7 +6,6 @@
 # CDP domain: Media (experimental)
 
 from __future__ import annotations
-import enum
 import typing
 from dataclasses import dataclass
 from .util import event_class, T_JSON_DICT
@@ -177,8 +176,8 @@ class PlayerError:
         return cls(
             error_type=str(json['errorType']),
             code=int(json['code']),
-            stack=[PlayerErrorSourceLocation.from_json(i) for i in json['stack']],
-            cause=[PlayerError.from_json(i) for i in json['cause']],
+            stack=list(map(PlayerErrorSourceLocation.from_json, json['stack'])),
+            cause=list(map(PlayerError.from_json, json['cause'])),
             data=dict(json['data']),
         )
 
@@ -187,20 +186,18 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Enables the Media domain
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Media.enable',
     }
-    json = yield cmd_dict
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Disables the Media domain.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Media.disable',
     }
-    json = yield cmd_dict
 
 
 @event_class('Media.playerPropertiesChanged')
@@ -217,7 +214,7 @@ class PlayerPropertiesChanged:
     def from_json(cls, json: T_JSON_DICT) -> PlayerPropertiesChanged:
         return cls(
             player_id=PlayerId.from_json(json['playerId']),
-            properties=[PlayerProperty.from_json(i) for i in json['properties']]
+            properties=list(map(PlayerProperty.from_json, json['properties']))
         )
 
 
@@ -235,7 +232,7 @@ class PlayerEventsAdded:
     def from_json(cls, json: T_JSON_DICT) -> PlayerEventsAdded:
         return cls(
             player_id=PlayerId.from_json(json['playerId']),
-            events=[PlayerEvent.from_json(i) for i in json['events']]
+            events=list(map(PlayerEvent.from_json, json['events']))
         )
 
 
@@ -252,7 +249,7 @@ class PlayerMessagesLogged:
     def from_json(cls, json: T_JSON_DICT) -> PlayerMessagesLogged:
         return cls(
             player_id=PlayerId.from_json(json['playerId']),
-            messages=[PlayerMessage.from_json(i) for i in json['messages']]
+            messages=list(map(PlayerMessage.from_json, json['messages']))
         )
 
 
@@ -269,7 +266,7 @@ class PlayerErrorsRaised:
     def from_json(cls, json: T_JSON_DICT) -> PlayerErrorsRaised:
         return cls(
             player_id=PlayerId.from_json(json['playerId']),
-            errors=[PlayerError.from_json(i) for i in json['errors']]
+            errors=list(map(PlayerError.from_json, json['errors']))
         )
 
 
@@ -286,5 +283,5 @@ class PlayersCreated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PlayersCreated:
         return cls(
-            players=[PlayerId.from_json(i) for i in json['players']]
+            players=list(map(PlayerId.from_json, json['players']))
         )
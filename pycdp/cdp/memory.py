@@ -9,7 +9,7 @@ from __future__ import annotations
 import enum
 import typing
 from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import T_JSON_DICT
 
 
 class PressureLevel(enum.Enum):
@@ -75,8 +75,8 @@ class SamplingProfile:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SamplingProfile:
         return cls(
-            samples=[SamplingProfileNode.from_json(i) for i in json['samples']],
-            modules=[Module.from_json(i) for i in json['modules']],
+            samples=list(map(SamplingProfileNode.from_json, json['samples'])),
+            modules=list(map(Module.from_json, json['modules'])),
         )
 
 
@@ -126,10 +126,9 @@ def get_dom_counters() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[
         1. **nodes** - 
         2. **jsEventListeners** - 
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Memory.getDOMCounters',
     }
-    json = yield cmd_dict
     return (
         int(json['documents']),
         int(json['nodes']),
@@ -139,20 +138,18 @@ def get_dom_counters() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[
 
 def prepare_for_leak_detection() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Memory.prepareForLeakDetection',
     }
-    json = yield cmd_dict
 
 
 def forcibly_purge_java_script_memory() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Simulate OomIntervention by purging V8 memory.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Memory.forciblyPurgeJavaScriptMemory',
     }
-    json = yield cmd_dict
 
 
 def set_pressure_notifications_suppressed(
@@ -163,13 +160,13 @@ def set_pressure_notifications_suppressed(
 
     :param suppressed: If true, memory pressure notifications will be suppressed.
     '''
-    params: T_JSON_DICT = dict()
-    params['suppressed'] = suppressed
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'suppressed': suppressed,
+    }
+    yield {
         'method': 'Memory.setPressureNotificationsSuppressed',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def simulate_pressure_notification(
@@ -180,13 +177,13 @@ def simulate_pressure_notification(
 
     :param level: Memory pressure level of the notification.
     '''
-    params: T_JSON_DICT = dict()
-    params['level'] = level.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'level': level.to_json(),
+    }
+    yield {
         'method': 'Memory.simulatePressureNotification',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def start_sampling(
@@ -204,21 +201,19 @@ def start_sampling(
         params['samplingInterval'] = sampling_interval
     if suppress_randomness is not None:
         params['suppressRandomness'] = suppress_randomness
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Memory.startSampling',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def stop_sampling() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Stop collecting native memory profile.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Memory.stopSampling',
     }
-    json = yield cmd_dict
 
 
 def get_all_time_sampling_profile() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SamplingProfile]:
@@ -228,10 +223,9 @@ def get_all_time_sampling_profile() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,
 
     :returns: 
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Memory.getAllTimeSamplingProfile',
     }
-    json = yield cmd_dict
     return SamplingProfile.from_json(json['profile'])
 
 
@@ -242,10 +236,9 @@ def get_browser_sampling_profile() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,S
 
     :returns: 
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Memory.getBrowserSamplingProfile',
     }
-    json = yield cmd_dict
     return SamplingProfile.from_json(json['profile'])
 
 
@@ -256,8 +249,7 @@ def get_sampling_profile() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SamplingP
 
     :returns: 
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Memory.getSamplingProfile',
     }
-    json = yield cmd_dict
     return SamplingProfile.from_json(json['profile'])
@@ -473,7 +473,7 @@ class Request:
             url_fragment=str(json['urlFragment']) if json.get('urlFragment', None) is not None else None,
             post_data=str(json['postData']) if json.get('postData', None) is not None else None,
             has_post_data=bool(json['hasPostData']) if json.get('hasPostData', None) is not None else None,
-            post_data_entries=[PostDataEntry.from_json(i) for i in json['postDataEntries']] if json.get('postDataEntries', None) is not None else None,
+            post_data_entries=list(map(PostDataEntry.from_json, json['postDataEntries'])) if json.get('postDataEntries', None) is not None else None,
             mixed_content_type=security.MixedContentType.from_json(json['mixedContentType']) if json.get('mixedContentType', None) is not None else None,
             is_link_preload=bool(json['isLinkPreload']) if json.get('isLinkPreload', None) is not None else None,
             trust_token_params=TrustTokenParams.from_json(json['trustTokenParams']) if json.get('trustTokenParams', None) is not None else None,
@@ -623,7 +623,7 @@ class SecurityDetails:
             issuer=str(json['issuer']),
             valid_from=TimeSinceEpoch.from_json(json['validFrom']),
             valid_to=TimeSinceEpoch.from_json(json['validTo']),
-            signed_certificate_timestamp_list=[SignedCertificateTimestamp.from_json(i) for i in json['signedCertificateTimestampList']],
+            signed_certificate_timestamp_list=list(map(SignedCertificateTimestamp.from_json, json['signedCertificateTimestampList'])),
             certificate_transparency_compliance=CertificateTransparencyCompliance.from_json(json['certificateTransparencyCompliance']),
             encrypted_client_hello=bool(json['encryptedClientHello']),
             key_exchange_group=str(json['keyExchangeGroup']) if json.get('keyExchangeGroup', None) is not None else None,
@@ -1354,7 +1354,7 @@ class BlockedSetCookieWithReason:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BlockedSetCookieWithReason:
         return cls(
-            blocked_reasons=[SetCookieBlockedReason.from_json(i) for i in json['blockedReasons']],
+            blocked_reasons=list(map(SetCookieBlockedReason.from_json, json['blockedReasons'])),
             cookie_line=str(json['cookieLine']),
             cookie=Cookie.from_json(json['cookie']) if json.get('cookie', None) is not None else None,
         )
@@ -1380,7 +1380,7 @@ class BlockedCookieWithReason:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BlockedCookieWithReason:
         return cls(
-            blocked_reasons=[CookieBlockedReason.from_json(i) for i in json['blockedReasons']],
+            blocked_reasons=list(map(CookieBlockedReason.from_json, json['blockedReasons'])),
             cookie=Cookie.from_json(json['cookie']),
         )
 
@@ -1709,7 +1709,7 @@ class SignedExchangeHeader:
             request_url=str(json['requestUrl']),
             response_code=int(json['responseCode']),
             response_headers=Headers.from_json(json['responseHeaders']),
-            signatures=[SignedExchangeSignature.from_json(i) for i in json['signatures']],
+            signatures=list(map(SignedExchangeSignature.from_json, json['signatures'])),
             header_integrity=str(json['headerIntegrity']),
         )
 
@@ -1799,7 +1799,7 @@ class SignedExchangeInfo:
             outer_response=Response.from_json(json['outerResponse']),
             header=SignedExchangeHeader.from_json(json['header']) if json.get('header', None) is not None else None,
             security_details=SecurityDetails.from_json(json['securityDetails']) if json.get('securityDetails', None) is not None else None,
-            errors=[SignedExchangeError.from_json(i) for i in json['errors']] if json.get('errors', None) is not None else None,
+            errors=list(map(SignedExchangeError.from_json, json['errors'])) if json.get('errors', None) is not None else None,
         )
 
 
@@ -2040,7 +2040,7 @@ class SecurityIsolationStatus:
         return cls(
             coop=CrossOriginOpenerPolicyStatus.from_json(json['coop']) if json.get('coop', None) is not None else None,
             coep=CrossOriginEmbedderPolicyStatus.from_json(json['coep']) if json.get('coep', None) is not None else None,
-            csp=[ContentSecurityPolicyStatus.from_json(i) for i in json['csp']] if json.get('csp', None) is not None else None,
+            csp=list(map(ContentSecurityPolicyStatus.from_json, json['csp'])) if json.get('csp', None) is not None else None,
         )
 
 
@@ -2233,13 +2233,13 @@ def set_accepted_encodings(
 
     :param encodings: List of accepted content encodings.
     '''
-    params: T_JSON_DICT = dict()
-    params['encodings'] = [i.to_json() for i in encodings]
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'encodings': [i.to_json() for i in encodings],
+    }
+    yield {
         'method': 'Network.setAcceptedEncodings',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def clear_accepted_encodings_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -2248,10 +2248,9 @@ def clear_accepted_encodings_override() -> typing.Generator[T_JSON_DICT,T_JSON_D
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Network.clearAcceptedEncodingsOverride',
     }
-    json = yield cmd_dict
 
 
 @deprecated(version="1.3")
@@ -2263,10 +2262,9 @@ def can_clear_browser_cache() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool]:
 
     :returns: True if browser cache can be cleared.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Network.canClearBrowserCache',
     }
-    json = yield cmd_dict
     return bool(json['result'])
 
 
@@ -2279,10 +2277,9 @@ def can_clear_browser_cookies() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool
 
     :returns: True if browser cookies can be cleared.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Network.canClearBrowserCookies',
     }
-    json = yield cmd_dict
     return bool(json['result'])
 
 
@@ -2295,10 +2292,9 @@ def can_emulate_network_conditions() -> typing.Generator[T_JSON_DICT,T_JSON_DICT
 
     :returns: True if emulation of network conditions is supported.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Network.canEmulateNetworkConditions',
     }
-    json = yield cmd_dict
     return bool(json['result'])
 
 
@@ -2306,20 +2302,18 @@ def clear_browser_cache() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Clears browser cache.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Network.clearBrowserCache',
     }
-    json = yield cmd_dict
 
 
 def clear_browser_cookies() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Clears browser cookies.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Network.clearBrowserCookies',
     }
-    json = yield cmd_dict
 
 
 @deprecated(version="1.3")
@@ -2353,8 +2347,9 @@ def continue_intercepted_request(
     :param headers: *(Optional)* If set this allows the request headers to be changed. Must not be set in response to an authChallenge.
     :param auth_challenge_response: *(Optional)* Response to a requestIntercepted with an authChallenge. Must not be set otherwise.
     '''
-    params: T_JSON_DICT = dict()
-    params['interceptionId'] = interception_id.to_json()
+    params: T_JSON_DICT = {
+        'interceptionId': interception_id.to_json(),
+    }
     if error_reason is not None:
         params['errorReason'] = error_reason.to_json()
     if raw_response is not None:
@@ -2369,11 +2364,10 @@ def continue_intercepted_request(
         params['headers'] = headers.to_json()
     if auth_challenge_response is not None:
         params['authChallengeResponse'] = auth_challenge_response.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Network.continueInterceptedRequest',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def delete_cookies(
@@ -2390,29 +2384,28 @@ def delete_cookies(
     :param domain: *(Optional)* If specified, deletes only cookies with the exact domain.
     :param path: *(Optional)* If specified, deletes only cookies with the exact path.
     '''
-    params: T_JSON_DICT = dict()
-    params['name'] = name
+    params: T_JSON_DICT = {
+        'name': name,
+    }
     if url is not None:
         params['url'] = url
     if domain is not None:
         params['domain'] = domain
     if path is not None:
         params['path'] = path
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Network.deleteCookies',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Disables network tracking, prevents network events from being sent to the client.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Network.disable',
     }
-    json = yield cmd_dict
 
 
 def emulate_network_conditions(
@@ -2431,18 +2424,18 @@ def emulate_network_conditions(
     :param upload_throughput: Maximal aggregated upload throughput (bytes/sec).  -1 disables upload throttling.
     :param connection_type: *(Optional)* Connection type if known.
     '''
-    params: T_JSON_DICT = dict()
-    params['offline'] = offline
-    params['latency'] = latency
-    params['downloadThroughput'] = download_throughput
-    params['uploadThroughput'] = upload_throughput
+    params: T_JSON_DICT = {
+        'offline': offline,
+        'latency': latency,
+        'downloadThroughput': download_throughput,
+        'uploadThroughput': upload_throughput,
+    }
     if connection_type is not None:
         params['connectionType'] = connection_type.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Network.emulateNetworkConditions',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def enable(
@@ -2464,11 +2457,10 @@ def enable(
         params['maxResourceBufferSize'] = max_resource_buffer_size
     if max_post_data_size is not None:
         params['maxPostDataSize'] = max_post_data_size
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Network.enable',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @deprecated(version="1.3")
@@ -2482,11 +2474,10 @@ def get_all_cookies() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[Co
 
     :returns: Array of cookie objects.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Network.getAllCookies',
     }
-    json = yield cmd_dict
-    return [Cookie.from_json(i) for i in json['cookies']]
+    return list(map(Cookie.from_json, json['cookies']))
 
 
 def get_certificate(
@@ -2500,13 +2491,13 @@ def get_certificate(
     :param origin: Origin to get certificate for.
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['origin'] = origin
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'origin': origin,
+    }
+    json = yield {
         'method': 'Network.getCertificate',
         'params': params,
     }
-    json = yield cmd_dict
     return [str(i) for i in json['tableNames']]
 
 
@@ -2523,12 +2514,11 @@ def get_cookies(
     params: T_JSON_DICT = dict()
     if urls is not None:
         params['urls'] = [i for i in urls]
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Network.getCookies',
         'params': params,
     }
-    json = yield cmd_dict
-    return [Cookie.from_json(i) for i in json['cookies']]
+    return list(map(Cookie.from_json, json['cookies']))
 
 
 def get_response_body(
@@ -2543,13 +2533,13 @@ def get_response_body(
         0. **body** - Response body.
         1. **base64Encoded** - True, if content was sent as base64.
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'requestId': request_id.to_json(),
+    }
+    json = yield {
         'method': 'Network.getResponseBody',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         str(json['body']),
         bool(json['base64Encoded'])
@@ -2565,13 +2555,13 @@ def get_request_post_data(
     :param request_id: Identifier of the network request to get content for.
     :returns: Request body string, omitting files from multipart requests
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'requestId': request_id.to_json(),
+    }
+    json = yield {
         'method': 'Network.getRequestPostData',
         'params': params,
     }
-    json = yield cmd_dict
     return str(json['postData'])
 
 
@@ -2589,13 +2579,13 @@ def get_response_body_for_interception(
         0. **body** - Response body.
         1. **base64Encoded** - True, if content was sent as base64.
     '''
-    params: T_JSON_DICT = dict()
-    params['interceptionId'] = interception_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'interceptionId': interception_id.to_json(),
+    }
+    json = yield {
         'method': 'Network.getResponseBodyForInterception',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         str(json['body']),
         bool(json['base64Encoded'])
@@ -2616,13 +2606,13 @@ def take_response_body_for_interception_as_stream(
     :param interception_id:
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['interceptionId'] = interception_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'interceptionId': interception_id.to_json(),
+    }
+    json = yield {
         'method': 'Network.takeResponseBodyForInterceptionAsStream',
         'params': params,
     }
-    json = yield cmd_dict
     return io.StreamHandle.from_json(json['stream'])
 
 
@@ -2638,13 +2628,13 @@ def replay_xhr(
 
     :param request_id: Identifier of XHR to replay.
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'requestId': request_id.to_json(),
+    }
+    yield {
         'method': 'Network.replayXHR',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def search_in_response_body(
@@ -2664,19 +2654,19 @@ def search_in_response_body(
     :param is_regex: *(Optional)* If true, treats string parameter as regex.
     :returns: List of search matches.
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
-    params['query'] = query
+    params: T_JSON_DICT = {
+        'requestId': request_id.to_json(),
+        'query': query,
+    }
     if case_sensitive is not None:
         params['caseSensitive'] = case_sensitive
     if is_regex is not None:
         params['isRegex'] = is_regex
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Network.searchInResponseBody',
         'params': params,
     }
-    json = yield cmd_dict
-    return [debugger.SearchMatch.from_json(i) for i in json['result']]
+    return list(map(debugger.SearchMatch.from_json, json['result']))
 
 
 def set_blocked_ur_ls(
@@ -2689,13 +2679,13 @@ def set_blocked_ur_ls(
 
     :param urls: URL patterns to block. Wildcards ('*') are allowed.
     '''
-    params: T_JSON_DICT = dict()
-    params['urls'] = [i for i in urls]
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'urls': [i for i in urls],
+    }
+    yield {
         'method': 'Network.setBlockedURLs',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_bypass_service_worker(
@@ -2708,13 +2698,13 @@ def set_bypass_service_worker(
 
     :param bypass: Bypass service worker and load from network.
     '''
-    params: T_JSON_DICT = dict()
-    params['bypass'] = bypass
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'bypass': bypass,
+    }
+    yield {
         'method': 'Network.setBypassServiceWorker',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_cache_disabled(
@@ -2725,13 +2715,13 @@ def set_cache_disabled(
 
     :param cache_disabled: Cache disabled state.
     '''
-    params: T_JSON_DICT = dict()
-    params['cacheDisabled'] = cache_disabled
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'cacheDisabled': cache_disabled,
+    }
+    yield {
         'method': 'Network.setCacheDisabled',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_cookie(
@@ -2769,9 +2759,10 @@ def set_cookie(
     :param partition_key: **(EXPERIMENTAL)** *(Optional)* Cookie partition key. The site of the top-level URL the browser was visiting at the start of the request to the endpoint that set the cookie. If not set, the cookie will be set as not partitioned.
     :returns: Always set to true. If an error occurs, the response indicates protocol error.
     '''
-    params: T_JSON_DICT = dict()
-    params['name'] = name
-    params['value'] = value
+    params: T_JSON_DICT = {
+        'name': name,
+        'value': value,
+    }
     if url is not None:
         params['url'] = url
     if domain is not None:
@@ -2796,11 +2787,10 @@ def set_cookie(
         params['sourcePort'] = source_port
     if partition_key is not None:
         params['partitionKey'] = partition_key
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Network.setCookie',
         'params': params,
     }
-    json = yield cmd_dict
     return bool(json['success'])
 
 
@@ -2812,13 +2802,13 @@ def set_cookies(
 
     :param cookies: Cookies to be set.
     '''
-    params: T_JSON_DICT = dict()
-    params['cookies'] = [i.to_json() for i in cookies]
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'cookies': [i.to_json() for i in cookies],
+    }
+    yield {
         'method': 'Network.setCookies',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_extra_http_headers(
@@ -2829,13 +2819,13 @@ def set_extra_http_headers(
 
     :param headers: Map with extra HTTP headers.
     '''
-    params: T_JSON_DICT = dict()
-    params['headers'] = headers.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'headers': headers.to_json(),
+    }
+    yield {
         'method': 'Network.setExtraHTTPHeaders',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_attach_debug_stack(
@@ -2848,13 +2838,13 @@ def set_attach_debug_stack(
 
     :param enabled: Whether to attach a page script stack for debugging purpose.
     '''
-    params: T_JSON_DICT = dict()
-    params['enabled'] = enabled
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'enabled': enabled,
+    }
+    yield {
         'method': 'Network.setAttachDebugStack',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @deprecated(version="1.3")
@@ -2871,13 +2861,13 @@ def set_request_interception(
 
     :param patterns: Requests matching any of these patterns will be forwarded and wait for the corresponding continueInterceptedRequest call.
     '''
-    params: T_JSON_DICT = dict()
-    params['patterns'] = [i.to_json() for i in patterns]
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'patterns': [i.to_json() for i in patterns],
+    }
+    yield {
         'method': 'Network.setRequestInterception',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_user_agent_override(
@@ -2894,19 +2884,19 @@ def set_user_agent_override(
     :param platform: *(Optional)* The platform navigator.platform should return.
     :param user_agent_metadata: **(EXPERIMENTAL)** *(Optional)* To be sent in Sec-CH-UA-* headers and returned in navigator.userAgentData
     '''
-    params: T_JSON_DICT = dict()
-    params['userAgent'] = user_agent
+    params: T_JSON_DICT = {
+        'userAgent': user_agent,
+    }
     if accept_language is not None:
         params['acceptLanguage'] = accept_language
     if platform is not None:
         params['platform'] = platform
     if user_agent_metadata is not None:
         params['userAgentMetadata'] = user_agent_metadata.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Network.setUserAgentOverride',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def get_security_isolation_status(
@@ -2923,11 +2913,10 @@ def get_security_isolation_status(
     params: T_JSON_DICT = dict()
     if frame_id is not None:
         params['frameId'] = frame_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Network.getSecurityIsolationStatus',
         'params': params,
     }
-    json = yield cmd_dict
     return SecurityIsolationStatus.from_json(json['status'])
 
 
@@ -2942,13 +2931,13 @@ def enable_reporting_api(
 
     :param enable: Whether to enable or disable events for the Reporting API
     '''
-    params: T_JSON_DICT = dict()
-    params['enable'] = enable
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'enable': enable,
+    }
+    yield {
         'method': 'Network.enableReportingApi',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def load_network_resource(
@@ -2966,16 +2955,16 @@ def load_network_resource(
     :param options: Options for the request.
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
+    params: T_JSON_DICT = {
+        'url': url,
+        'options': options.to_json(),
+    }
     if frame_id is not None:
         params['frameId'] = frame_id.to_json()
-    params['url'] = url
-    params['options'] = options.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Network.loadNetworkResource',
         'params': params,
     }
-    json = yield cmd_dict
     return LoadNetworkResourcePageResult.from_json(json['resource'])
 
 
@@ -3542,7 +3531,7 @@ class RequestWillBeSentExtraInfo:
     def from_json(cls, json: T_JSON_DICT) -> RequestWillBeSentExtraInfo:
         return cls(
             request_id=RequestId.from_json(json['requestId']),
-            associated_cookies=[BlockedCookieWithReason.from_json(i) for i in json['associatedCookies']],
+            associated_cookies=list(map(BlockedCookieWithReason.from_json, json['associatedCookies'])),
             headers=Headers.from_json(json['headers']),
             connect_timing=ConnectTiming.from_json(json['connectTiming']),
             client_security_state=ClientSecurityState.from_json(json['clientSecurityState']) if json.get('clientSecurityState', None) is not None else None,
@@ -3588,7 +3577,7 @@ class ResponseReceivedExtraInfo:
     def from_json(cls, json: T_JSON_DICT) -> ResponseReceivedExtraInfo:
         return cls(
             request_id=RequestId.from_json(json['requestId']),
-            blocked_cookies=[BlockedSetCookieWithReason.from_json(i) for i in json['blockedCookies']],
+            blocked_cookies=list(map(BlockedSetCookieWithReason.from_json, json['blockedCookies'])),
             headers=Headers.from_json(json['headers']),
             resource_ip_address_space=IPAddressSpace.from_json(json['resourceIPAddressSpace']),
             status_code=int(json['statusCode']),
@@ -3785,5 +3774,5 @@ class ReportingApiEndpointsChangedForOrigin:
     def from_json(cls, json: T_JSON_DICT) -> ReportingApiEndpointsChangedForOrigin:
         return cls(
             origin=str(json['origin']),
-            endpoints=[ReportingApiEndpoint.from_json(i) for i in json['endpoints']]
+            endpoints=list(map(ReportingApiEndpoint.from_json, json['endpoints']))
         )
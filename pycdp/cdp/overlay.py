@@ -737,20 +737,18 @@ def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Disables domain notifications.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Overlay.disable',
     }
-    json = yield cmd_dict
 
 
 def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Enables domain notifications.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Overlay.enable',
     }
-    json = yield cmd_dict
 
 
 def get_highlight_object_for_test(
@@ -770,8 +768,9 @@ def get_highlight_object_for_test(
     :param show_accessibility_info: *(Optional)* Whether to show accessibility info (default: true).
     :returns: Highlight data for the node.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+    }
     if include_distance is not None:
         params['includeDistance'] = include_distance
     if include_style is not None:
@@ -780,11 +779,10 @@ def get_highlight_object_for_test(
         params['colorFormat'] = color_format.to_json()
     if show_accessibility_info is not None:
         params['showAccessibilityInfo'] = show_accessibility_info
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Overlay.getHighlightObjectForTest',
         'params': params,
     }
-    json = yield cmd_dict
     return dict(json['highlight'])
 
 
@@ -797,13 +795,13 @@ def get_grid_highlight_objects_for_test(
     :param node_ids: Ids of the node to get highlight object for.
     :returns: Grid Highlight data for the node ids provided.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeIds'] = [i.to_json() for i in node_ids]
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'nodeIds': [i.to_json() for i in node_ids],
+    }
+    json = yield {
         'method': 'Overlay.getGridHighlightObjectsForTest',
         'params': params,
     }
-    json = yield cmd_dict
     return dict(json['highlights'])
 
 
@@ -816,13 +814,13 @@ def get_source_order_highlight_object_for_test(
     :param node_id: Id of the node to highlight.
     :returns: Source order highlight data for the node id provided.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'nodeId': node_id.to_json(),
+    }
+    json = yield {
         'method': 'Overlay.getSourceOrderHighlightObjectForTest',
         'params': params,
     }
-    json = yield cmd_dict
     return dict(json['highlight'])
 
 
@@ -830,10 +828,9 @@ def hide_highlight() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Hides any highlight.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Overlay.hideHighlight',
     }
-    json = yield cmd_dict
 
 
 @deprecated(version="1.3")
@@ -854,17 +851,17 @@ def highlight_frame(
     :param content_color: *(Optional)* The content box highlight fill color (default: transparent).
     :param content_outline_color: *(Optional)* The content box highlight outline color (default: transparent).
     '''
-    params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
+    params: T_JSON_DICT = {
+        'frameId': frame_id.to_json(),
+    }
     if content_color is not None:
         params['contentColor'] = content_color.to_json()
     if content_outline_color is not None:
         params['contentOutlineColor'] = content_outline_color.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Overlay.highlightFrame',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def highlight_node(
@@ -884,8 +881,9 @@ def highlight_node(
     :param object_id: *(Optional)* JavaScript object id of the node to be highlighted.
     :param selector: *(Optional)* Selectors to highlight relevant nodes.
     '''
-    params: T_JSON_DICT = dict()
-    params['highlightConfig'] = highlight_config.to_json()
+    params: T_JSON_DICT = {
+        'highlightConfig': highlight_config.to_json(),
+    }
     if node_id is not None:
         params['nodeId'] = node_id.to_json()
     if backend_node_id is not None:
@@ -894,11 +892,10 @@ def highlight_node(
         params['objectId'] = object_id.to_json()
     if selector is not None:
         params['selector'] = selector
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Overlay.highlightNode',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def highlight_quad(
@@ -913,17 +910,17 @@ def highlight_quad(
     :param color: *(Optional)* The highlight fill color (default: transparent).
     :param outline_color: *(Optional)* The highlight outline color (default: transparent).
     '''
-    params: T_JSON_DICT = dict()
-    params['quad'] = quad.to_json()
+    params: T_JSON_DICT = {
+        'quad': quad.to_json(),
+    }
     if color is not None:
         params['color'] = color.to_json()
     if outline_color is not None:
         params['outlineColor'] = outline_color.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Overlay.highlightQuad',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def highlight_rect(
@@ -944,20 +941,20 @@ def highlight_rect(
     :param color: *(Optional)* The highlight fill color (default: transparent).
     :param outline_color: *(Optional)* The highlight outline color (default: transparent).
     '''
-    params: T_JSON_DICT = dict()
-    params['x'] = x
-    params['y'] = y
-    params['width'] = width
-    params['height'] = height
+    params: T_JSON_DICT = {
+        'x': x,
+        'y': y,
+        'width': width,
+        'height': height,
+    }
     if color is not None:
         params['color'] = color.to_json()
     if outline_color is not None:
         params['outlineColor'] = outline_color.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Overlay.highlightRect',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def highlight_source_order(
@@ -975,19 +972,19 @@ def highlight_source_order(
     :param backend_node_id: *(Optional)* Identifier of the backend node to highlight.
     :param object_id: *(Optional)* JavaScript object id of the node to be highlighted.
     '''
-    params: T_JSON_DICT = dict()
-    params['sourceOrderConfig'] = source_order_config.to_json()
+    params: T_JSON_DICT = {
+        'sourceOrderConfig': source_order_config.to_json(),
+    }
     if node_id is not None:
         params['nodeId'] = node_id.to_json()
     if backend_node_id is not None:
         params['backendNodeId'] = backend_node_id.to_json()
     if object_id is not None:
         params['objectId'] = object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Overlay.highlightSourceOrder',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_inspect_mode(
@@ -1001,15 +998,15 @@ def set_inspect_mode(
     :param mode: Set an inspection mode.
     :param highlight_config: *(Optional)* A descriptor for the highlight appearance of hovered-over nodes. May be omitted if ```enabled == false```.
     '''
-    params: T_JSON_DICT = dict()
-    params['mode'] = mode.to_json()
+    params: T_JSON_DICT = {
+        'mode': mode.to_json(),
+    }
     if highlight_config is not None:
         params['highlightConfig'] = highlight_config.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Overlay.setInspectMode',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_show_ad_highlights(
@@ -1020,13 +1017,13 @@ def set_show_ad_highlights(
 
     :param show: True for showing ad highlights
     '''
-    params: T_JSON_DICT = dict()
-    params['show'] = show
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'show': show,
+    }
+    yield {
         'method': 'Overlay.setShowAdHighlights',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_paused_in_debugger_message(
@@ -1038,11 +1035,10 @@ def set_paused_in_debugger_message(
     params: T_JSON_DICT = dict()
     if message is not None:
         params['message'] = message
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Overlay.setPausedInDebuggerMessage',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_show_debug_borders(
@@ -1053,13 +1049,13 @@ def set_show_debug_borders(
 
     :param show: True for showing debug borders
     '''
-    params: T_JSON_DICT = dict()
-    params['show'] = show
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'show': show,
+    }
+    yield {
         'method': 'Overlay.setShowDebugBorders',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_show_fps_counter(
@@ -1070,13 +1066,13 @@ def set_show_fps_counter(
 
     :param show: True for showing the FPS counter
     '''
-    params: T_JSON_DICT = dict()
-    params['show'] = show
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'show': show,
+    }
+    yield {
         'method': 'Overlay.setShowFPSCounter',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_show_grid_overlays(
@@ -1087,13 +1083,13 @@ def set_show_grid_overlays(
 
     :param grid_node_highlight_configs: An array of node identifiers and descriptors for the highlight appearance.
     '''
-    params: T_JSON_DICT = dict()
-    params['gridNodeHighlightConfigs'] = [i.to_json() for i in grid_node_highlight_configs]
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'gridNodeHighlightConfigs': [i.to_json() for i in grid_node_highlight_configs],
+    }
+    yield {
         'method': 'Overlay.setShowGridOverlays',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_show_flex_overlays(
@@ -1102,13 +1098,13 @@ def set_show_flex_overlays(
     '''
     :param flex_node_highlight_configs: An array of node identifiers and descriptors for the highlight appearance.
     '''
-    params: T_JSON_DICT = dict()
-    params['flexNodeHighlightConfigs'] = [i.to_json() for i in flex_node_highlight_configs]
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'flexNodeHighlightConfigs': [i.to_json() for i in flex_node_highlight_configs],
+    }
+    yield {
         'method': 'Overlay.setShowFlexOverlays',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_show_scroll_snap_overlays(
@@ -1117,13 +1113,13 @@ def set_show_scroll_snap_overlays(
     '''
     :param scroll_snap_highlight_configs: An array of node identifiers and descriptors for the highlight appearance.
     '''
-    params: T_JSON_DICT = dict()
-    params['scrollSnapHighlightConfigs'] = [i.to_json() for i in scroll_snap_highlight_configs]
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'scrollSnapHighlightConfigs': [i.to_json() for i in scroll_snap_highlight_configs],
+    }
+    yield {
         'method': 'Overlay.setShowScrollSnapOverlays',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_show_container_query_overlays(
@@ -1132,13 +1128,13 @@ def set_show_container_query_overlays(
     '''
     :param container_query_highlight_configs: An array of node identifiers and descriptors for the highlight appearance.
     '''
-    params: T_JSON_DICT = dict()
-    params['containerQueryHighlightConfigs'] = [i.to_json() for i in container_query_highlight_configs]
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'containerQueryHighlightConfigs': [i.to_json() for i in container_query_highlight_configs],
+    }
+    yield {
         'method': 'Overlay.setShowContainerQueryOverlays',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_show_paint_rects(
@@ -1149,13 +1145,13 @@ def set_show_paint_rects(
 
     :param result: True for showing paint rectangles
     '''
-    params: T_JSON_DICT = dict()
-    params['result'] = result
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'result': result,
+    }
+    yield {
         'method': 'Overlay.setShowPaintRects',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_show_layout_shift_regions(
@@ -1166,13 +1162,13 @@ def set_show_layout_shift_regions(
 
     :param result: True for showing layout shift regions
     '''
-    params: T_JSON_DICT = dict()
-    params['result'] = result
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'result': result,
+    }
+    yield {
         'method': 'Overlay.setShowLayoutShiftRegions',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_show_scroll_bottleneck_rects(
@@ -1183,13 +1179,13 @@ def set_show_scroll_bottleneck_rects(
 
     :param show: True for showing scroll bottleneck rects
     '''
-    params: T_JSON_DICT = dict()
-    params['show'] = show
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'show': show,
+    }
+    yield {
         'method': 'Overlay.setShowScrollBottleneckRects',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @deprecated(version="1.3")
@@ -1203,13 +1199,13 @@ def set_show_hit_test_borders(
 
     :param show: True for showing hit-test borders
     '''
-    params: T_JSON_DICT = dict()
-    params['show'] = show
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'show': show,
+    }
+    yield {
         'method': 'Overlay.setShowHitTestBorders',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_show_web_vitals(
@@ -1220,13 +1216,13 @@ def set_show_web_vitals(
 
     :param show:
     '''
-    params: T_JSON_DICT = dict()
-    params['show'] = show
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'show': show,
+    }
+    yield {
         'method': 'Overlay.setShowWebVitals',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_show_viewport_size_on_resize(
@@ -1237,13 +1233,13 @@ def set_show_viewport_size_on_resize(
 
     :param show: Whether to paint size or not.
     '''
-    params: T_JSON_DICT = dict()
-    params['show'] = show
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'show': show,
+    }
+    yield {
         'method': 'Overlay.setShowViewportSizeOnResize',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_show_hinge(
@@ -1257,11 +1253,10 @@ def set_show_hinge(
     params: T_JSON_DICT = dict()
     if hinge_config is not None:
         params['hingeConfig'] = hinge_config.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Overlay.setShowHinge',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_show_isolated_elements(
@@ -1272,13 +1267,13 @@ def set_show_isolated_elements(
 
     :param isolated_element_highlight_configs: An array of node identifiers and descriptors for the highlight appearance.
     '''
-    params: T_JSON_DICT = dict()
-    params['isolatedElementHighlightConfigs'] = [i.to_json() for i in isolated_element_highlight_configs]
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'isolatedElementHighlightConfigs': [i.to_json() for i in isolated_element_highlight_configs],
+    }
+    yield {
         'method': 'Overlay.setShowIsolatedElements',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @event_class('Overlay.inspectNodeRequested')
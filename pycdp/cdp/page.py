@@ -84,7 +84,7 @@ class AdFrameStatus:
     def from_json(cls, json: T_JSON_DICT) -> AdFrameStatus:
         return cls(
             ad_frame_type=AdFrameType.from_json(json['adFrameType']),
-            explanations=[AdFrameExplanation.from_json(i) for i in json['explanations']] if json.get('explanations', None) is not None else None,
+            explanations=list(map(AdFrameExplanation.from_json, json['explanations'])) if json.get('explanations', None) is not None else None,
         )
 
 
@@ -454,7 +454,7 @@ class OriginTrial:
         return cls(
             trial_name=str(json['trialName']),
             status=OriginTrialStatus.from_json(json['status']),
-            tokens_with_status=[OriginTrialTokenWithStatus.from_json(i) for i in json['tokensWithStatus']],
+            tokens_with_status=list(map(OriginTrialTokenWithStatus.from_json, json['tokensWithStatus'])),
         )
 
 
@@ -542,7 +542,7 @@ class Frame:
             mime_type=str(json['mimeType']),
             secure_context_type=SecureContextType.from_json(json['secureContextType']),
             cross_origin_isolated_context_type=CrossOriginIsolatedContextType.from_json(json['crossOriginIsolatedContextType']),
-            gated_api_features=[GatedAPIFeatures.from_json(i) for i in json['gatedAPIFeatures']],
+            gated_api_features=list(map(GatedAPIFeatures.from_json, json['gatedAPIFeatures'])),
             parent_id=FrameId.from_json(json['parentId']) if json.get('parentId', None) is not None else None,
             name=str(json['name']) if json.get('name', None) is not None else None,
             url_fragment=str(json['urlFragment']) if json.get('urlFragment', None) is not None else None,
@@ -631,8 +631,8 @@ class FrameResourceTree:
     def from_json(cls, json: T_JSON_DICT) -> FrameResourceTree:
         return cls(
             frame=Frame.from_json(json['frame']),
-            resources=[FrameResource.from_json(i) for i in json['resources']],
-            child_frames=[FrameResourceTree.from_json(i) for i in json['childFrames']] if json.get('childFrames', None) is not None else None,
+            resources=list(map(FrameResource.from_json, json['resources'])),
+            child_frames=list(map(FrameResourceTree.from_json, json['childFrames'])) if json.get('childFrames', None) is not None else None,
         )
 
 
@@ -658,7 +658,7 @@ class FrameTree:
     def from_json(cls, json: T_JSON_DICT) -> FrameTree:
         return cls(
             frame=Frame.from_json(json['frame']),
-            child_frames=[FrameTree.from_json(i) for i in json['childFrames']] if json.get('childFrames', None) is not None else None,
+            child_frames=list(map(FrameTree.from_json, json['childFrames'])) if json.get('childFrames', None) is not None else None,
         )
 
 
@@ -1181,7 +1181,7 @@ class InstallabilityError:
     def from_json(cls, json: T_JSON_DICT) -> InstallabilityError:
         return cls(
             error_id=str(json['errorId']),
-            error_arguments=[InstallabilityErrorArgument.from_json(i) for i in json['errorArguments']],
+            error_arguments=list(map(InstallabilityErrorArgument.from_json, json['errorArguments'])),
         )
 
 
@@ -1474,8 +1474,8 @@ class BackForwardCacheNotRestoredExplanationTree:
     def from_json(cls, json: T_JSON_DICT) -> BackForwardCacheNotRestoredExplanationTree:
         return cls(
             url=str(json['url']),
-            explanations=[BackForwardCacheNotRestoredExplanation.from_json(i) for i in json['explanations']],
-            children=[BackForwardCacheNotRestoredExplanationTree.from_json(i) for i in json['children']],
+            explanations=list(map(BackForwardCacheNotRestoredExplanation.from_json, json['explanations'])),
+            children=list(map(BackForwardCacheNotRestoredExplanationTree.from_json, json['children'])),
         )
 
 
@@ -1493,13 +1493,13 @@ def add_script_to_evaluate_on_load(
     :param script_source:
     :returns: Identifier of the added script.
     '''
-    params: T_JSON_DICT = dict()
-    params['scriptSource'] = script_source
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'scriptSource': script_source,
+    }
+    json = yield {
         'method': 'Page.addScriptToEvaluateOnLoad',
         'params': params,
     }
-    json = yield cmd_dict
     return ScriptIdentifier.from_json(json['identifier'])
 
 
@@ -1518,19 +1518,19 @@ def add_script_to_evaluate_on_new_document(
     :param run_immediately: **(EXPERIMENTAL)** *(Optional)* If true, runs the script immediately on existing execution contexts or worlds. Default: false.
     :returns: Identifier of the added script.
     '''
-    params: T_JSON_DICT = dict()
-    params['source'] = source
+    params: T_JSON_DICT = {
+        'source': source,
+    }
     if world_name is not None:
         params['worldName'] = world_name
     if include_command_line_api is not None:
         params['includeCommandLineAPI'] = include_command_line_api
     if run_immediately is not None:
         params['runImmediately'] = run_immediately
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Page.addScriptToEvaluateOnNewDocument',
         'params': params,
     }
-    json = yield cmd_dict
     return ScriptIdentifier.from_json(json['identifier'])
 
 
@@ -1538,10 +1538,9 @@ def bring_to_front() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Brings page to front (activates tab).
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Page.bringToFront',
     }
-    json = yield cmd_dict
 
 
 def capture_screenshot(
@@ -1576,11 +1575,10 @@ def capture_screenshot(
         params['captureBeyondViewport'] = capture_beyond_viewport
     if optimize_for_speed is not None:
         params['optimizeForSpeed'] = optimize_for_speed
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Page.captureScreenshot',
         'params': params,
     }
-    json = yield cmd_dict
     return str(json['data'])
 
 
@@ -1599,11 +1597,10 @@ def capture_snapshot(
     params: T_JSON_DICT = dict()
     if format_ is not None:
         params['format'] = format_
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Page.captureSnapshot',
         'params': params,
     }
-    json = yield cmd_dict
     return str(json['data'])
 
 
@@ -1616,10 +1613,9 @@ def clear_device_metrics_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Page.clearDeviceMetricsOverride',
     }
-    json = yield cmd_dict
 
 
 @deprecated(version="1.3")
@@ -1631,10 +1627,9 @@ def clear_device_orientation_override() -> typing.Generator[T_JSON_DICT,T_JSON_D
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Page.clearDeviceOrientationOverride',
     }
-    json = yield cmd_dict
 
 
 @deprecated(version="1.3")
@@ -1644,10 +1639,9 @@ def clear_geolocation_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,Non
 
     .. deprecated:: 1.3
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Page.clearGeolocationOverride',
     }
-    json = yield cmd_dict
 
 
 def create_isolated_world(
@@ -1663,17 +1657,17 @@ def create_isolated_world(
     :param grant_univeral_access: *(Optional)* Whether or not universal access should be granted to the isolated world. This is a powerful option, use with caution.
     :returns: Execution context of the isolated world.
     '''
-    params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
+    params: T_JSON_DICT = {
+        'frameId': frame_id.to_json(),
+    }
     if world_name is not None:
         params['worldName'] = world_name
     if grant_univeral_access is not None:
         params['grantUniveralAccess'] = grant_univeral_access
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Page.createIsolatedWorld',
         'params': params,
     }
-    json = yield cmd_dict
     return runtime.ExecutionContextId.from_json(json['executionContextId'])
 
 
@@ -1692,34 +1686,32 @@ def delete_cookie(
     :param cookie_name: Name of the cookie to remove.
     :param url: URL to match cooke domain and path.
     '''
-    params: T_JSON_DICT = dict()
-    params['cookieName'] = cookie_name
-    params['url'] = url
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'cookieName': cookie_name,
+        'url': url,
+    }
+    yield {
         'method': 'Page.deleteCookie',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Disables page domain notifications.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Page.disable',
     }
-    json = yield cmd_dict
 
 
 def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Enables page domain notifications.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Page.enable',
     }
-    json = yield cmd_dict
 
 
 def get_app_manifest() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[str, typing.List[AppManifestError], typing.Optional[str], typing.Optional[AppManifestParsedProperties]]]:
@@ -1733,13 +1725,12 @@ def get_app_manifest() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[
         2. **data** - *(Optional)* Manifest content.
         3. **parsed** - *(Optional)* Parsed manifest properties
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Page.getAppManifest',
     }
-    json = yield cmd_dict
     return (
         str(json['url']),
-        [AppManifestError.from_json(i) for i in json['errors']],
+        list(map(AppManifestError.from_json, json['errors'])),
         str(json['data']) if json.get('data', None) is not None else None,
         AppManifestParsedProperties.from_json(json['parsed']) if json.get('parsed', None) is not None else None
     )
@@ -1753,11 +1744,10 @@ def get_installability_errors() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typi
 
     :returns: 
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Page.getInstallabilityErrors',
     }
-    json = yield cmd_dict
-    return [InstallabilityError.from_json(i) for i in json['installabilityErrors']]
+    return list(map(InstallabilityError.from_json, json['installabilityErrors']))
 
 
 @deprecated(version="1.3")
@@ -1771,10 +1761,9 @@ def get_manifest_icons() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Opti
 
     :returns: 
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Page.getManifestIcons',
     }
-    json = yield cmd_dict
     return str(json['primaryIcon']) if json.get('primaryIcon', None) is not None else None
 
 
@@ -1790,10 +1779,9 @@ def get_app_id() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing
         0. **appId** - *(Optional)* App id, either from manifest's id attribute or computed from start_url
         1. **recommendedId** - *(Optional)* Recommendation for manifest's id attribute to match current id computed from start_url
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Page.getAppId',
     }
-    json = yield cmd_dict
     return (
         str(json['appId']) if json.get('appId', None) is not None else None,
         str(json['recommendedId']) if json.get('recommendedId', None) is not None else None
@@ -1811,13 +1799,13 @@ def get_ad_script_id(
     :param frame_id:
     :returns: *(Optional)* Identifies the bottom-most script which caused the frame to be labelled as an ad. Only sent if frame is labelled as an ad and id is available.
     '''
-    params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'frameId': frame_id.to_json(),
+    }
+    json = yield {
         'method': 'Page.getAdScriptId',
         'params': params,
     }
-    json = yield cmd_dict
     return AdScriptId.from_json(json['adScriptId']) if json.get('adScriptId', None) is not None else None
 
 
@@ -1834,11 +1822,10 @@ def get_cookies() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[networ
 
     :returns: Array of cookie objects.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Page.getCookies',
     }
-    json = yield cmd_dict
-    return [network.Cookie.from_json(i) for i in json['cookies']]
+    return list(map(network.Cookie.from_json, json['cookies']))
 
 
 def get_frame_tree() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,FrameTree]:
@@ -1847,10 +1834,9 @@ def get_frame_tree() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,FrameTree]:
 
     :returns: Present frame tree structure.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Page.getFrameTree',
     }
-    json = yield cmd_dict
     return FrameTree.from_json(json['frameTree'])
 
 
@@ -1867,10 +1853,9 @@ def get_layout_metrics() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tupl
         4. **cssVisualViewport** - Metrics relating to the visual viewport in CSS pixels.
         5. **cssContentSize** - Size of scrollable area in CSS pixels.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Page.getLayoutMetrics',
     }
-    json = yield cmd_dict
     return (
         LayoutViewport.from_json(json['layoutViewport']),
         VisualViewport.from_json(json['visualViewport']),
@@ -1890,13 +1875,12 @@ def get_navigation_history() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.
         0. **currentIndex** - Index of the current navigation history entry.
         1. **entries** - Array of navigation history entries.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Page.getNavigationHistory',
     }
-    json = yield cmd_dict
     return (
         int(json['currentIndex']),
-        [NavigationEntry.from_json(i) for i in json['entries']]
+        list(map(NavigationEntry.from_json, json['entries']))
     )
 
 
@@ -1904,10 +1888,9 @@ def reset_navigation_history() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]
     '''
     Resets navigation history for the current page.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Page.resetNavigationHistory',
     }
-    json = yield cmd_dict
 
 
 def get_resource_content(
@@ -1926,14 +1909,14 @@ def get_resource_content(
         0. **content** - Resource content.
         1. **base64Encoded** - True, if content was served as base64.
     '''
-    params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
-    params['url'] = url
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'frameId': frame_id.to_json(),
+        'url': url,
+    }
+    json = yield {
         'method': 'Page.getResourceContent',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         str(json['content']),
         bool(json['base64Encoded'])
@@ -1948,10 +1931,9 @@ def get_resource_tree() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,FrameResourc
 
     :returns: Present frame / resource tree structure.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Page.getResourceTree',
     }
-    json = yield cmd_dict
     return FrameResourceTree.from_json(json['frameTree'])
 
 
@@ -1965,15 +1947,15 @@ def handle_java_script_dialog(
     :param accept: Whether to accept or dismiss the dialog.
     :param prompt_text: *(Optional)* The text to enter into the dialog prompt before accepting. Used only if this is a prompt dialog.
     '''
-    params: T_JSON_DICT = dict()
-    params['accept'] = accept
+    params: T_JSON_DICT = {
+        'accept': accept,
+    }
     if prompt_text is not None:
         params['promptText'] = prompt_text
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Page.handleJavaScriptDialog',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def navigate(
@@ -1997,8 +1979,9 @@ def navigate(
         1. **loaderId** - *(Optional)* Loader identifier. This is omitted in case of same-document navigation, as the previously committed loaderId would not change.
         2. **errorText** - *(Optional)* User friendly error message, present if and only if navigation has failed.
     '''
-    params: T_JSON_DICT = dict()
-    params['url'] = url
+    params: T_JSON_DICT = {
+        'url': url,
+    }
     if referrer is not None:
         params['referrer'] = referrer
     if transition_type is not None:
@@ -2007,11 +1990,10 @@ def navigate(
         params['frameId'] = frame_id.to_json()
     if referrer_policy is not None:
         params['referrerPolicy'] = referrer_policy.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Page.navigate',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         FrameId.from_json(json['frameId']),
         network.LoaderId.from_json(json['loaderId']) if json.get('loaderId', None) is not None else None,
@@ -2027,13 +2009,13 @@ def navigate_to_history_entry(
 
     :param entry_id: Unique id of the entry to navigate to.
     '''
-    params: T_JSON_DICT = dict()
-    params['entryId'] = entry_id
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'entryId': entry_id,
+    }
+    yield {
         'method': 'Page.navigateToHistoryEntry',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def print_to_pdf(
@@ -2111,11 +2093,10 @@ def print_to_pdf(
         params['transferMode'] = transfer_mode
     if generate_tagged_pdf is not None:
         params['generateTaggedPDF'] = generate_tagged_pdf
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Page.printToPDF',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         str(json['data']),
         io.StreamHandle.from_json(json['stream']) if json.get('stream', None) is not None else None
@@ -2137,11 +2118,10 @@ def reload(
         params['ignoreCache'] = ignore_cache
     if script_to_evaluate_on_load is not None:
         params['scriptToEvaluateOnLoad'] = script_to_evaluate_on_load
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Page.reload',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @deprecated(version="1.3")
@@ -2157,13 +2137,13 @@ def remove_script_to_evaluate_on_load(
 
     :param identifier:
     '''
-    params: T_JSON_DICT = dict()
-    params['identifier'] = identifier.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'identifier': identifier.to_json(),
+    }
+    yield {
         'method': 'Page.removeScriptToEvaluateOnLoad',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def remove_script_to_evaluate_on_new_document(
@@ -2174,13 +2154,13 @@ def remove_script_to_evaluate_on_new_document(
 
     :param identifier:
     '''
-    params: T_JSON_DICT = dict()
-    params['identifier'] = identifier.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'identifier': identifier.to_json(),
+    }
+    yield {
         'method': 'Page.removeScriptToEvaluateOnNewDocument',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def screencast_frame_ack(
@@ -2193,13 +2173,13 @@ def screencast_frame_ack(
 
     :param session_id: Frame number.
     '''
-    params: T_JSON_DICT = dict()
-    params['sessionId'] = session_id
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'sessionId': session_id,
+    }
+    yield {
         'method': 'Page.screencastFrameAck',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def search_in_resource(
@@ -2221,20 +2201,20 @@ def search_in_resource(
     :param is_regex: *(Optional)* If true, treats string parameter as regex.
     :returns: List of search matches.
     '''
-    params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
-    params['url'] = url
-    params['query'] = query
+    params: T_JSON_DICT = {
+        'frameId': frame_id.to_json(),
+        'url': url,
+        'query': query,
+    }
     if case_sensitive is not None:
         params['caseSensitive'] = case_sensitive
     if is_regex is not None:
         params['isRegex'] = is_regex
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Page.searchInResource',
         'params': params,
     }
-    json = yield cmd_dict
-    return [debugger.SearchMatch.from_json(i) for i in json['result']]
+    return list(map(debugger.SearchMatch.from_json, json['result']))
 
 
 def set_ad_blocking_enabled(
@@ -2247,13 +2227,13 @@ def set_ad_blocking_enabled(
 
     :param enabled: Whether to block ads.
     '''
-    params: T_JSON_DICT = dict()
-    params['enabled'] = enabled
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'enabled': enabled,
+    }
+    yield {
         'method': 'Page.setAdBlockingEnabled',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_bypass_csp(
@@ -2266,13 +2246,13 @@ def set_bypass_csp(
 
     :param enabled: Whether to bypass page CSP.
     '''
-    params: T_JSON_DICT = dict()
-    params['enabled'] = enabled
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'enabled': enabled,
+    }
+    yield {
         'method': 'Page.setBypassCSP',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def get_permissions_policy_state(
@@ -2286,14 +2266,14 @@ def get_permissions_policy_state(
     :param frame_id:
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'frameId': frame_id.to_json(),
+    }
+    json = yield {
         'method': 'Page.getPermissionsPolicyState',
         'params': params,
     }
-    json = yield cmd_dict
-    return [PermissionsPolicyFeatureState.from_json(i) for i in json['states']]
+    return list(map(PermissionsPolicyFeatureState.from_json, json['states']))
 
 
 def get_origin_trials(
@@ -2307,14 +2287,14 @@ def get_origin_trials(
     :param frame_id:
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'frameId': frame_id.to_json(),
+    }
+    json = yield {
         'method': 'Page.getOriginTrials',
         'params': params,
     }
-    json = yield cmd_dict
-    return [OriginTrial.from_json(i) for i in json['originTrials']]
+    return list(map(OriginTrial.from_json, json['originTrials']))
 
 
 @deprecated(version="1.3")
@@ -2354,11 +2334,12 @@ def set_device_metrics_override(
     :param screen_orientation: *(Optional)* Screen orientation override.
     :param viewport: *(Optional)* The viewport dimensions and scale. If not set, the override is cleared.
     '''
-    params: T_JSON_DICT = dict()
-    params['width'] = width
-    params['height'] = height
-    params['deviceScaleFactor'] = device_scale_factor
-    params['mobile'] = mobile
+    params: T_JSON_DICT = {
+        'width': width,
+        'height': height,
+        'deviceScaleFactor': device_scale_factor,
+        'mobile': mobile,
+    }
     if scale is not None:
         params['scale'] = scale
     if screen_width is not None:
@@ -2375,11 +2356,10 @@ def set_device_metrics_override(
         params['screenOrientation'] = screen_orientation.to_json()
     if viewport is not None:
         params['viewport'] = viewport.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Page.setDeviceMetricsOverride',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @deprecated(version="1.3")
@@ -2399,15 +2379,15 @@ def set_device_orientation_override(
     :param beta: Mock beta
     :param gamma: Mock gamma
     '''
-    params: T_JSON_DICT = dict()
-    params['alpha'] = alpha
-    params['beta'] = beta
-    params['gamma'] = gamma
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'alpha': alpha,
+        'beta': beta,
+        'gamma': gamma,
+    }
+    yield {
         'method': 'Page.setDeviceOrientationOverride',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_font_families(
@@ -2422,15 +2402,15 @@ def set_font_families(
     :param font_families: Specifies font families to set. If a font family is not specified, it won't be changed.
     :param for_scripts: *(Optional)* Specifies font families to set for individual scripts.
     '''
-    params: T_JSON_DICT = dict()
-    params['fontFamilies'] = font_families.to_json()
+    params: T_JSON_DICT = {
+        'fontFamilies': font_families.to_json(),
+    }
     if for_scripts is not None:
         params['forScripts'] = [i.to_json() for i in for_scripts]
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Page.setFontFamilies',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_font_sizes(
@@ -2443,13 +2423,13 @@ def set_font_sizes(
 
     :param font_sizes: Specifies font sizes to set. If a font size is not specified, it won't be changed.
     '''
-    params: T_JSON_DICT = dict()
-    params['fontSizes'] = font_sizes.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'fontSizes': font_sizes.to_json(),
+    }
+    yield {
         'method': 'Page.setFontSizes',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_document_content(
@@ -2462,14 +2442,14 @@ def set_document_content(
     :param frame_id: Frame id to set HTML for.
     :param html: HTML content to set.
     '''
-    params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
-    params['html'] = html
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'frameId': frame_id.to_json(),
+        'html': html,
+    }
+    yield {
         'method': 'Page.setDocumentContent',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @deprecated(version="1.3")
@@ -2487,15 +2467,15 @@ def set_download_behavior(
     :param behavior: Whether to allow all or deny all download requests, or use default Chrome behavior if available (otherwise deny).
     :param download_path: *(Optional)* The default path to save downloaded files to. This is required if behavior is set to 'allow'
     '''
-    params: T_JSON_DICT = dict()
-    params['behavior'] = behavior
+    params: T_JSON_DICT = {
+        'behavior': behavior,
+    }
     if download_path is not None:
         params['downloadPath'] = download_path
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Page.setDownloadBehavior',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @deprecated(version="1.3")
@@ -2521,11 +2501,10 @@ def set_geolocation_override(
         params['longitude'] = longitude
     if accuracy is not None:
         params['accuracy'] = accuracy
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Page.setGeolocationOverride',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_lifecycle_events_enabled(
@@ -2538,13 +2517,13 @@ def set_lifecycle_events_enabled(
 
     :param enabled: If true, starts emitting lifecycle events.
     '''
-    params: T_JSON_DICT = dict()
-    params['enabled'] = enabled
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'enabled': enabled,
+    }
+    yield {
         'method': 'Page.setLifecycleEventsEnabled',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @deprecated(version="1.3")
@@ -2562,15 +2541,15 @@ def set_touch_emulation_enabled(
     :param enabled: Whether the touch event emulation should be enabled.
     :param configuration: *(Optional)* Touch/gesture events configuration. Default: current platform.
     '''
-    params: T_JSON_DICT = dict()
-    params['enabled'] = enabled
+    params: T_JSON_DICT = {
+        'enabled': enabled,
+    }
     if configuration is not None:
         params['configuration'] = configuration
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Page.setTouchEmulationEnabled',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def start_screencast(
@@ -2602,21 +2581,19 @@ def start_screencast(
         params['maxHeight'] = max_height
     if every_nth_frame is not None:
         params['everyNthFrame'] = every_nth_frame
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Page.startScreencast',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def stop_loading() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Force the page stop all navigations and pending resource fetches.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Page.stopLoading',
     }
-    json = yield cmd_dict
 
 
 def crash() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -2625,10 +2602,9 @@ def crash() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Page.crash',
     }
-    json = yield cmd_dict
 
 
 def close() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -2637,10 +2613,9 @@ def close() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Page.close',
     }
-    json = yield cmd_dict
 
 
 def set_web_lifecycle_state(
@@ -2655,13 +2630,13 @@ def set_web_lifecycle_state(
 
     :param state: Target lifecycle state
     '''
-    params: T_JSON_DICT = dict()
-    params['state'] = state
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'state': state,
+    }
+    yield {
         'method': 'Page.setWebLifecycleState',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def stop_screencast() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -2670,10 +2645,9 @@ def stop_screencast() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Page.stopScreencast',
     }
-    json = yield cmd_dict
 
 
 def produce_compilation_cache(
@@ -2691,13 +2665,13 @@ def produce_compilation_cache(
 
     :param scripts:
     '''
-    params: T_JSON_DICT = dict()
-    params['scripts'] = [i.to_json() for i in scripts]
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'scripts': [i.to_json() for i in scripts],
+    }
+    yield {
         'method': 'Page.produceCompilationCache',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def add_compilation_cache(
@@ -2713,14 +2687,14 @@ def add_compilation_cache(
     :param url:
     :param data: Base64-encoded data (Encoded as a base64 string when passed over JSON)
     '''
-    params: T_JSON_DICT = dict()
-    params['url'] = url
-    params['data'] = data
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'url': url,
+        'data': data,
+    }
+    yield {
         'method': 'Page.addCompilationCache',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def clear_compilation_cache() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -2729,10 +2703,9 @@ def clear_compilation_cache() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Page.clearCompilationCache',
     }
-    json = yield cmd_dict
 
 
 def set_spc_transaction_mode(
@@ -2746,13 +2719,13 @@ def set_spc_transaction_mode(
 
     :param mode:
     '''
-    params: T_JSON_DICT = dict()
-    params['mode'] = mode.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'mode': mode.to_json(),
+    }
+    yield {
         'method': 'Page.setSPCTransactionMode',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_rph_registration_mode(
@@ -2766,13 +2739,13 @@ def set_rph_registration_mode(
 
     :param mode:
     '''
-    params: T_JSON_DICT = dict()
-    params['mode'] = mode.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'mode': mode.to_json(),
+    }
+    yield {
         'method': 'Page.setRPHRegistrationMode',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def generate_test_report(
@@ -2787,15 +2760,15 @@ def generate_test_report(
     :param message: Message to be displayed in the report.
     :param group: *(Optional)* Specifies the endpoint group to deliver the report to.
     '''
-    params: T_JSON_DICT = dict()
-    params['message'] = message
+    params: T_JSON_DICT = {
+        'message': message,
+    }
     if group is not None:
         params['group'] = group
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Page.generateTestReport',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def wait_for_debugger() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -2804,10 +2777,9 @@ def wait_for_debugger() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Page.waitForDebugger',
     }
-    json = yield cmd_dict
 
 
 def set_intercept_file_chooser_dialog(
@@ -2822,13 +2794,13 @@ def set_intercept_file_chooser_dialog(
 
     :param enabled:
     '''
-    params: T_JSON_DICT = dict()
-    params['enabled'] = enabled
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'enabled': enabled,
+    }
+    yield {
         'method': 'Page.setInterceptFileChooserDialog',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_prerendering_allowed(
@@ -2847,13 +2819,13 @@ def set_prerendering_allowed(
 
     :param is_allowed:
     '''
-    params: T_JSON_DICT = dict()
-    params['isAllowed'] = is_allowed
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'isAllowed': is_allowed,
+    }
+    yield {
         'method': 'Page.setPrerenderingAllowed',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @event_class('Page.domContentEventFired')
@@ -3278,7 +3250,7 @@ class BackForwardCacheNotUsed:
         return cls(
             loader_id=network.LoaderId.from_json(json['loaderId']),
             frame_id=FrameId.from_json(json['frameId']),
-            not_restored_explanations=[BackForwardCacheNotRestoredExplanation.from_json(i) for i in json['notRestoredExplanations']],
+            not_restored_explanations=list(map(BackForwardCacheNotRestoredExplanation.from_json, json['notRestoredExplanations'])),
             not_restored_explanations_tree=BackForwardCacheNotRestoredExplanationTree.from_json(json['notRestoredExplanationsTree']) if json.get('notRestoredExplanationsTree', None) is not None else None
         )
 
@@ -6,7 +6,6 @@
 # CDP domain: Performance
 
 from __future__ import annotations
-import enum
 import typing
 from dataclasses import dataclass
 from .util import event_class, T_JSON_DICT
@@ -44,10 +43,9 @@ def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Disable collecting and reporting metrics.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Performance.disable',
     }
-    json = yield cmd_dict
 
 
 def enable(
@@ -61,11 +59,10 @@ def enable(
     params: T_JSON_DICT = dict()
     if time_domain is not None:
         params['timeDomain'] = time_domain
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Performance.enable',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @deprecated(version="1.3")
@@ -83,13 +80,13 @@ def set_time_domain(
 
     :param time_domain: Time domain
     '''
-    params: T_JSON_DICT = dict()
-    params['timeDomain'] = time_domain
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'timeDomain': time_domain,
+    }
+    yield {
         'method': 'Performance.setTimeDomain',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def get_metrics() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[Metric]]:
@@ -98,11 +95,10 @@ def get_metrics() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[Metric
 
     :returns: Current values for run-time metrics.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Performance.getMetrics',
     }
-    json = yield cmd_dict
-    return [Metric.from_json(i) for i in json['metrics']]
+    return list(map(Metric.from_json, json['metrics']))
 
 
 @event_class('Performance.metrics')
@@ -119,6 +115,6 @@ class Metrics:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Metrics:
         return cls(
-            metrics=[Metric.from_json(i) for i in json['metrics']],
+            metrics=list(map(Metric.from_json, json['metrics'])),
             title=str(json['title'])
         )
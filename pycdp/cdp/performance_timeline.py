@@ -6,7 +6,6 @@
 # CDP domain: PerformanceTimeline (experimental)
 
 from __future__ import annotations
-import enum
 import typing
 from dataclasses import dataclass
 from .util import event_class, T_JSON_DICT
@@ -114,7 +113,7 @@ class LayoutShift:
             value=float(json['value']),
             had_recent_input=bool(json['hadRecentInput']),
             last_input_time=network.TimeSinceEpoch.from_json(json['lastInputTime']),
-            sources=[LayoutShiftAttribution.from_json(i) for i in json['sources']],
+            sources=list(map(LayoutShiftAttribution.from_json, json['sources'])),
         )
 
 
@@ -176,13 +175,13 @@ def enable(
 
     :param event_types: The types of event to report, as specified in https://w3c.github.io/performance-timeline/#dom-performanceentry-entrytype The specified filter overrides any previous filters, passing empty filter disables recording. Note that not all types exposed to the web platform are currently supported.
     '''
-    params: T_JSON_DICT = dict()
-    params['eventTypes'] = [i for i in event_types]
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'eventTypes': [i for i in event_types],
+    }
+    yield {
         'method': 'PerformanceTimeline.enable',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @event_class('PerformanceTimeline.timelineEventAdded')
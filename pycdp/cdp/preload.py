@@ -212,8 +212,8 @@ class PreloadingAttemptSource:
     def from_json(cls, json: T_JSON_DICT) -> PreloadingAttemptSource:
         return cls(
             key=PreloadingAttemptKey.from_json(json['key']),
-            rule_set_ids=[RuleSetId.from_json(i) for i in json['ruleSetIds']],
-            node_ids=[dom.BackendNodeId.from_json(i) for i in json['nodeIds']],
+            rule_set_ids=list(map(RuleSetId.from_json, json['ruleSetIds'])),
+            node_ids=list(map(dom.BackendNodeId.from_json, json['nodeIds'])),
         )
 
 
@@ -359,18 +359,16 @@ class PrefetchStatus(enum.Enum):
 
 def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Preload.enable',
     }
-    json = yield cmd_dict
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Preload.disable',
     }
-    json = yield cmd_dict
 
 
 @event_class('Preload.ruleSetUpdated')
@@ -511,5 +509,5 @@ class PreloadingAttemptSourcesUpdated:
     def from_json(cls, json: T_JSON_DICT) -> PreloadingAttemptSourcesUpdated:
         return cls(
             loader_id=network.LoaderId.from_json(json['loaderId']),
-            preloading_attempt_sources=[PreloadingAttemptSource.from_json(i) for i in json['preloadingAttemptSources']]
+            preloading_attempt_sources=list(map(PreloadingAttemptSource.from_json, json['preloadingAttemptSources']))
         )
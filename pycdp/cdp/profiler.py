@@ -6,7 +6,6 @@
 # CDP domain: Profiler
 
 from __future__ import annotations
-import enum
 import typing
 from dataclasses import dataclass
 from .util import event_class, T_JSON_DICT
@@ -61,7 +60,7 @@ class ProfileNode:
             hit_count=int(json['hitCount']) if json.get('hitCount', None) is not None else None,
             children=[int(i) for i in json['children']] if json.get('children', None) is not None else None,
             deopt_reason=str(json['deoptReason']) if json.get('deoptReason', None) is not None else None,
-            position_ticks=[PositionTickInfo.from_json(i) for i in json['positionTicks']] if json.get('positionTicks', None) is not None else None,
+            position_ticks=list(map(PositionTickInfo.from_json, json['positionTicks'])) if json.get('positionTicks', None) is not None else None,
         )
 
 
@@ -100,7 +99,7 @@ class Profile:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Profile:
         return cls(
-            nodes=[ProfileNode.from_json(i) for i in json['nodes']],
+            nodes=list(map(ProfileNode.from_json, json['nodes'])),
             start_time=float(json['startTime']),
             end_time=float(json['endTime']),
             samples=[int(i) for i in json['samples']] if json.get('samples', None) is not None else None,
@@ -188,7 +187,7 @@ class FunctionCoverage:
     def from_json(cls, json: T_JSON_DICT) -> FunctionCoverage:
         return cls(
             function_name=str(json['functionName']),
-            ranges=[CoverageRange.from_json(i) for i in json['ranges']],
+            ranges=list(map(CoverageRange.from_json, json['ranges'])),
             is_block_coverage=bool(json['isBlockCoverage']),
         )
 
@@ -219,24 +218,22 @@ class ScriptCoverage:
         return cls(
             script_id=runtime.ScriptId.from_json(json['scriptId']),
             url=str(json['url']),
-            functions=[FunctionCoverage.from_json(i) for i in json['functions']],
+            functions=list(map(FunctionCoverage.from_json, json['functions'])),
         )
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Profiler.disable',
     }
-    json = yield cmd_dict
 
 
 def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Profiler.enable',
     }
-    json = yield cmd_dict
 
 
 def get_best_effort_coverage() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[ScriptCoverage]]:
@@ -246,11 +243,10 @@ def get_best_effort_coverage() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typin
 
     :returns: Coverage data for the current isolate.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Profiler.getBestEffortCoverage',
     }
-    json = yield cmd_dict
-    return [ScriptCoverage.from_json(i) for i in json['result']]
+    return list(map(ScriptCoverage.from_json, json['result']))
 
 
 def set_sampling_interval(
@@ -261,21 +257,20 @@ def set_sampling_interval(
 
     :param interval: New sampling interval in microseconds.
     '''
-    params: T_JSON_DICT = dict()
-    params['interval'] = interval
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'interval': interval,
+    }
+    yield {
         'method': 'Profiler.setSamplingInterval',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def start() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Profiler.start',
     }
-    json = yield cmd_dict
 
 
 def start_precise_coverage(
@@ -300,11 +295,10 @@ def start_precise_coverage(
         params['detailed'] = detailed
     if allow_triggered_updates is not None:
         params['allowTriggeredUpdates'] = allow_triggered_updates
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Profiler.startPreciseCoverage',
         'params': params,
     }
-    json = yield cmd_dict
     return float(json['timestamp'])
 
 
@@ -314,10 +308,9 @@ def stop() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,Profile]:
 
     :returns: Recorded profile.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Profiler.stop',
     }
-    json = yield cmd_dict
     return Profile.from_json(json['profile'])
 
 
@@ -326,10 +319,9 @@ def stop_precise_coverage() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     Disable precise code coverage. Disabling releases unnecessary execution count records and allows
     executing optimized code.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Profiler.stopPreciseCoverage',
     }
-    json = yield cmd_dict
 
 
 def take_precise_coverage() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.List[ScriptCoverage], float]]:
@@ -342,12 +334,11 @@ def take_precise_coverage() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.T
         0. **result** - Coverage data for the current isolate.
         1. **timestamp** - Monotonically increasing time (in seconds) when the coverage update was taken in the backend.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Profiler.takePreciseCoverage',
     }
-    json = yield cmd_dict
     return (
-        [ScriptCoverage.from_json(i) for i in json['result']],
+        list(map(ScriptCoverage.from_json, json['result'])),
         float(json['timestamp'])
     )
 
@@ -416,5 +407,5 @@ class PreciseCoverageDeltaUpdate:
         return cls(
             timestamp=float(json['timestamp']),
             occasion=str(json['occasion']),
-            result=[ScriptCoverage.from_json(i) for i in json['result']]
+            result=list(map(ScriptCoverage.from_json, json['result']))
         )
@@ -6,7 +6,6 @@
 # CDP domain: Runtime
 
 from __future__ import annotations
-import enum
 import typing
 from dataclasses import dataclass
 from .util import event_class, T_JSON_DICT
@@ -278,10 +277,10 @@ class ObjectPreview:
         return cls(
             type_=str(json['type']),
             overflow=bool(json['overflow']),
-            properties=[PropertyPreview.from_json(i) for i in json['properties']],
+            properties=list(map(PropertyPreview.from_json, json['properties'])),
             subtype=str(json['subtype']) if json.get('subtype', None) is not None else None,
             description=str(json['description']) if json.get('description', None) is not None else None,
-            entries=[EntryPreview.from_json(i) for i in json['entries']] if json.get('entries', None) is not None else None,
+            entries=list(map(EntryPreview.from_json, json['entries'])) if json.get('entries', None) is not None else None,
         )
 
 
@@ -759,7 +758,7 @@ class StackTrace:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StackTrace:
         return cls(
-            call_frames=[CallFrame.from_json(i) for i in json['callFrames']],
+            call_frames=list(map(CallFrame.from_json, json['callFrames'])),
             description=str(json['description']) if json.get('description', None) is not None else None,
             parent=StackTrace.from_json(json['parent']) if json.get('parent', None) is not None else None,
             parent_id=StackTraceId.from_json(json['parentId']) if json.get('parentId', None) is not None else None,
@@ -822,17 +821,17 @@ def await_promise(
         0. **result** - Promise result. Will contain rejected value if promise was rejected.
         1. **exceptionDetails** - *(Optional)* Exception details if stack strace is available.
     '''
-    params: T_JSON_DICT = dict()
-    params['promiseObjectId'] = promise_object_id.to_json()
+    params: T_JSON_DICT = {
+        'promiseObjectId': promise_object_id.to_json(),
+    }
     if return_by_value is not None:
         params['returnByValue'] = return_by_value
     if generate_preview is not None:
         params['generatePreview'] = generate_preview
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Runtime.awaitPromise',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         RemoteObject.from_json(json['result']),
         ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
@@ -878,8 +877,9 @@ def call_function_on(
         0. **result** - Call result.
         1. **exceptionDetails** - *(Optional)* Exception details.
     '''
-    params: T_JSON_DICT = dict()
-    params['functionDeclaration'] = function_declaration
+    params: T_JSON_DICT = {
+        'functionDeclaration': function_declaration,
+    }
     if object_id is not None:
         params['objectId'] = object_id.to_json()
     if arguments is not None:
@@ -906,11 +906,10 @@ def call_function_on(
         params['generateWebDriverValue'] = generate_web_driver_value
     if serialization_options is not None:
         params['serializationOptions'] = serialization_options.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Runtime.callFunctionOn',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         RemoteObject.from_json(json['result']),
         ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
@@ -935,17 +934,17 @@ def compile_script(
         0. **scriptId** - *(Optional)* Id of the script.
         1. **exceptionDetails** - *(Optional)* Exception details.
     '''
-    params: T_JSON_DICT = dict()
-    params['expression'] = expression
-    params['sourceURL'] = source_url
-    params['persistScript'] = persist_script
+    params: T_JSON_DICT = {
+        'expression': expression,
+        'sourceURL': source_url,
+        'persistScript': persist_script,
+    }
     if execution_context_id is not None:
         params['executionContextId'] = execution_context_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Runtime.compileScript',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         ScriptId.from_json(json['scriptId']) if json.get('scriptId', None) is not None else None,
         ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
@@ -956,20 +955,18 @@ def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Disables reporting of execution contexts creation.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Runtime.disable',
     }
-    json = yield cmd_dict
 
 
 def discard_console_entries() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Discards collected exceptions and console API calls.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Runtime.discardConsoleEntries',
     }
-    json = yield cmd_dict
 
 
 def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -978,10 +975,9 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     When the reporting gets enabled the event will be sent immediately for each existing execution
     context.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Runtime.enable',
     }
-    json = yield cmd_dict
 
 
 def evaluate(
@@ -1028,8 +1024,9 @@ def evaluate(
         0. **result** - Evaluation result.
         1. **exceptionDetails** - *(Optional)* Exception details.
     '''
-    params: T_JSON_DICT = dict()
-    params['expression'] = expression
+    params: T_JSON_DICT = {
+        'expression': expression,
+    }
     if object_group is not None:
         params['objectGroup'] = object_group
     if include_command_line_api is not None:
@@ -1062,11 +1059,10 @@ def evaluate(
         params['generateWebDriverValue'] = generate_web_driver_value
     if serialization_options is not None:
         params['serializationOptions'] = serialization_options.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Runtime.evaluate',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         RemoteObject.from_json(json['result']),
         ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
@@ -1081,10 +1077,9 @@ def get_isolate_id() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str]:
 
     :returns: The isolate id.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Runtime.getIsolateId',
     }
-    json = yield cmd_dict
     return str(json['id'])
 
 
@@ -1100,10 +1095,9 @@ def get_heap_usage() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[fl
         0. **usedSize** - Used heap size in bytes.
         1. **totalSize** - Allocated heap size in bytes.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Runtime.getHeapUsage',
     }
-    json = yield cmd_dict
     return (
         float(json['usedSize']),
         float(json['totalSize'])
@@ -1133,8 +1127,9 @@ def get_properties(
         2. **privateProperties** - *(Optional)* Object private properties.
         3. **exceptionDetails** - *(Optional)* Exception details.
     '''
-    params: T_JSON_DICT = dict()
-    params['objectId'] = object_id.to_json()
+    params: T_JSON_DICT = {
+        'objectId': object_id.to_json(),
+    }
     if own_properties is not None:
         params['ownProperties'] = own_properties
     if accessor_properties_only is not None:
@@ -1143,15 +1138,14 @@ def get_properties(
         params['generatePreview'] = generate_preview
     if non_indexed_properties_only is not None:
         params['nonIndexedPropertiesOnly'] = non_indexed_properties_only
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Runtime.getProperties',
         'params': params,
     }
-    json = yield cmd_dict
     return (
-        [PropertyDescriptor.from_json(i) for i in json['result']],
-        [InternalPropertyDescriptor.from_json(i) for i in json['internalProperties']] if json.get('internalProperties', None) is not None else None,
-        [PrivatePropertyDescriptor.from_json(i) for i in json['privateProperties']] if json.get('privateProperties', None) is not None else None,
+        list(map(PropertyDescriptor.from_json, json['result'])),
+        list(map(InternalPropertyDescriptor.from_json, json['internalProperties'])) if json.get('internalProperties', None) is not None else None,
+        list(map(PrivatePropertyDescriptor.from_json, json['privateProperties'])) if json.get('privateProperties', None) is not None else None,
         ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
     )
 
@@ -1168,11 +1162,10 @@ def global_lexical_scope_names(
     params: T_JSON_DICT = dict()
     if execution_context_id is not None:
         params['executionContextId'] = execution_context_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Runtime.globalLexicalScopeNames',
         'params': params,
     }
-    json = yield cmd_dict
     return [str(i) for i in json['names']]
 
 
@@ -1185,15 +1178,15 @@ def query_objects(
     :param object_group: *(Optional)* Symbolic group name that can be used to release the results.
     :returns: Array with objects.
     '''
-    params: T_JSON_DICT = dict()
-    params['prototypeObjectId'] = prototype_object_id.to_json()
+    params: T_JSON_DICT = {
+        'prototypeObjectId': prototype_object_id.to_json(),
+    }
     if object_group is not None:
         params['objectGroup'] = object_group
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Runtime.queryObjects',
         'params': params,
     }
-    json = yield cmd_dict
     return RemoteObject.from_json(json['objects'])
 
 
@@ -1205,13 +1198,13 @@ def release_object(
 
     :param object_id: Identifier of the object to release.
     '''
-    params: T_JSON_DICT = dict()
-    params['objectId'] = object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'objectId': object_id.to_json(),
+    }
+    yield {
         'method': 'Runtime.releaseObject',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def release_object_group(
@@ -1222,23 +1215,22 @@ def release_object_group(
 
     :param object_group: Symbolic object group name.
     '''
-    params: T_JSON_DICT = dict()
-    params['objectGroup'] = object_group
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'objectGroup': object_group,
+    }
+    yield {
         'method': 'Runtime.releaseObjectGroup',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def run_if_waiting_for_debugger() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Tells inspected instance to run if it was waiting for debugger to attach.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Runtime.runIfWaitingForDebugger',
     }
-    json = yield cmd_dict
 
 
 def run_script(
@@ -1267,8 +1259,9 @@ def run_script(
         0. **result** - Run result.
         1. **exceptionDetails** - *(Optional)* Exception details.
     '''
-    params: T_JSON_DICT = dict()
-    params['scriptId'] = script_id.to_json()
+    params: T_JSON_DICT = {
+        'scriptId': script_id.to_json(),
+    }
     if execution_context_id is not None:
         params['executionContextId'] = execution_context_id.to_json()
     if object_group is not None:
@@ -1283,11 +1276,10 @@ def run_script(
         params['generatePreview'] = generate_preview
     if await_promise is not None:
         params['awaitPromise'] = await_promise
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Runtime.runScript',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         RemoteObject.from_json(json['result']),
         ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
@@ -1302,13 +1294,13 @@ def set_async_call_stack_depth(
 
     :param max_depth: Maximum depth of async call stacks. Setting to ```0``` will effectively disable collecting async call stacks (default).
     '''
-    params: T_JSON_DICT = dict()
-    params['maxDepth'] = max_depth
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'maxDepth': max_depth,
+    }
+    yield {
         'method': 'Runtime.setAsyncCallStackDepth',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_custom_object_formatter_enabled(
@@ -1321,13 +1313,13 @@ def set_custom_object_formatter_enabled(
 
     :param enabled:
     '''
-    params: T_JSON_DICT = dict()
-    params['enabled'] = enabled
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'enabled': enabled,
+    }
+    yield {
         'method': 'Runtime.setCustomObjectFormatterEnabled',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_max_call_stack_size_to_capture(
@@ -1340,13 +1332,13 @@ def set_max_call_stack_size_to_capture(
 
     :param size:
     '''
-    params: T_JSON_DICT = dict()
-    params['size'] = size
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'size': size,
+    }
+    yield {
         'method': 'Runtime.setMaxCallStackSizeToCapture',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def terminate_execution() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1356,10 +1348,9 @@ def terminate_execution() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
     **EXPERIMENTAL**
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Runtime.terminateExecution',
     }
-    json = yield cmd_dict
 
 
 def add_binding(
@@ -1381,17 +1372,17 @@ def add_binding(
     :param execution_context_id: **(DEPRECATED)** *(Optional)* If specified, the binding would only be exposed to the specified execution context. If omitted and ```executionContextName```` is not set, the binding is exposed to all execution contexts of the target. This parameter is mutually exclusive with ````executionContextName````. Deprecated in favor of ````executionContextName```` due to an unclear use case and bugs in implementation (crbug.com/1169639). ````executionContextId```` will be removed in the future.
     :param execution_context_name: **(EXPERIMENTAL)** *(Optional)* If specified, the binding is exposed to the executionContext with matching name, even for contexts created after the binding is added. See also ````ExecutionContext.name```` and ````worldName```` parameter to ````Page.addScriptToEvaluateOnNewDocument````. This parameter is mutually exclusive with ````executionContextId```.
     '''
-    params: T_JSON_DICT = dict()
-    params['name'] = name
+    params: T_JSON_DICT = {
+        'name': name,
+    }
     if execution_context_id is not None:
         params['executionContextId'] = execution_context_id.to_json()
     if execution_context_name is not None:
         params['executionContextName'] = execution_context_name
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Runtime.addBinding',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def remove_binding(
@@ -1405,13 +1396,13 @@ def remove_binding(
 
     :param name:
     '''
-    params: T_JSON_DICT = dict()
-    params['name'] = name
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'name': name,
+    }
+    yield {
         'method': 'Runtime.removeBinding',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def get_exception_details(
@@ -1429,13 +1420,13 @@ def get_exception_details(
     :param error_object_id: The error object for which to resolve the exception details.
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['errorObjectId'] = error_object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'errorObjectId': error_object_id.to_json(),
+    }
+    json = yield {
         'method': 'Runtime.getExceptionDetails',
         'params': params,
     }
-    json = yield cmd_dict
     return ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
 
 
@@ -1488,7 +1479,7 @@ class ConsoleAPICalled:
     def from_json(cls, json: T_JSON_DICT) -> ConsoleAPICalled:
         return cls(
             type_=str(json['type']),
-            args=[RemoteObject.from_json(i) for i in json['args']],
+            args=list(map(RemoteObject.from_json, json['args'])),
             execution_context_id=ExecutionContextId.from_json(json['executionContextId']),
             timestamp=Timestamp.from_json(json['timestamp']),
             stack_trace=StackTrace.from_json(json['stackTrace']) if json.get('stackTrace', None) is not None else None,
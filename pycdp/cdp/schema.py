@@ -6,10 +6,9 @@
 # CDP domain: Schema
 
 from __future__ import annotations
-import enum
 import typing
 from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import T_JSON_DICT
 
 
 @dataclass
@@ -43,8 +42,7 @@ def get_domains() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[Domain
 
     :returns: List of supported domains.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Schema.getDomains',
     }
-    json = yield cmd_dict
-    return [Domain.from_json(i) for i in json['domains']]
+    return list(map(Domain.from_json, json['domains']))
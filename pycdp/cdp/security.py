@@ -367,20 +367,18 @@ def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Disables tracking security state changes.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Security.disable',
     }
-    json = yield cmd_dict
 
 
 def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Enables tracking security state changes.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Security.enable',
     }
-    json = yield cmd_dict
 
 
 def set_ignore_certificate_errors(
@@ -393,13 +391,13 @@ def set_ignore_certificate_errors(
 
     :param ignore: If true, all certificate errors will be ignored.
     '''
-    params: T_JSON_DICT = dict()
-    params['ignore'] = ignore
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'ignore': ignore,
+    }
+    yield {
         'method': 'Security.setIgnoreCertificateErrors',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @deprecated(version="1.3")
@@ -415,14 +413,14 @@ def handle_certificate_error(
     :param event_id: The ID of the event.
     :param action: The action to take on the certificate error.
     '''
-    params: T_JSON_DICT = dict()
-    params['eventId'] = event_id
-    params['action'] = action.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'eventId': event_id,
+        'action': action.to_json(),
+    }
+    yield {
         'method': 'Security.handleCertificateError',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @deprecated(version="1.3")
@@ -437,13 +435,13 @@ def set_override_certificate_errors(
 
     :param override: If true, certificate errors will be overridden.
     '''
-    params: T_JSON_DICT = dict()
-    params['override'] = override
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'override': override,
+    }
+    yield {
         'method': 'Security.setOverrideCertificateErrors',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @deprecated(version="1.3")
@@ -514,7 +512,7 @@ class SecurityStateChanged:
         return cls(
             security_state=SecurityState.from_json(json['securityState']),
             scheme_is_cryptographic=bool(json['schemeIsCryptographic']),
-            explanations=[SecurityStateExplanation.from_json(i) for i in json['explanations']],
+            explanations=list(map(SecurityStateExplanation.from_json, json['explanations'])),
             insecure_content_status=InsecureContentStatus.from_json(json['insecureContentStatus']),
             summary=str(json['summary']) if json.get('summary', None) is not None else None
         )
@@ -136,7 +136,7 @@ class ServiceWorkerVersion:
             status=ServiceWorkerVersionStatus.from_json(json['status']),
             script_last_modified=float(json['scriptLastModified']) if json.get('scriptLastModified', None) is not None else None,
             script_response_time=float(json['scriptResponseTime']) if json.get('scriptResponseTime', None) is not None else None,
-            controlled_clients=[target.TargetID.from_json(i) for i in json['controlledClients']] if json.get('controlledClients', None) is not None else None,
+            controlled_clients=list(map(target.TargetID.from_json, json['controlledClients'])) if json.get('controlledClients', None) is not None else None,
             target_id=target.TargetID.from_json(json['targetId']) if json.get('targetId', None) is not None else None,
         )
 
@@ -190,23 +190,22 @@ def deliver_push_message(
     :param registration_id:
     :param data:
     '''
-    params: T_JSON_DICT = dict()
-    params['origin'] = origin
-    params['registrationId'] = registration_id.to_json()
-    params['data'] = data
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'origin': origin,
+        'registrationId': registration_id.to_json(),
+        'data': data,
+    }
+    yield {
         'method': 'ServiceWorker.deliverPushMessage',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'ServiceWorker.disable',
     }
-    json = yield cmd_dict
 
 
 def dispatch_sync_event(
@@ -221,16 +220,16 @@ def dispatch_sync_event(
     :param tag:
     :param last_chance:
     '''
-    params: T_JSON_DICT = dict()
-    params['origin'] = origin
-    params['registrationId'] = registration_id.to_json()
-    params['tag'] = tag
-    params['lastChance'] = last_chance
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'origin': origin,
+        'registrationId': registration_id.to_json(),
+        'tag': tag,
+        'lastChance': last_chance,
+    }
+    yield {
         'method': 'ServiceWorker.dispatchSyncEvent',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def dispatch_periodic_sync_event(
@@ -243,23 +242,22 @@ def dispatch_periodic_sync_event(
     :param registration_id:
     :param tag:
     '''
-    params: T_JSON_DICT = dict()
-    params['origin'] = origin
-    params['registrationId'] = registration_id.to_json()
-    params['tag'] = tag
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'origin': origin,
+        'registrationId': registration_id.to_json(),
+        'tag': tag,
+    }
+    yield {
         'method': 'ServiceWorker.dispatchPeriodicSyncEvent',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'ServiceWorker.enable',
     }
-    json = yield cmd_dict
 
 
 def inspect_worker(
@@ -268,13 +266,13 @@ def inspect_worker(
     '''
     :param version_id:
     '''
-    params: T_JSON_DICT = dict()
-    params['versionId'] = version_id
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'versionId': version_id,
+    }
+    yield {
         'method': 'ServiceWorker.inspectWorker',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_force_update_on_page_load(
@@ -283,13 +281,13 @@ def set_force_update_on_page_load(
     '''
     :param force_update_on_page_load:
     '''
-    params: T_JSON_DICT = dict()
-    params['forceUpdateOnPageLoad'] = force_update_on_page_load
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'forceUpdateOnPageLoad': force_update_on_page_load,
+    }
+    yield {
         'method': 'ServiceWorker.setForceUpdateOnPageLoad',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def skip_waiting(
@@ -298,13 +296,13 @@ def skip_waiting(
     '''
     :param scope_url:
     '''
-    params: T_JSON_DICT = dict()
-    params['scopeURL'] = scope_url
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'scopeURL': scope_url,
+    }
+    yield {
         'method': 'ServiceWorker.skipWaiting',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def start_worker(
@@ -313,21 +311,20 @@ def start_worker(
     '''
     :param scope_url:
     '''
-    params: T_JSON_DICT = dict()
-    params['scopeURL'] = scope_url
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'scopeURL': scope_url,
+    }
+    yield {
         'method': 'ServiceWorker.startWorker',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def stop_all_workers() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
 
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'ServiceWorker.stopAllWorkers',
     }
-    json = yield cmd_dict
 
 
 def stop_worker(
@@ -336,13 +333,13 @@ def stop_worker(
     '''
     :param version_id:
     '''
-    params: T_JSON_DICT = dict()
-    params['versionId'] = version_id
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'versionId': version_id,
+    }
+    yield {
         'method': 'ServiceWorker.stopWorker',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def unregister(
@@ -351,13 +348,13 @@ def unregister(
     '''
     :param scope_url:
     '''
-    params: T_JSON_DICT = dict()
-    params['scopeURL'] = scope_url
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'scopeURL': scope_url,
+    }
+    yield {
         'method': 'ServiceWorker.unregister',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def update_registration(
@@ -366,13 +363,13 @@ def update_registration(
     '''
     :param scope_url:
     '''
-    params: T_JSON_DICT = dict()
-    params['scopeURL'] = scope_url
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'scopeURL': scope_url,
+    }
+    yield {
         'method': 'ServiceWorker.updateRegistration',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @event_class('ServiceWorker.workerErrorReported')
@@ -395,7 +392,7 @@ class WorkerRegistrationUpdated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WorkerRegistrationUpdated:
         return cls(
-            registrations=[ServiceWorkerRegistration.from_json(i) for i in json['registrations']]
+            registrations=list(map(ServiceWorkerRegistration.from_json, json['registrations']))
         )
 
 
@@ -407,5 +404,5 @@ class WorkerVersionUpdated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WorkerVersionUpdated:
         return cls(
-            versions=[ServiceWorkerVersion.from_json(i) for i in json['versions']]
+            versions=list(map(ServiceWorkerVersion.from_json, json['versions']))
         )
@@ -205,8 +205,8 @@ class InterestGroupDetails:
             expiration_time=network.TimeSinceEpoch.from_json(json['expirationTime']),
             joining_origin=str(json['joiningOrigin']),
             trusted_bidding_signals_keys=[str(i) for i in json['trustedBiddingSignalsKeys']],
-            ads=[InterestGroupAd.from_json(i) for i in json['ads']],
-            ad_components=[InterestGroupAd.from_json(i) for i in json['adComponents']],
+            ads=list(map(InterestGroupAd.from_json, json['ads'])),
+            ad_components=list(map(InterestGroupAd.from_json, json['adComponents'])),
             bidding_url=str(json['biddingUrl']) if json.get('biddingUrl', None) is not None else None,
             bidding_wasm_helper_url=str(json['biddingWasmHelperUrl']) if json.get('biddingWasmHelperUrl', None) is not None else None,
             update_url=str(json['updateUrl']) if json.get('updateUrl', None) is not None else None,
@@ -338,7 +338,7 @@ class SharedStorageUrlWithMetadata:
     def from_json(cls, json: T_JSON_DICT) -> SharedStorageUrlWithMetadata:
         return cls(
             url=str(json['url']),
-            reporting_metadata=[SharedStorageReportingMetadata.from_json(i) for i in json['reportingMetadata']],
+            reporting_metadata=list(map(SharedStorageReportingMetadata.from_json, json['reportingMetadata'])),
         )
 
 
@@ -412,7 +412,7 @@ class SharedStorageAccessParams:
             script_source_url=str(json['scriptSourceUrl']) if json.get('scriptSourceUrl', None) is not None else None,
             operation_name=str(json['operationName']) if json.get('operationName', None) is not None else None,
             serialized_data=str(json['serializedData']) if json.get('serializedData', None) is not None else None,
-            urls_with_metadata=[SharedStorageUrlWithMetadata.from_json(i) for i in json['urlsWithMetadata']] if json.get('urlsWithMetadata', None) is not None else None,
+            urls_with_metadata=list(map(SharedStorageUrlWithMetadata.from_json, json['urlsWithMetadata'])) if json.get('urlsWithMetadata', None) is not None else None,
             key=str(json['key']) if json.get('key', None) is not None else None,
             value=str(json['value']) if json.get('value', None) is not None else None,
             ignore_if_present=bool(json['ignoreIfPresent']) if json.get('ignoreIfPresent', None) is not None else None,
@@ -640,8 +640,8 @@ class AttributionReportingSourceRegistration:
             destination_sites=[str(i) for i in json['destinationSites']],
             event_id=UnsignedInt64AsBase10.from_json(json['eventId']),
             priority=SignedInt64AsBase10.from_json(json['priority']),
-            filter_data=[AttributionReportingFilterDataEntry.from_json(i) for i in json['filterData']],
-            aggregation_keys=[AttributionReportingAggregationKeysEntry.from_json(i) for i in json['aggregationKeys']],
+            filter_data=list(map(AttributionReportingFilterDataEntry.from_json, json['filterData'])),
+            aggregation_keys=list(map(AttributionReportingAggregationKeysEntry.from_json, json['aggregationKeys'])),
             expiry=int(json['expiry']) if json.get('expiry', None) is not None else None,
             event_report_window=int(json['eventReportWindow']) if json.get('eventReportWindow', None) is not None else None,
             aggregatable_report_window=int(json['aggregatableReportWindow']) if json.get('aggregatableReportWindow', None) is not None else None,
@@ -680,13 +680,13 @@ def get_storage_key_for_frame(
     :param frame_id:
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'frameId': frame_id.to_json(),
+    }
+    json = yield {
         'method': 'Storage.getStorageKeyForFrame',
         'params': params,
     }
-    json = yield cmd_dict
     return SerializedStorageKey.from_json(json['storageKey'])
 
 
@@ -700,14 +700,14 @@ def clear_data_for_origin(
     :param origin: Security origin.
     :param storage_types: Comma separated list of StorageType to clear.
     '''
-    params: T_JSON_DICT = dict()
-    params['origin'] = origin
-    params['storageTypes'] = storage_types
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'origin': origin,
+        'storageTypes': storage_types,
+    }
+    yield {
         'method': 'Storage.clearDataForOrigin',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def clear_data_for_storage_key(
@@ -720,14 +720,14 @@ def clear_data_for_storage_key(
     :param storage_key: Storage key.
     :param storage_types: Comma separated list of StorageType to clear.
     '''
-    params: T_JSON_DICT = dict()
-    params['storageKey'] = storage_key
-    params['storageTypes'] = storage_types
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'storageKey': storage_key,
+        'storageTypes': storage_types,
+    }
+    yield {
         'method': 'Storage.clearDataForStorageKey',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def get_cookies(
@@ -742,12 +742,11 @@ def get_cookies(
     params: T_JSON_DICT = dict()
     if browser_context_id is not None:
         params['browserContextId'] = browser_context_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Storage.getCookies',
         'params': params,
     }
-    json = yield cmd_dict
-    return [network.Cookie.from_json(i) for i in json['cookies']]
+    return list(map(network.Cookie.from_json, json['cookies']))
 
 
 def set_cookies(
@@ -760,15 +759,15 @@ def set_cookies(
     :param cookies: Cookies to be set.
     :param browser_context_id: *(Optional)* Browser context to use when called on the browser endpoint.
     '''
-    params: T_JSON_DICT = dict()
-    params['cookies'] = [i.to_json() for i in cookies]
+    params: T_JSON_DICT = {
+        'cookies': [i.to_json() for i in cookies],
+    }
     if browser_context_id is not None:
         params['browserContextId'] = browser_context_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Storage.setCookies',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def clear_cookies(
@@ -782,11 +781,10 @@ def clear_cookies(
     params: T_JSON_DICT = dict()
     if browser_context_id is not None:
         params['browserContextId'] = browser_context_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Storage.clearCookies',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def get_usage_and_quota(
@@ -803,18 +801,18 @@ def get_usage_and_quota(
         2. **overrideActive** - Whether or not the origin has an active storage quota override
         3. **usageBreakdown** - Storage usage per type (bytes).
     '''
-    params: T_JSON_DICT = dict()
-    params['origin'] = origin
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'origin': origin,
+    }
+    json = yield {
         'method': 'Storage.getUsageAndQuota',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         float(json['usage']),
         float(json['quota']),
         bool(json['overrideActive']),
-        [UsageForType.from_json(i) for i in json['usageBreakdown']]
+        list(map(UsageForType.from_json, json['usageBreakdown']))
     )
 
 
@@ -830,15 +828,15 @@ def override_quota_for_origin(
     :param origin: Security origin.
     :param quota_size: *(Optional)* The quota size (in bytes) to override the original quota with. If this is called multiple times, the overridden quota will be equal to the quotaSize provided in the final call. If this is called without specifying a quotaSize, the quota will be reset to the default value for the specified origin. If this is called multiple times with different origins, the override will be maintained for each origin until it is disabled (called without a quotaSize).
     '''
-    params: T_JSON_DICT = dict()
-    params['origin'] = origin
+    params: T_JSON_DICT = {
+        'origin': origin,
+    }
     if quota_size is not None:
         params['quotaSize'] = quota_size
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Storage.overrideQuotaForOrigin',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def track_cache_storage_for_origin(
@@ -849,13 +847,13 @@ def track_cache_storage_for_origin(
 
     :param origin: Security origin.
     '''
-    params: T_JSON_DICT = dict()
-    params['origin'] = origin
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'origin': origin,
+    }
+    yield {
         'method': 'Storage.trackCacheStorageForOrigin',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def track_cache_storage_for_storage_key(
@@ -866,13 +864,13 @@ def track_cache_storage_for_storage_key(
 
     :param storage_key: Storage key.
     '''
-    params: T_JSON_DICT = dict()
-    params['storageKey'] = storage_key
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'storageKey': storage_key,
+    }
+    yield {
         'method': 'Storage.trackCacheStorageForStorageKey',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def track_indexed_db_for_origin(
@@ -883,13 +881,13 @@ def track_indexed_db_for_origin(
 
     :param origin: Security origin.
     '''
-    params: T_JSON_DICT = dict()
-    params['origin'] = origin
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'origin': origin,
+    }
+    yield {
         'method': 'Storage.trackIndexedDBForOrigin',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def track_indexed_db_for_storage_key(
@@ -900,13 +898,13 @@ def track_indexed_db_for_storage_key(
 
     :param storage_key: Storage key.
     '''
-    params: T_JSON_DICT = dict()
-    params['storageKey'] = storage_key
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'storageKey': storage_key,
+    }
+    yield {
         'method': 'Storage.trackIndexedDBForStorageKey',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def untrack_cache_storage_for_origin(
@@ -917,13 +915,13 @@ def untrack_cache_storage_for_origin(
 
     :param origin: Security origin.
     '''
-    params: T_JSON_DICT = dict()
-    params['origin'] = origin
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'origin': origin,
+    }
+    yield {
         'method': 'Storage.untrackCacheStorageForOrigin',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def untrack_cache_storage_for_storage_key(
@@ -934,13 +932,13 @@ def untrack_cache_storage_for_storage_key(
 
     :param storage_key: Storage key.
     '''
-    params: T_JSON_DICT = dict()
-    params['storageKey'] = storage_key
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'storageKey': storage_key,
+    }
+    yield {
         'method': 'Storage.untrackCacheStorageForStorageKey',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def untrack_indexed_db_for_origin(
@@ -951,13 +949,13 @@ def untrack_indexed_db_for_origin(
 
     :param origin: Security origin.
     '''
-    params: T_JSON_DICT = dict()
-    params['origin'] = origin
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'origin': origin,
+    }
+    yield {
         'method': 'Storage.untrackIndexedDBForOrigin',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def untrack_indexed_db_for_storage_key(
@@ -968,13 +966,13 @@ def untrack_indexed_db_for_storage_key(
 
     :param storage_key: Storage key.
     '''
-    params: T_JSON_DICT = dict()
-    params['storageKey'] = storage_key
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'storageKey': storage_key,
+    }
+    yield {
         'method': 'Storage.untrackIndexedDBForStorageKey',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def get_trust_tokens() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[TrustTokens]]:
@@ -986,11 +984,10 @@ def get_trust_tokens() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[T
 
     :returns: 
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Storage.getTrustTokens',
     }
-    json = yield cmd_dict
-    return [TrustTokens.from_json(i) for i in json['tokens']]
+    return list(map(TrustTokens.from_json, json['tokens']))
 
 
 def clear_trust_tokens(
@@ -1005,13 +1002,13 @@ def clear_trust_tokens(
     :param issuer_origin:
     :returns: True if any tokens were deleted, false otherwise.
     '''
-    params: T_JSON_DICT = dict()
-    params['issuerOrigin'] = issuer_origin
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'issuerOrigin': issuer_origin,
+    }
+    json = yield {
         'method': 'Storage.clearTrustTokens',
         'params': params,
     }
-    json = yield cmd_dict
     return bool(json['didDeleteTokens'])
 
 
@@ -1028,14 +1025,14 @@ def get_interest_group_details(
     :param name:
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['ownerOrigin'] = owner_origin
-    params['name'] = name
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'ownerOrigin': owner_origin,
+        'name': name,
+    }
+    json = yield {
         'method': 'Storage.getInterestGroupDetails',
         'params': params,
     }
-    json = yield cmd_dict
     return InterestGroupDetails.from_json(json['details'])
 
 
@@ -1049,13 +1046,13 @@ def set_interest_group_tracking(
 
     :param enable:
     '''
-    params: T_JSON_DICT = dict()
-    params['enable'] = enable
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'enable': enable,
+    }
+    yield {
         'method': 'Storage.setInterestGroupTracking',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def get_shared_storage_metadata(
@@ -1069,13 +1066,13 @@ def get_shared_storage_metadata(
     :param owner_origin:
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['ownerOrigin'] = owner_origin
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'ownerOrigin': owner_origin,
+    }
+    json = yield {
         'method': 'Storage.getSharedStorageMetadata',
         'params': params,
     }
-    json = yield cmd_dict
     return SharedStorageMetadata.from_json(json['metadata'])
 
 
@@ -1090,14 +1087,14 @@ def get_shared_storage_entries(
     :param owner_origin:
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['ownerOrigin'] = owner_origin
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'ownerOrigin': owner_origin,
+    }
+    json = yield {
         'method': 'Storage.getSharedStorageEntries',
         'params': params,
     }
-    json = yield cmd_dict
-    return [SharedStorageEntry.from_json(i) for i in json['entries']]
+    return list(map(SharedStorageEntry.from_json, json['entries']))
 
 
 def set_shared_storage_entry(
@@ -1116,17 +1113,17 @@ def set_shared_storage_entry(
     :param value:
     :param ignore_if_present: *(Optional)* If ```ignoreIfPresent```` is included and true, then only sets the entry if ````key``` doesn't already exist.
     '''
-    params: T_JSON_DICT = dict()
-    params['ownerOrigin'] = owner_origin
-    params['key'] = key
-    params['value'] = value
+    params: T_JSON_DICT = {
+        'ownerOrigin': owner_origin,
+        'key': key,
+        'value': value,
+    }
     if ignore_if_present is not None:
         params['ignoreIfPresent'] = ignore_if_present
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Storage.setSharedStorageEntry',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def delete_shared_storage_entry(
@@ -1141,14 +1138,14 @@ def delete_shared_storage_entry(
     :param owner_origin:
     :param key:
     '''
-    params: T_JSON_DICT = dict()
-    params['ownerOrigin'] = owner_origin
-    params['key'] = key
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'ownerOrigin': owner_origin,
+        'key': key,
+    }
+    yield {
         'method': 'Storage.deleteSharedStorageEntry',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def clear_shared_storage_entries(
@@ -1161,13 +1158,13 @@ def clear_shared_storage_entries(
 
     :param owner_origin:
     '''
-    params: T_JSON_DICT = dict()
-    params['ownerOrigin'] = owner_origin
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'ownerOrigin': owner_origin,
+    }
+    yield {
         'method': 'Storage.clearSharedStorageEntries',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def reset_shared_storage_budget(
@@ -1180,13 +1177,13 @@ def reset_shared_storage_budget(
 
     :param owner_origin:
     '''
-    params: T_JSON_DICT = dict()
-    params['ownerOrigin'] = owner_origin
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'ownerOrigin': owner_origin,
+    }
+    yield {
         'method': 'Storage.resetSharedStorageBudget',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_shared_storage_tracking(
@@ -1199,13 +1196,13 @@ def set_shared_storage_tracking(
 
     :param enable:
     '''
-    params: T_JSON_DICT = dict()
-    params['enable'] = enable
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'enable': enable,
+    }
+    yield {
         'method': 'Storage.setSharedStorageTracking',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_storage_bucket_tracking(
@@ -1220,14 +1217,14 @@ def set_storage_bucket_tracking(
     :param storage_key:
     :param enable:
     '''
-    params: T_JSON_DICT = dict()
-    params['storageKey'] = storage_key
-    params['enable'] = enable
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'storageKey': storage_key,
+        'enable': enable,
+    }
+    yield {
         'method': 'Storage.setStorageBucketTracking',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def delete_storage_bucket(
@@ -1240,13 +1237,13 @@ def delete_storage_bucket(
 
     :param bucket:
     '''
-    params: T_JSON_DICT = dict()
-    params['bucket'] = bucket.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'bucket': bucket.to_json(),
+    }
+    yield {
         'method': 'Storage.deleteStorageBucket',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def run_bounce_tracking_mitigations() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str]]:
@@ -1257,10 +1254,9 @@ def run_bounce_tracking_mitigations() -> typing.Generator[T_JSON_DICT,T_JSON_DIC
 
     :returns: 
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Storage.runBounceTrackingMitigations',
     }
-    json = yield cmd_dict
     return [str(i) for i in json['deletedSites']]
 
 
@@ -1274,13 +1270,13 @@ def set_attribution_reporting_local_testing_mode(
 
     :param enabled: If enabled, noise is suppressed and reports are sent immediately.
     '''
-    params: T_JSON_DICT = dict()
-    params['enabled'] = enabled
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'enabled': enabled,
+    }
+    yield {
         'method': 'Storage.setAttributionReportingLocalTestingMode',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_attribution_reporting_tracking(
@@ -1293,13 +1289,13 @@ def set_attribution_reporting_tracking(
 
     :param enable:
     '''
-    params: T_JSON_DICT = dict()
-    params['enable'] = enable
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'enable': enable,
+    }
+    yield {
         'method': 'Storage.setAttributionReportingTracking',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @event_class('Storage.cacheStorageContentUpdated')
@@ -9,7 +9,7 @@ from __future__ import annotations
 import enum
 import typing
 from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import T_JSON_DICT
 
 
 @dataclass
@@ -226,7 +226,7 @@ class ImageDecodeAcceleratorCapability:
             image_type=ImageType.from_json(json['imageType']),
             max_dimensions=Size.from_json(json['maxDimensions']),
             min_dimensions=Size.from_json(json['minDimensions']),
-            subsamplings=[SubsamplingFormat.from_json(i) for i in json['subsamplings']],
+            subsamplings=list(map(SubsamplingFormat.from_json, json['subsamplings'])),
         )
 
 
@@ -272,11 +272,11 @@ class GPUInfo:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> GPUInfo:
         return cls(
-            devices=[GPUDevice.from_json(i) for i in json['devices']],
+            devices=list(map(GPUDevice.from_json, json['devices'])),
             driver_bug_workarounds=[str(i) for i in json['driverBugWorkarounds']],
-            video_decoding=[VideoDecodeAcceleratorCapability.from_json(i) for i in json['videoDecoding']],
-            video_encoding=[VideoEncodeAcceleratorCapability.from_json(i) for i in json['videoEncoding']],
-            image_decoding=[ImageDecodeAcceleratorCapability.from_json(i) for i in json['imageDecoding']],
+            video_decoding=list(map(VideoDecodeAcceleratorCapability.from_json, json['videoDecoding'])),
+            video_encoding=list(map(VideoEncodeAcceleratorCapability.from_json, json['videoEncoding'])),
+            image_decoding=list(map(ImageDecodeAcceleratorCapability.from_json, json['imageDecoding'])),
             aux_attributes=dict(json['auxAttributes']) if json.get('auxAttributes', None) is not None else None,
             feature_status=dict(json['featureStatus']) if json.get('featureStatus', None) is not None else None,
         )
@@ -324,10 +324,9 @@ def get_info() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[GPUInfo,
         2. **modelVersion** - A platform-dependent description of the version of the machine. On Mac OS, this is, for example, '10.1'. Will be the empty string if not supported.
         3. **commandLine** - The command line string used to launch the browser. Will be the empty string if not supported.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'SystemInfo.getInfo',
     }
-    json = yield cmd_dict
     return (
         GPUInfo.from_json(json['gpu']),
         str(json['modelName']),
@@ -345,13 +344,13 @@ def get_feature_state(
     :param feature_state:
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['featureState'] = feature_state
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'featureState': feature_state,
+    }
+    json = yield {
         'method': 'SystemInfo.getFeatureState',
         'params': params,
     }
-    json = yield cmd_dict
     return bool(json['featureEnabled'])
 
 
@@ -361,8 +360,7 @@ def get_process_info() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[P
 
     :returns: An array of process info blocks.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'SystemInfo.getProcessInfo',
     }
-    json = yield cmd_dict
-    return [ProcessInfo.from_json(i) for i in json['processInfo']]
+    return list(map(ProcessInfo.from_json, json['processInfo']))
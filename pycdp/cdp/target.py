@@ -6,7 +6,6 @@
 # CDP domain: Target
 
 from __future__ import annotations
-import enum
 import typing
 from dataclasses import dataclass
 from .util import event_class, T_JSON_DICT
@@ -180,13 +179,13 @@ def activate_target(
 
     :param target_id:
     '''
-    params: T_JSON_DICT = dict()
-    params['targetId'] = target_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'targetId': target_id.to_json(),
+    }
+    yield {
         'method': 'Target.activateTarget',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def attach_to_target(
@@ -200,15 +199,15 @@ def attach_to_target(
     :param flatten: *(Optional)* Enables "flat" access to the session via specifying sessionId attribute in the commands. We plan to make this the default, deprecate non-flattened mode, and eventually retire it. See crbug.com/991325.
     :returns: Id assigned to the session.
     '''
-    params: T_JSON_DICT = dict()
-    params['targetId'] = target_id.to_json()
+    params: T_JSON_DICT = {
+        'targetId': target_id.to_json(),
+    }
     if flatten is not None:
         params['flatten'] = flatten
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Target.attachToTarget',
         'params': params,
     }
-    json = yield cmd_dict
     return SessionID.from_json(json['sessionId'])
 
 
@@ -220,10 +219,9 @@ def attach_to_browser_target() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,Sessi
 
     :returns: Id assigned to the session.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Target.attachToBrowserTarget',
     }
-    json = yield cmd_dict
     return SessionID.from_json(json['sessionId'])
 
 
@@ -236,13 +234,13 @@ def close_target(
     :param target_id:
     :returns: Always set to true. If an error occurs, the response indicates protocol error.
     '''
-    params: T_JSON_DICT = dict()
-    params['targetId'] = target_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'targetId': target_id.to_json(),
+    }
+    json = yield {
         'method': 'Target.closeTarget',
         'params': params,
     }
-    json = yield cmd_dict
     return bool(json['success'])
 
 
@@ -265,15 +263,15 @@ def expose_dev_tools_protocol(
     :param target_id:
     :param binding_name: *(Optional)* Binding name, 'cdp' if not specified.
     '''
-    params: T_JSON_DICT = dict()
-    params['targetId'] = target_id.to_json()
+    params: T_JSON_DICT = {
+        'targetId': target_id.to_json(),
+    }
     if binding_name is not None:
         params['bindingName'] = binding_name
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Target.exposeDevToolsProtocol',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def create_browser_context(
@@ -303,11 +301,10 @@ def create_browser_context(
         params['proxyBypassList'] = proxy_bypass_list
     if origins_with_universal_network_access is not None:
         params['originsWithUniversalNetworkAccess'] = [i for i in origins_with_universal_network_access]
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Target.createBrowserContext',
         'params': params,
     }
-    json = yield cmd_dict
     return browser.BrowserContextID.from_json(json['browserContextId'])
 
 
@@ -319,11 +316,10 @@ def get_browser_contexts() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Li
 
     :returns: An array of browser context ids.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Target.getBrowserContexts',
     }
-    json = yield cmd_dict
-    return [browser.BrowserContextID.from_json(i) for i in json['browserContextIds']]
+    return list(map(browser.BrowserContextID.from_json, json['browserContextIds']))
 
 
 def create_target(
@@ -349,8 +345,9 @@ def create_target(
     :param for_tab: **(EXPERIMENTAL)** *(Optional)* Whether to create the target of type "tab".
     :returns: The id of the page opened.
     '''
-    params: T_JSON_DICT = dict()
-    params['url'] = url
+    params: T_JSON_DICT = {
+        'url': url,
+    }
     if width is not None:
         params['width'] = width
     if height is not None:
@@ -365,11 +362,10 @@ def create_target(
         params['background'] = background
     if for_tab is not None:
         params['forTab'] = for_tab
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Target.createTarget',
         'params': params,
     }
-    json = yield cmd_dict
     return TargetID.from_json(json['targetId'])
 
 
@@ -388,11 +384,10 @@ def detach_from_target(
         params['sessionId'] = session_id.to_json()
     if target_id is not None:
         params['targetId'] = target_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Target.detachFromTarget',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def dispose_browser_context(
@@ -406,13 +401,13 @@ def dispose_browser_context(
 
     :param browser_context_id:
     '''
-    params: T_JSON_DICT = dict()
-    params['browserContextId'] = browser_context_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'browserContextId': browser_context_id.to_json(),
+    }
+    yield {
         'method': 'Target.disposeBrowserContext',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def get_target_info(
@@ -429,11 +424,10 @@ def get_target_info(
     params: T_JSON_DICT = dict()
     if target_id is not None:
         params['targetId'] = target_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Target.getTargetInfo',
         'params': params,
     }
-    json = yield cmd_dict
     return TargetInfo.from_json(json['targetInfo'])
 
 
@@ -449,12 +443,11 @@ def get_targets(
     params: T_JSON_DICT = dict()
     if filter_ is not None:
         params['filter'] = filter_.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Target.getTargets',
         'params': params,
     }
-    json = yield cmd_dict
-    return [TargetInfo.from_json(i) for i in json['targetInfos']]
+    return list(map(TargetInfo.from_json, json['targetInfos']))
 
 
 @deprecated(version="1.3")
@@ -474,17 +467,17 @@ def send_message_to_target(
     :param session_id: *(Optional)* Identifier of the session.
     :param target_id: **(DEPRECATED)** *(Optional)* Deprecated.
     '''
-    params: T_JSON_DICT = dict()
-    params['message'] = message
+    params: T_JSON_DICT = {
+        'message': message,
+    }
     if session_id is not None:
         params['sessionId'] = session_id.to_json()
     if target_id is not None:
         params['targetId'] = target_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Target.sendMessageToTarget',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_auto_attach(
@@ -507,18 +500,18 @@ def set_auto_attach(
     :param flatten: *(Optional)* Enables "flat" access to the session via specifying sessionId attribute in the commands. We plan to make this the default, deprecate non-flattened mode, and eventually retire it. See crbug.com/991325.
     :param filter_: **(EXPERIMENTAL)** *(Optional)* Only targets matching filter will be attached.
     '''
-    params: T_JSON_DICT = dict()
-    params['autoAttach'] = auto_attach
-    params['waitForDebuggerOnStart'] = wait_for_debugger_on_start
+    params: T_JSON_DICT = {
+        'autoAttach': auto_attach,
+        'waitForDebuggerOnStart': wait_for_debugger_on_start,
+    }
     if flatten is not None:
         params['flatten'] = flatten
     if filter_ is not None:
         params['filter'] = filter_.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Target.setAutoAttach',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def auto_attach_related(
@@ -539,16 +532,16 @@ def auto_attach_related(
     :param wait_for_debugger_on_start: Whether to pause new targets when attaching to them. Use ```Runtime.runIfWaitingForDebugger``` to run paused targets.
     :param filter_: **(EXPERIMENTAL)** *(Optional)* Only targets matching filter will be attached.
     '''
-    params: T_JSON_DICT = dict()
-    params['targetId'] = target_id.to_json()
-    params['waitForDebuggerOnStart'] = wait_for_debugger_on_start
+    params: T_JSON_DICT = {
+        'targetId': target_id.to_json(),
+        'waitForDebuggerOnStart': wait_for_debugger_on_start,
+    }
     if filter_ is not None:
         params['filter'] = filter_.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Target.autoAttachRelated',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_discover_targets(
@@ -562,15 +555,15 @@ def set_discover_targets(
     :param discover: Whether to discover available targets.
     :param filter_: **(EXPERIMENTAL)** *(Optional)* Only targets matching filter will be attached. If ```discover```` is false, ````filter``` must be omitted or empty.
     '''
-    params: T_JSON_DICT = dict()
-    params['discover'] = discover
+    params: T_JSON_DICT = {
+        'discover': discover,
+    }
     if filter_ is not None:
         params['filter'] = filter_.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Target.setDiscoverTargets',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_remote_locations(
@@ -584,13 +577,13 @@ def set_remote_locations(
 
     :param locations: List of remote locations.
     '''
-    params: T_JSON_DICT = dict()
-    params['locations'] = [i.to_json() for i in locations]
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'locations': [i.to_json() for i in locations],
+    }
+    yield {
         'method': 'Target.setRemoteLocations',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @event_class('Target.attachedToTarget')
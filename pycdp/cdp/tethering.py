@@ -6,7 +6,6 @@
 # CDP domain: Tethering (experimental)
 
 from __future__ import annotations
-import enum
 import typing
 from dataclasses import dataclass
 from .util import event_class, T_JSON_DICT
@@ -20,13 +19,13 @@ def bind(
 
     :param port: Port number to bind.
     '''
-    params: T_JSON_DICT = dict()
-    params['port'] = port
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'port': port,
+    }
+    yield {
         'method': 'Tethering.bind',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def unbind(
@@ -37,13 +36,13 @@ def unbind(
 
     :param port: Port number to unbind.
     '''
-    params: T_JSON_DICT = dict()
-    params['port'] = port
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'port': port,
+    }
+    yield {
         'method': 'Tethering.unbind',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @event_class('Tethering.accepted')
@@ -169,10 +169,9 @@ def end() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Stop trace events collection.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Tracing.end',
     }
-    json = yield cmd_dict
 
 
 def get_categories() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str]]:
@@ -181,10 +180,9 @@ def get_categories() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str
 
     :returns: A list of supported tracing categories.
     '''
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Tracing.getCategories',
     }
-    json = yield cmd_dict
     return [str(i) for i in json['categories']]
 
 
@@ -196,13 +194,13 @@ def record_clock_sync_marker(
 
     :param sync_id: The ID of this clock sync marker
     '''
-    params: T_JSON_DICT = dict()
-    params['syncId'] = sync_id
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'syncId': sync_id,
+    }
+    yield {
         'method': 'Tracing.recordClockSyncMarker',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def request_memory_dump(
@@ -224,11 +222,10 @@ def request_memory_dump(
         params['deterministic'] = deterministic
     if level_of_detail is not None:
         params['levelOfDetail'] = level_of_detail.to_json()
-    cmd_dict: T_JSON_DICT = {
+    json = yield {
         'method': 'Tracing.requestMemoryDump',
         'params': params,
     }
-    json = yield cmd_dict
     return (
         str(json['dumpGuid']),
         bool(json['success'])
@@ -278,11 +275,10 @@ def start(
         params['perfettoConfig'] = perfetto_config
     if tracing_backend is not None:
         params['tracingBackend'] = tracing_backend.to_json()
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'Tracing.start',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @event_class('Tracing.bufferUsage')
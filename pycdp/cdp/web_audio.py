@@ -339,20 +339,18 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Enables the WebAudio domain and starts sending context lifetime events.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'WebAudio.enable',
     }
-    json = yield cmd_dict
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Disables the WebAudio domain.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'WebAudio.disable',
     }
-    json = yield cmd_dict
 
 
 def get_realtime_data(
@@ -364,13 +362,13 @@ def get_realtime_data(
     :param context_id:
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['contextId'] = context_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'contextId': context_id.to_json(),
+    }
+    json = yield {
         'method': 'WebAudio.getRealtimeData',
         'params': params,
     }
-    json = yield cmd_dict
     return ContextRealtimeData.from_json(json['realtimeData'])
 
 
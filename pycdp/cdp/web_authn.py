@@ -212,21 +212,19 @@ def enable(
     params: T_JSON_DICT = dict()
     if enable_ui is not None:
         params['enableUI'] = enable_ui
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'WebAuthn.enable',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     '''
     Disable the WebAuthn domain.
     '''
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'WebAuthn.disable',
     }
-    json = yield cmd_dict
 
 
 def add_virtual_authenticator(
@@ -238,13 +236,13 @@ def add_virtual_authenticator(
     :param options:
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['options'] = options.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'options': options.to_json(),
+    }
+    json = yield {
         'method': 'WebAuthn.addVirtualAuthenticator',
         'params': params,
     }
-    json = yield cmd_dict
     return AuthenticatorId.from_json(json['authenticatorId'])
 
 
@@ -262,19 +260,19 @@ def set_response_override_bits(
     :param is_bad_uv: *(Optional)* If isBadUV is set, overrides the UV bit in the flags in the authenticator response to be zero. Defaults to false.
     :param is_bad_up: *(Optional)* If isBadUP is set, overrides the UP bit in the flags in the authenticator response to be zero. Defaults to false.
     '''
-    params: T_JSON_DICT = dict()
-    params['authenticatorId'] = authenticator_id.to_json()
+    params: T_JSON_DICT = {
+        'authenticatorId': authenticator_id.to_json(),
+    }
     if is_bogus_signature is not None:
         params['isBogusSignature'] = is_bogus_signature
     if is_bad_uv is not None:
         params['isBadUV'] = is_bad_uv
     if is_bad_up is not None:
         params['isBadUP'] = is_bad_up
-    cmd_dict: T_JSON_DICT = {
+    yield {
         'method': 'WebAuthn.setResponseOverrideBits',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def remove_virtual_authenticator(
@@ -285,13 +283,13 @@ def remove_virtual_authenticator(
 
     :param authenticator_id:
     '''
-    params: T_JSON_DICT = dict()
-    params['authenticatorId'] = authenticator_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'authenticatorId': authenticator_id.to_json(),
+    }
+    yield {
         'method': 'WebAuthn.removeVirtualAuthenticator',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def add_credential(
@@ -304,14 +302,14 @@ def add_credential(
     :param authenticator_id:
     :param credential:
     '''
-    params: T_JSON_DICT = dict()
-    params['authenticatorId'] = authenticator_id.to_json()
-    params['credential'] = credential.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'authenticatorId': authenticator_id.to_json(),
+        'credential': credential.to_json(),
+    }
+    yield {
         'method': 'WebAuthn.addCredential',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def get_credential(
@@ -326,14 +324,14 @@ def get_credential(
     :param credential_id:
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['authenticatorId'] = authenticator_id.to_json()
-    params['credentialId'] = credential_id
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'authenticatorId': authenticator_id.to_json(),
+        'credentialId': credential_id,
+    }
+    json = yield {
         'method': 'WebAuthn.getCredential',
         'params': params,
     }
-    json = yield cmd_dict
     return Credential.from_json(json['credential'])
 
 
@@ -346,14 +344,14 @@ def get_credentials(
     :param authenticator_id:
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['authenticatorId'] = authenticator_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'authenticatorId': authenticator_id.to_json(),
+    }
+    json = yield {
         'method': 'WebAuthn.getCredentials',
         'params': params,
     }
-    json = yield cmd_dict
-    return [Credential.from_json(i) for i in json['credentials']]
+    return list(map(Credential.from_json, json['credentials']))
 
 
 def remove_credential(
@@ -366,14 +364,14 @@ def remove_credential(
     :param authenticator_id:
     :param credential_id:
     '''
-    params: T_JSON_DICT = dict()
-    params['authenticatorId'] = authenticator_id.to_json()
-    params['credentialId'] = credential_id
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'authenticatorId': authenticator_id.to_json(),
+        'credentialId': credential_id,
+    }
+    yield {
         'method': 'WebAuthn.removeCredential',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def clear_credentials(
@@ -384,13 +382,13 @@ def clear_credentials(
 
     :param authenticator_id:
     '''
-    params: T_JSON_DICT = dict()
-    params['authenticatorId'] = authenticator_id.to_json()
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'authenticatorId': authenticator_id.to_json(),
+    }
+    yield {
         'method': 'WebAuthn.clearCredentials',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_user_verified(
@@ -404,14 +402,14 @@ def set_user_verified(
     :param authenticator_id:
     :param is_user_verified:
     '''
-    params: T_JSON_DICT = dict()
-    params['authenticatorId'] = authenticator_id.to_json()
-    params['isUserVerified'] = is_user_verified
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'authenticatorId': authenticator_id.to_json(),
+        'isUserVerified': is_user_verified,
+    }
+    yield {
         'method': 'WebAuthn.setUserVerified',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 def set_automatic_presence_simulation(
@@ -425,14 +423,14 @@ def set_automatic_presence_simulation(
     :param authenticator_id:
     :param enabled:
     '''
-    params: T_JSON_DICT = dict()
-    params['authenticatorId'] = authenticator_id.to_json()
-    params['enabled'] = enabled
-    cmd_dict: T_JSON_DICT = {
+    params: T_JSON_DICT = {
+        'authenticatorId': authenticator_id.to_json(),
+        'enabled': enabled,
+    }
+    yield {
         'method': 'WebAuthn.setAutomaticPresenceSimulation',
         'params': params,
     }
-    json = yield cmd_dict
 
 
 @event_class('WebAuthn.credentialAdded')
@@ -6,13 +6,19 @@ import shutil
 import builtins
 import logging
 import operator
+import functools
 import itertools
 import inflection # type: ignore
 from enum import Enum
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from argparse import ArgumentParser, ArgumentTypeError
-from textwrap import dedent, indent as tw_indent
+from textwrap import dedent
+try:
+    import orjson # type: ignore
+except ImportError:
+    orjson = None # type: ignore
 
 
 log_level = getattr(logging, os.environ.get('LOG_LEVEL', 'info').upper())
@@ -41,21 +47,44 @@ MODULE_HEADER = """{}
 # CDP domain: {{}}{{}}
 
 from __future__ import annotations
-import enum
-import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+{{}}
 
 """.format(SHARED_HEADER)
 
 current_version = ''
 
+# Generating fewer domains than this is faster than starting worker processes.
+MIN_PARALLEL_DOMAINS = 4
+
 BACKTICK_RE = re.compile(r'`([^`]+)`(\w+)?')
 
+BUILTIN_NAMES = frozenset(dir(builtins))
+
 
 def indent(s: str, n: int):
-    ''' A shortcut for ``textwrap.indent`` that always uses spaces. '''
-    return tw_indent(s, n * ' ')
+    '''
+    Indent each line of ``s`` by ``n`` spaces.
+
+    Like ``textwrap.indent``, lines that only contain whitespace are left as
+    they are. It is faster because lines are only split on ``\\n`` and there is
+    no predicate call per line.
+    '''
+    prefix = n * ' '
+    return '\n'.join([prefix + line if line.strip() else line
+        for line in s.split('\n')])
+
+
+def replace_backticks(match: typing.Match) -> str:
+    ''' Replace one ``BACKTICK_RE`` match, see :func:`escape_backticks`. '''
+    name, trailer = match.groups()
+    if trailer == 's':
+        return f"``{name}``'s"
+    elif trailer:
+        # This case (some trailer other than "s") doesn't currently exist
+        # in the CDP definitions, but it's here just to be safe.
+        return f'``{name}`` {trailer}'
+    else:
+        return f'``{name}``'
 
 
 def escape_backticks(docstr: str) -> str:
@@ -67,19 +96,13 @@ def escape_backticks(docstr: str) -> str:
     If we double the backticks in that string, then it won't be valid RST. The
     fix is to insert an apostrophe if an "s" trails the backticks.
     '''
-    def replace_one(match):
-        if match.group(2) == 's':
-            return f"``{match.group(1)}``'s"
-        elif match.group(2):
-            # This case (some trailer other than "s") doesn't currently exist
-            # in the CDP definitions, but it's here just to be safe.
-            return f'``{match.group(1)}`` {match.group(2)}'
-        else:
-            return f'``{match.group(1)}``'
-
+    # Most descriptions have neither backticks nor pipes, so there is nothing
+    # to escape.
+    if '`' not in docstr and '|' not in docstr:
+        return docstr
     # Sometimes pipes are used where backticks should have been used.
     docstr = docstr.replace('|', '`')
-    return BACKTICK_RE.sub(replace_one, docstr)
+    return BACKTICK_RE.sub(replace_backticks, docstr)
 
 
 def inline_doc(description) -> str:
@@ -88,8 +111,7 @@ def inline_doc(description) -> str:
         return ''
 
     description = escape_backticks(description)
-    lines = ['#: {}'.format(l) for l in description.split('\n')]
-    return '\n'.join(lines)
+    return '#: ' + description.replace('\n', '\n#: ')
 
 
 def docstring(description: typing.Optional[str]) -> str:
@@ -99,29 +121,55 @@ def docstring(description: typing.Optional[str]) -> str:
     # if original description uses escape sequences it should be generated as a raw docstring
     description = escape_backticks(description)
     if '\\' in description:
-        return dedent("r'''\n{}\n'''").format(description)
+        return "r'''\n" + description + "\n'''"
     else:
-        return dedent("'''\n{}\n'''").format(description)
+        return "'''\n" + description + "\n'''"
 
 
 def is_builtin(name: str) -> bool:
     ''' Return True if ``name`` would shadow a builtin. '''
-    try:
-        getattr(builtins, name)
-        return True
-    except AttributeError:
-        return False
+    return name in BUILTIN_NAMES
+
 
+def underscore(name: str) -> str:
+    '''
+    Convert a camel case name to lower case words separated by underscores.
 
+    This gives the same result as ``inflection.underscore`` in a single pass
+    instead of two regex substitutions. A word starts at an uppercase letter
+    that follows a lowercase letter or a digit, and at the last uppercase
+    letter of an acronym that is followed by a lowercase letter, e.g.
+    ``HTTPHeader`` → ``http_header``. Dashes become underscores too.
+    '''
+    chars = list()
+    last = len(name) - 1
+    for i, char in enumerate(name):
+        if i and 'A' <= char <= 'Z':
+            prev = name[i - 1]
+            if 'a' <= prev <= 'z' or prev.isdecimal() or ('A' <= prev <= 'Z'
+                    and i < last and 'a' <= name[i + 1] <= 'z'):
+                chars.append('_')
+        chars.append(char)
+    return ''.join(chars).replace('-', '_').lower()
+
+
+@functools.lru_cache(maxsize=None)
 def snake_case(name: str) -> str:
     ''' Convert a camel case name to snake case. If the name would shadow a
     Python builtin, then append an underscore. '''
-    name = inflection.underscore(name)
+    name = underscore(name)
     if is_builtin(name):
         name += '_'
     return name
 
 
+@functools.lru_cache(maxsize=None)
+def camel_case(name: str) -> str:
+    ''' Convert a name to upper camel case. '''
+    return inflection.camelize(name, uppercase_first_letter=True)
+
+
+@functools.lru_cache(maxsize=None)
 def ref_to_python(ref: str) -> str:
     '''
     Convert a CDP ``$ref`` to the name of a Python type.
@@ -134,12 +182,92 @@ def ref_to_python(ref: str) -> str:
     return f"{ref}"
 
 
+@functools.lru_cache(maxsize=None)
 def ref_to_python_domain(ref: str, domain: str) -> str:
     if ref.startswith(domain + '.'):
         return ref_to_python(ref[len(domain)+1:])
     return ref_to_python(ref)
 
 
+# Templates for the generated code, these are dedented (and indented to their
+# place in the class body, where that is fixed) once at import time.
+OPTIONAL_TO_JSON_TMPL = dedent('''\
+    if {value} is not None:
+        {assign}''')
+
+PRIMITIVE_TO_JSON_TMPL = indent(dedent('''\
+    def to_json(self) -> {py_type}:
+        return self'''), 4)
+
+VALUE_FROM_JSON_TMPL = indent(dedent('''\
+    @classmethod
+    def from_json(cls, json: {py_type}) -> {id}:
+        return cls(json)'''), 4)
+
+PRIMITIVE_REPR_TMPL = indent(dedent('''\
+    def __repr__(self):
+        return '{id}({{}})'.format(super().__repr__())'''), 4)
+
+ENUM_TO_JSON_TMPL = indent(dedent('''\
+    def to_json(self) -> str:
+        return self.value'''), 4)
+
+CLASS_HEADER_TMPL = dedent('''\
+    @dataclass
+    class {id}:
+''')
+
+CLASS_TO_JSON_TMPL = dedent('''\
+    def to_json(self) -> T_JSON_DICT:
+        json: T_JSON_DICT = dict()
+''')
+
+CLASS_FROM_JSON_TMPL = dedent('''\
+    @classmethod
+    def from_json(cls, json: T_JSON_DICT) -> {id}:
+        return cls(
+''')
+
+EVENT_HEADER_TMPL = dedent('''\
+    @event_class('{domain}.{name}')
+    @dataclass
+    class {py_name}:''')
+
+EVENT_FROM_JSON_TMPL = indent(CLASS_FROM_JSON_TMPL, 4)
+
+# Templates for the Sphinx documents.
+SPHINX_TYPES_PREAMBLE = dedent('''\
+    Generally, you do not need to instantiate CDP types
+    yourself. Instead, the API creates objects for you as return
+    values from commands, and then you can use those objects as
+    arguments to other commands.
+''')
+
+SPHINX_COMMANDS_PREAMBLE = dedent('''\
+    Each command is a generator function. The return
+    type ``Generator[x, y, z]`` indicates that the generator
+    *yields* arguments of type ``x``, it must be resumed with
+    an argument of type ``y``, and it returns type ``z``. In
+    this library, types ``x`` and ``y`` are the same for all
+    commands, and ``z`` is the return type you should pay attention
+    to. For more information, see
+    :ref:`Getting Started: Commands <getting-started-commands>`.
+''')
+
+SPHINX_EVENTS_PREAMBLE = dedent('''\
+    Generally, you do not need to instantiate CDP events
+    yourself. Instead, the API creates events for you and then
+    you use the event\'s attributes.
+''')
+
+SPHINX_AUTOCLASS_TMPL = dedent('''
+    .. autoclass:: {}
+          :members:
+          :undoc-members:
+          :exclude-members: from_json, to_json
+''')
+
+
 class CdpPrimitiveType(Enum):
     ''' All of the CDP types that map directly to a Python type. '''
     boolean = 'bool'
@@ -151,10 +279,7 @@ class CdpPrimitiveType(Enum):
     @classmethod
     def get_annotation(cls, cdp_type):
         ''' Return a type annotation for the CDP type. '''
-        if cdp_type == 'any':
-            return 'typing.Any'
-        else:
-            return cls[cdp_type].value
+        return PRIMITIVE_ANNOTATIONS[cdp_type]
 
     @classmethod
     def get_constructor(cls, cdp_type, val):
@@ -162,10 +287,16 @@ class CdpPrimitiveType(Enum):
         if cdp_type == 'any':
             return val
         else:
-            cons = cls[cdp_type].value
+            cons = PRIMITIVE_ANNOTATIONS[cdp_type]
             return f'{cons}({val})'
 
 
+# Looking up an enum member by name is much slower than a plain dict lookup,
+# and this is done for every property, parameter and return.
+PRIMITIVE_ANNOTATIONS = {t.name: t.value for t in CdpPrimitiveType}
+PRIMITIVE_ANNOTATIONS['any'] = 'typing.Any'
+
+
 @dataclass
 class CdpItems:
     ''' Represents the type of a repeated item. '''
@@ -178,6 +309,9 @@ class CdpItems:
         return cls(type.get('type'), type.get('$ref'))
 
 
+T_PROPERTY = typing.TypeVar('T_PROPERTY', bound='CdpProperty')
+
+
 @dataclass
 class CdpProperty:
     ''' A property belonging to a non-primitive CDP type. '''
@@ -212,14 +346,13 @@ class CdpProperty:
                 py_ref = ref_to_python_domain(self.ref, self.domain)
                 ann = py_ref
             else:
-                ann = CdpPrimitiveType.get_annotation(
-                    typing.cast(str, self.type))
+                ann = CdpPrimitiveType.get_annotation(self.type)
         if self.optional:
             ann = f'typing.Optional[{ann}]'
         return ann
 
     @classmethod
-    def from_json(cls, prop, domain: str) -> 'CdpProperty':
+    def from_json(cls: typing.Type[T_PROPERTY], prop, domain: str) -> T_PROPERTY:
         ''' Instantiate a CDP property from a JSON object. '''
         return cls(
             prop['name'],
@@ -234,6 +367,13 @@ class CdpProperty:
             domain
         )
 
+    def get_ref(self) -> typing.Optional[str]:
+        ''' Return the ref of this property's items or, failing that, of the
+        property itself. '''
+        if self.items and self.items.ref:
+            return self.items.ref
+        return self.ref
+
     def generate_decl(self) -> str:
         ''' Generate the code that declares this property. '''
         code = inline_doc(self.description)
@@ -244,25 +384,29 @@ class CdpProperty:
             code += ' = None'
         return code
 
-    def generate_to_json(self, dict_: str, use_self: bool=True) -> str:
-        ''' Generate the code that exports this property to the specified JSON
-        dict. '''
+    def generate_to_json_value(self, use_self: bool=True) -> str:
+        ''' Generate the expression that exports this property's value to
+        JSON. '''
         self_ref = 'self.' if use_self else ''
-        assign = f"{dict_}['{self.name}'] = "
         if self.items:
             if self.items.ref:
-                assign += f"[i.to_json() for i in {self_ref}{self.py_name}]"
+                return f"[i.to_json() for i in {self_ref}{self.py_name}]"
             else:
-                assign += f"[i for i in {self_ref}{self.py_name}]"
+                return f"[i for i in {self_ref}{self.py_name}]"
         else:
             if self.ref:
-                assign += f"{self_ref}{self.py_name}.to_json()"
+                return f"{self_ref}{self.py_name}.to_json()"
             else:
-                assign += f"{self_ref}{self.py_name}"
+                return f"{self_ref}{self.py_name}"
+
+    def generate_to_json(self, dict_: str, use_self: bool=True) -> str:
+        ''' Generate the code that exports this property to the specified JSON
+        dict. '''
+        self_ref = 'self.' if use_self else ''
+        assign = f"{dict_}['{self.name}'] = {self.generate_to_json_value(use_self)}"
         if self.optional:
-            code = dedent(f'''\
-                if {self_ref}{self.py_name} is not None:
-                    {assign}''')
+            code = OPTIONAL_TO_JSON_TMPL.format(value=self_ref + self.py_name,
+                assign=assign)
         else:
             code = assign
         return code
@@ -273,7 +417,7 @@ class CdpProperty:
         if self.items:
             if self.items.ref:
                 py_ref = ref_to_python_domain(self.items.ref, self.domain)
-                expr = f"[{py_ref}.from_json(i) for i in {dict_}['{self.name}']]"
+                expr = f"list(map({py_ref}.from_json, {dict_}['{self.name}']))"
             else:
                 cons = CdpPrimitiveType.get_constructor(self.items.type, 'i')
                 expr = f"[{cons} for i in {dict_}['{self.name}']]"
@@ -335,28 +479,18 @@ class CdpType:
             py_type = CdpPrimitiveType.get_annotation(self.type)
             superclass = py_type
 
-        code = f'class {self.id}({superclass}):\n'
+        parts = [f'class {self.id}({superclass}):\n']
         doc = docstring(self.description)
         if doc:
-            code += indent(doc, 4) + '\n'
-
-        def_to_json = dedent(f'''\
-            def to_json(self) -> {py_type}:
-                return self''')
-        code += indent(def_to_json, 4)
+            parts.append(indent(doc, 4) + '\n')
 
-        def_from_json = dedent(f'''\
-            @classmethod
-            def from_json(cls, json: {py_type}) -> {self.id}:
-                return cls(json)''')
-        code += '\n\n' + indent(def_from_json, 4)
+        parts.append(PRIMITIVE_TO_JSON_TMPL.format(py_type=py_type))
+        parts.append('\n\n')
+        parts.append(VALUE_FROM_JSON_TMPL.format(py_type=py_type, id=self.id))
+        parts.append('\n\n')
+        parts.append(PRIMITIVE_REPR_TMPL.format(id=self.id))
 
-        def_repr = dedent(f'''\
-            def __repr__(self):
-                return '{self.id}({{}})'.format(super().__repr__())''')
-        code += '\n\n' + indent(def_repr, 4)
-
-        return code
+        return ''.join(parts)
 
     def generate_enum_code(self) -> str:
         '''
@@ -367,27 +501,20 @@ class CdpType:
         ``MyTypeClass.MY_ENUM_VALUE`` and is assigned a string value from the
         CDP metadata.
         '''
-        def_to_json = dedent('''\
-            def to_json(self) -> str:
-                return self.value''')
-
-        def_from_json = dedent(f'''\
-            @classmethod
-            def from_json(cls, json: str) -> {self.id}:
-                return cls(json)''')
-
-        code = f'class {self.id}(enum.Enum):\n'
+        parts = [f'class {self.id}(enum.Enum):\n']
         doc = docstring(self.description)
         if doc:
-            code += indent(doc, 4) + '\n'
+            parts.append(indent(doc, 4) + '\n')
         for enum_member in self.enum:
             snake_name = snake_case(enum_member).upper()
             enum_code = f'{snake_name} = "{enum_member}"\n'
-            code += indent(enum_code, 4)
-        code += '\n' + indent(def_to_json, 4)
-        code += '\n\n' + indent(def_from_json, 4)
+            parts.append(indent(enum_code, 4))
+        parts.append('\n')
+        parts.append(ENUM_TO_JSON_TMPL)
+        parts.append('\n\n')
+        parts.append(VALUE_FROM_JSON_TMPL.format(py_type='str', id=self.id))
 
-        return code
+        return ''.join(parts)
 
     def generate_class_code(self) -> str:
         '''
@@ -397,50 +524,44 @@ class CdpType:
         dataclasses.
         '''
         # children = set()
-        code = dedent(f'''\
-            @dataclass
-            class {self.id}:\n''')
+        parts = [CLASS_HEADER_TMPL.format(id=self.id)]
         doc = docstring(self.description)
         if doc:
-            code += indent(doc, 4) + '\n'
+            parts.append(indent(doc, 4) + '\n')
 
         # Emit property declarations. These are sorted so that optional
         # properties come after required properties, which is required to make
-        # the dataclass constructor work.
+        # the dataclass constructor work. The to_json() and from_json() bodies
+        # follow the same order for readability, so all three are collected in
+        # a single pass.
         props = list(self.properties)
         props.sort(key=operator.attrgetter('optional'))
-        code += '\n\n'.join(indent(p.generate_decl(), 4) for p in props)
-        code += '\n\n'
-
-        # Emit to_json() method. The properties are sorted in the same order as
-        # above for readability.
-        def_to_json = dedent('''\
-            def to_json(self) -> T_JSON_DICT:
-                json: T_JSON_DICT = dict()
-        ''')
-        assigns = (p.generate_to_json(dict_='json') for p in props)
-        def_to_json += indent('\n'.join(assigns), 4)
-        def_to_json += '\n'
-        def_to_json += indent('return json', 4)
-        code += indent(def_to_json, 4) + '\n\n'
-
-        # Emit from_json() method. The properties are sorted in the same order
-        # as above for readability.
-        def_from_json = dedent(f'''\
-            @classmethod
-            def from_json(cls, json: T_JSON_DICT) -> {self.id}:
-                return cls(
-        ''')
+        decls = list()
+        assigns = list()
         from_jsons = list()
         for p in props:
+            decls.append(indent(p.generate_decl(), 4))
+            assigns.append(p.generate_to_json(dict_='json'))
             from_json = p.generate_from_json(dict_='json')
             from_jsons.append(f'{p.py_name}={from_json},')
+        parts.append('\n\n'.join(decls))
+        parts.append('\n\n')
+
+        # Emit to_json() method.
+        def_to_json = CLASS_TO_JSON_TMPL
+        def_to_json += indent('\n'.join(assigns), 4)
+        def_to_json += '\n'
+        def_to_json += indent('return json', 4)
+        parts.append(indent(def_to_json, 4) + '\n\n')
+
+        # Emit from_json() method.
+        def_from_json = CLASS_FROM_JSON_TMPL.format(id=self.id)
         def_from_json += indent('\n'.join(from_jsons), 8)
         def_from_json += '\n'
         def_from_json += indent(')', 4)
-        code += indent(def_from_json, 4)
+        parts.append(indent(def_from_json, 4))
 
-        return code
+        return ''.join(parts)
 
     def get_refs(self):
         ''' Return all refs for this type. '''
@@ -450,11 +571,8 @@ class CdpType:
             pass
         elif self.properties:
             # Enumerate refs for a class type.
-            for prop in self.properties:
-                if prop.items and prop.items.ref:
-                    refs.add(prop.items.ref)
-                elif prop.ref:
-                    refs.add(prop.ref)
+            refs = {prop.get_ref() for prop in self.properties}
+            refs.discard(None)
         else:
             # A primitive type can't have a direct ref, but it can have an items
             # which contains a ref.
@@ -478,8 +596,7 @@ class CdpParameter(CdpProperty):
             if self.ref:
                 py_type = "{}".format(ref_to_python(self.ref))
             else:
-                py_type = CdpPrimitiveType.get_annotation(
-                    typing.cast(str, self.type))
+                py_type = CdpPrimitiveType.get_annotation(self.type)
         if self.optional:
             py_type = f'typing.Optional[{py_type}]'
         code = f"{self.py_name}: {py_type}"
@@ -587,8 +704,8 @@ class CdpCommand:
             command.get('description'),
             command.get('experimental', False),
             command.get('deprecated', False),
-            [typing.cast(CdpParameter, CdpParameter.from_json(p, domain)) for p in parameters],
-            [typing.cast(CdpReturn, CdpReturn.from_json(r, domain)) for r in returns],
+            [CdpParameter.from_json(p, domain) for p in parameters],
+            [CdpReturn.from_json(r, domain) for r in returns],
             domain
         )
 
@@ -605,22 +722,22 @@ class CdpCommand:
             ret_type = f'typing.Tuple[{nested_types}]'
         ret_type = f"typing.Generator[T_JSON_DICT,T_JSON_DICT,{ret_type}]"
 
-        code = ''
+        parts = []
 
         if self.deprecated:
-            code += f'@deprecated(version="{current_version}")\n'
+            parts.append(f'@deprecated(version="{current_version}")\n')
 
-        code += f'def {self.py_name}('
+        parts.append(f'def {self.py_name}(')
         ret = f') -> {ret_type}:\n'
         if self.parameters:
-            sorted_params = sorted(self.parameters, key=lambda param: 1 if param.optional else 0)
-            code += '\n'
-            code += indent(
-                ',\n'.join(p.generate_code() for p in sorted_params), 8)
-            code += '\n'
-            code += indent(ret, 4) 
+            sorted_params = sorted(self.parameters, key=operator.attrgetter('optional'))
+            parts.append('\n')
+            parts.append(indent(
+                ',\n'.join(p.generate_code() for p in sorted_params), 8))
+            parts.append('\n')
+            parts.append(indent(ret, 4))
         else:
-            code += ret
+            parts.append(ret)
 
         # Generate the docstring
         doc = ''
@@ -646,44 +763,57 @@ class CdpCommand:
                 in enumerate(self.returns))
             doc += indent(ret_docs, 4)
         if doc:
-            code += indent(docstring(doc), 4)
+            parts.append(indent(docstring(doc), 4))
 
-        # Generate the function body
+        # Generate the function body. Required parameters always have the same
+        # keys, so they are emitted as a dict literal and only the optional
+        # parameters are assigned one by one.
         if self.parameters:
-            code += '\n'
-            code += indent('params: T_JSON_DICT = dict()', 4)
-            code += '\n'
-        assigns = (p.generate_to_json(dict_='params', use_self=False)
-            for p in self.parameters)
-        code += indent('\n'.join(assigns), 4)
-        code += '\n'
-        code += indent('cmd_dict: T_JSON_DICT = {\n', 4)
-        code += indent(f"'method': '{self.domain}.{self.name}',\n", 8)
+            items = list()
+            assigns = list()
+            for p in self.parameters:
+                if p.optional:
+                    assigns.append(p.generate_to_json(dict_='params', use_self=False))
+                else:
+                    items.append(f"'{p.name}': {p.generate_to_json_value(use_self=False)},\n")
+            parts.append('\n')
+            if items:
+                parts.append(indent('params: T_JSON_DICT = {\n', 4))
+                parts.append(indent(''.join(items), 8))
+                parts.append(indent('}\n', 4))
+            else:
+                parts.append(indent('params: T_JSON_DICT = dict()\n', 4))
+            if assigns:
+                parts.append(indent('\n'.join(assigns), 4))
+                parts.append('\n')
+        else:
+            parts.append('\n')
+        # The request is yielded directly, a command without returns gets an
+        # empty response so there is nothing to bind it to.
+        if self.returns:
+            parts.append(indent('json = yield {\n', 4))
+        else:
+            parts.append(indent('yield {\n', 4))
+        parts.append(indent(f"'method': '{self.domain}.{self.name}',\n", 8))
         if self.parameters:
-            code += indent("'params': params,\n", 8)
-        code += indent('}\n', 4)
-        code += indent('json = yield cmd_dict', 4)
-        if len(self.returns) == 0:
-            pass
-        elif len(self.returns) == 1:
+            parts.append(indent("'params': params,\n", 8))
+        parts.append(indent('}', 4))
+        if len(self.returns) == 1:
             ret = self.returns[0].generate_return(dict_='json')
-            code += indent(f'\nreturn {ret}', 4)
-        else:
+            parts.append(indent(f'\nreturn {ret}', 4))
+        elif len(self.returns) > 1:
             ret = '\nreturn (\n'
             expr = ',\n'.join(r.generate_return(dict_='json') for r in self.returns)
             ret += indent(expr, 4)
             ret += '\n)'
-            code += indent(ret, 4)
-        return code
+            parts.append(indent(ret, 4))
+        return ''.join(parts)
 
     def get_refs(self):
         ''' Get all refs for this command. '''
-        refs = set()
-        for type_ in itertools.chain(self.parameters, self.returns):
-            if type_.items and type_.items.ref:
-                refs.add(type_.items.ref)
-            elif type_.ref:
-                refs.add(type_.ref)
+        refs = {type_.get_ref() for type_ in itertools.chain(self.parameters,
+            self.returns)}
+        refs.discard(None)
         return refs
 
 
@@ -700,7 +830,7 @@ class CdpEvent:
     @property
     def py_name(self):
         ''' Return the Python class name for this event. '''
-        return inflection.camelize(self.name, uppercase_first_letter=True)
+        return camel_case(self.name)
 
     @classmethod
     def from_json(cls, json: dict, domain: str):
@@ -710,7 +840,7 @@ class CdpEvent:
             json.get('description'),
             json.get('deprecated', False),
             json.get('experimental', False),
-            [typing.cast(CdpParameter, CdpParameter.from_json(p, domain))
+            [CdpParameter.from_json(p, domain)
                 for p in json.get('parameters', list())],
             domain
         )
@@ -718,15 +848,13 @@ class CdpEvent:
     def generate_code(self) -> str:
         ''' Generate code for a CDP event. '''
         global current_version
-        code = dedent(f'''\
-            @event_class('{self.domain}.{self.name}')
-            @dataclass
-            class {self.py_name}:''')
-
+        parts = []
         if self.deprecated:
-            code = f'@deprecated(version="{current_version}")\n' + code
+            parts.append(f'@deprecated(version="{current_version}")\n')
 
-        code += '\n'
+        parts.append(EVENT_HEADER_TMPL.format(domain=self.domain, name=self.name,
+            py_name=self.py_name))
+        parts.append('\n')
         desc = ''
         if self.description or self.experimental:
             if self.experimental:
@@ -735,32 +863,23 @@ class CdpEvent:
             if self.description:
                 desc += self.description
 
-            code += indent(docstring(desc), 4)
-            code += '\n'
-        code += indent(
-            '\n'.join(p.generate_decl() for p in self.parameters), 4)
-        code += '\n\n'
-        def_from_json = dedent(f'''\
-            @classmethod
-            def from_json(cls, json: T_JSON_DICT) -> {self.py_name}:
-                return cls(
-        ''')
-        code += indent(def_from_json, 4)
+            parts.append(indent(docstring(desc), 4))
+            parts.append('\n')
+        parts.append(indent(
+            '\n'.join(p.generate_decl() for p in self.parameters), 4))
+        parts.append('\n\n')
+        parts.append(EVENT_FROM_JSON_TMPL.format(id=self.py_name))
         from_json = ',\n'.join(p.generate_from_json(dict_='json')
             for p in self.parameters)
-        code += indent(from_json, 12)
-        code += '\n'
-        code += indent(')', 8)
-        return code
+        parts.append(indent(from_json, 12))
+        parts.append('\n')
+        parts.append(indent(')', 8))
+        return ''.join(parts)
 
     def get_refs(self):
         ''' Get all refs for this event. '''
-        refs = set()
-        for param in self.parameters:
-            if param.items and param.items.ref:
-                refs.add(param.items.ref)
-            elif param.ref:
-                refs.add(param.ref)
+        refs = {param.get_ref() for param in self.parameters}
+        refs.discard(None)
         return refs
 
 
@@ -802,21 +921,45 @@ class CdpDomain:
     def generate_code(self) -> str:
         ''' Generate the Python module code for a given CDP domain. '''
         exp = ' (experimental)' if self.experimental else ''
-        code = MODULE_HEADER.format(self.domain, exp)
+        parts = [MODULE_HEADER.format(self.domain, exp, self.generate_header_imports())]
         import_code = self.generate_imports()
         if import_code:
-            code += import_code
-            code += '\n\n'
-        code += '\n'
+            parts.append(import_code)
+            parts.append('\n\n')
+        parts.append('\n')
         item_iter_t = typing.Union[CdpEvent, CdpCommand, CdpType]
         item_iter: typing.Iterator[item_iter_t] = itertools.chain(
             iter(self.types),
             iter(self.commands),
             iter(self.events),
         )
-        code += '\n\n\n'.join(item.generate_code() for item in item_iter)
-        code += '\n'
-        return code
+        # Items are separated by two blank lines, the separator goes before
+        # every item but the first one.
+        for i, item in enumerate(item_iter):
+            if i:
+                parts.append('\n\n\n')
+            parts.append(item.generate_code())
+        parts.append('\n')
+        return ''.join(parts)
+
+    def generate_header_imports(self) -> str:
+        '''
+        Emit the standard library and ``util`` imports for this module. Only the
+        names the generated code actually uses are imported.
+        '''
+        has_enum = any(type_.enum for type_ in self.types)
+        has_class = any(not type_.enum and type_.properties for type_ in self.types)
+        imports = []
+        if has_enum:
+            imports.append('import enum')
+        imports.append('import typing')
+        if has_class or self.events:
+            imports.append('from dataclasses import dataclass')
+        if self.events:
+            imports.append('from .util import event_class, T_JSON_DICT')
+        else:
+            imports.append('from .util import T_JSON_DICT')
+        return '\n'.join(imports)
 
     def generate_imports(self):
         '''
@@ -828,18 +971,10 @@ class CdpDomain:
         import to make our Python code work correctly and type safe. So we
         ignore the CDP's declared dependencies and compute them ourselves.
         '''
-        refs = set()
-        needs_deprecation = False
-        for type_ in self.types:
-            refs |= type_.get_refs()
-        for command in self.commands:
-            refs |= command.get_refs()
-            if command.deprecated:
-                needs_deprecation = True
-        for event in self.events:
-            refs |= event.get_refs()
-            if event.deprecated:
-                needs_deprecation = True
+        refs = set().union(*(item.get_refs() for item in
+            itertools.chain(self.types, self.commands, self.events)))
+        needs_deprecation = any(item.deprecated for item in
+            itertools.chain(self.commands, self.events))
         dependencies = set()
         for ref in refs:
             try:
@@ -859,64 +994,40 @@ class CdpDomain:
         '''
         Generate a Sphinx document for this domain.
         '''
-        docs = self.domain + '\n'
-        docs += '=' * len(self.domain) + '\n\n'
+        parts = [self.domain + '\n']
+        parts.append('=' * len(self.domain) + '\n\n')
         if self.description:
-            docs += f'{self.description}\n\n'
+            parts.append(f'{self.description}\n\n')
         if self.experimental:
-            docs += '*This CDP domain is experimental.*\n\n'
-        docs += f'.. module:: cdp.{self.module}\n\n'
-        docs += '* Types_\n* Commands_\n* Events_\n\n'
+            parts.append('*This CDP domain is experimental.*\n\n')
+        parts.append(f'.. module:: cdp.{self.module}\n\n')
+        parts.append('* Types_\n* Commands_\n* Events_\n\n')
 
-        docs += 'Types\n-----\n\n'
+        parts.append('Types\n-----\n\n')
         if self.types:
-            docs += dedent('''\
-                Generally, you do not need to instantiate CDP types
-                yourself. Instead, the API creates objects for you as return
-                values from commands, and then you can use those objects as
-                arguments to other commands.
-            ''')
+            parts.append(SPHINX_TYPES_PREAMBLE)
         else:
-            docs += '*There are no types in this module.*\n'
+            parts.append('*There are no types in this module.*\n')
         for type in self.types:
-            docs += f'\n.. autoclass:: {type.id}\n'
-            docs += '      :members:\n'
-            docs += '      :undoc-members:\n'
-            docs += '      :exclude-members: from_json, to_json\n'
+            parts.append(SPHINX_AUTOCLASS_TMPL.format(type.id))
 
-        docs += '\nCommands\n--------\n\n'
+        parts.append('\nCommands\n--------\n\n')
         if self.commands:
-            docs += dedent('''\
-                Each command is a generator function. The return
-                type ``Generator[x, y, z]`` indicates that the generator
-                *yields* arguments of type ``x``, it must be resumed with
-                an argument of type ``y``, and it returns type ``z``. In
-                this library, types ``x`` and ``y`` are the same for all
-                commands, and ``z`` is the return type you should pay attention
-                to. For more information, see
-                :ref:`Getting Started: Commands <getting-started-commands>`.
-            ''')
+            parts.append(SPHINX_COMMANDS_PREAMBLE)
         else:
-            docs += '*There are no types in this module.*\n'
+            parts.append('*There are no types in this module.*\n')
         for command in sorted(self.commands, key=operator.attrgetter('py_name')):
-            docs += f'\n.. autofunction:: {command.py_name}\n'
+            parts.append(f'\n.. autofunction:: {command.py_name}\n')
 
-        docs += '\nEvents\n------\n\n'
+        parts.append('\nEvents\n------\n\n')
         if self.events:
-            docs += dedent('''\
-                Generally, you do not need to instantiate CDP events
-                yourself. Instead, the API creates events for you and then
-                you use the event\'s attributes.
-            ''')
+            parts.append(SPHINX_EVENTS_PREAMBLE)
         else:
-            docs += '*There are no events in this module.*\n'
+            parts.append('*There are no events in this module.*\n')
         for event in self.events:
-            docs += f'\n.. autoclass:: {event.py_name}\n'
-            docs += '      :members:\n'
-            docs += '      :undoc-members:\n'
-            docs += '      :exclude-members: from_json, to_json\n'
+            parts.append(SPHINX_AUTOCLASS_TMPL.format(event.py_name))
 
-        return docs
+        return ''.join(parts)
 
 
 def parse(json_path, output_path):
@@ -928,8 +1039,11 @@ def parse(json_path, output_path):
     :returns: a list of CDP domain objects
     '''
     global current_version
-    with json_path.open() as json_file:
-        schema = json.load(json_file)
+    if orjson is not None:
+        schema = orjson.loads(json_path.read_bytes())
+    else:
+        with json_path.open() as json_file:
+            schema = json.load(json_file)
     version = schema['version']
     assert (version['major'], version['minor']) == ('1', '3')
     current_version = f'{version["major"]}.{version["minor"]}'
@@ -939,6 +1053,57 @@ def parse(json_path, output_path):
     return domains
 
 
+def write_file(path: Path, text: str):
+    '''
+    Write generated text to ``path``, unless the file already has it.
+
+    The text is encoded once and written in a single call, without going
+    through a text mode file. That also makes the output UTF-8 with ``\\n``
+    line endings regardless of the platform. Files that did not change keep
+    their modification time, so tools that cache by mtime don't redo work
+    after a regeneration.
+    '''
+    data = text.encode('utf-8')
+    try:
+        if path.read_bytes() == data:
+            logger.debug('Skipping unchanged file %s', path)
+            return
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+
+
+def set_current_version(version: str):
+    ''' Set the CDP version used for deprecation notices, this is also the
+    initializer of the code generation worker processes. '''
+    global current_version
+    current_version = version
+
+
+def map_domains(func: typing.Callable[[CdpDomain], str], domains) -> typing.Iterator[str]:
+    '''
+    Generate code or docs for each domain with ``func``.
+
+    The domains are independent of each other once the spec is parsed and
+    fixed, so they are generated in worker processes when there is more than
+    one CPU and enough domains to make up for starting the workers. Results
+    are yielded as soon as they are ready, so the caller can write a file
+    while the workers are still generating the next ones.
+
+    :param func: a module level function or a ``CdpDomain`` method, so that it
+        can be sent to the workers
+    :param list[CdpDomain] domains: the domains to generate
+    :returns: an iterator over the result for each domain, in the same order
+    '''
+    workers = min(len(domains), os.cpu_count() or 1)
+    if workers < 2 or len(domains) < MIN_PARALLEL_DOMAINS:
+        yield from map(func, domains)
+        return
+    with ProcessPoolExecutor(workers, initializer=set_current_version,
+            initargs=(current_version,)) as executor:
+        yield from executor.map(func, domains)
+
+
 def generate_init(init_path, domains):
     '''
     Generate an ``__init__.py`` that exports the specified modules.
@@ -947,9 +1112,8 @@ def generate_init(init_path, domains):
     :param list[tuple] modules: a list of modules each represented as tuples
         of (name, list_of_exported_symbols)
     '''
-    with init_path.open('w') as init_file:
-        init_file.write(INIT_HEADER)
-        init_file.write('from . import ({})'.format(', '.join(domain.module for domain in domains)))
+    modules = ', '.join(domain.module for domain in domains)
+    write_file(init_path, f'{INIT_HEADER}from . import ({modules})')
 
 
 def generate_docs(docs_path, domains):
@@ -957,16 +1121,21 @@ def generate_docs(docs_path, domains):
     Generate Sphinx documents for each domain.
     '''
     logger.info('Generating Sphinx documents')
+    docs_path.mkdir(parents=True, exist_ok=True)
 
-    # Remove generated documents
-    for subpath in docs_path.iterdir():
-        subpath.unlink()
+    sphinx = map_domains(CdpDomain.generate_sphinx, domains)
+    docs = {f'{domain.module}.rst': doc for domain, doc in zip(domains, sphinx)}
+
+    # Remove documents of domains that are gone, the others are overwritten in
+    # place so that unchanged documents are left untouched.
+    with os.scandir(docs_path) as entries:
+        for entry in entries:
+            if entry.name not in docs:
+                os.unlink(entry.path)
 
     # Generate document for each domain
-    for domain in domains:
-        doc = docs_path / f'{domain.module}.rst'
-        with doc.open('w') as f:
-            f.write(domain.generate_sphinx())
+    for name, doc in docs.items():
+        write_file(docs_path / name, doc)
 
 
 def fix_protocol_spec(domains):
@@ -974,26 +1143,26 @@ def fix_protocol_spec(domains):
     1. DOM includes an erroneous $ref that refers to itself.
     2. Page includes an event with an extraneous backtick in the description.
     3. Network.Cookie.expires is optional because sometimes its value can be null."""
-    for domain in domains:
-        if domain.domain == 'DOM':
-            for cmd in domain.commands:
-                if cmd.name == 'resolveNode':
-                    # Patch 1
-                    cmd.parameters[1].ref = 'BackendNodeId'
-                    break
-        elif domain.domain == 'Page':
-            for event in domain.events:
-                if event.name == 'screencastVisibilityChanged':
-                    # Patch 2
-                    event.description = event.description.replace('`', '')
-                    break
-        elif domain.domain == 'Network':
-            for _type in domain.types:
-                if _type.id == 'Cookie':
-                    for prop in _type.properties:
-                        if prop.name == 'expires':
-                            prop.optional = True
-                            break
+    def find(items, attr, value):
+        return next((item for item in items if getattr(item, attr) == value), None)
+
+    by_name = {domain.domain: domain for domain in domains}
+    if 'DOM' in by_name:
+        cmd = find(by_name['DOM'].commands, 'name', 'resolveNode')
+        if cmd:
+            # Patch 1
+            cmd.parameters[1].ref = 'BackendNodeId'
+    if 'Page' in by_name:
+        event = find(by_name['Page'].events, 'name', 'screencastVisibilityChanged')
+        if event:
+            # Patch 2
+            event.description = event.description.replace('`', '')
+    if 'Network' in by_name:
+        _type = find(by_name['Network'].types, 'id', 'Cookie')
+        prop = find(_type.properties, 'name', 'expires') if _type else None
+        if prop:
+            # Patch 3
+            prop.optional = True
 
 
 def selfgen():
@@ -1004,7 +1173,7 @@ def selfgen():
         here / 'js_protocol.json',
     ]
     output_path = here.parent / 'cdp'
-    output_path.mkdir(exist_ok=True)
+    output_path.mkdir(parents=True, exist_ok=True)
 
     # Parse domains
     domains = list()
@@ -1013,17 +1182,15 @@ def selfgen():
         domains.extend(parse(json_path, output_path))
     domains.sort(key=operator.attrgetter('domain'))
     fix_protocol_spec(domains)
-    for domain in domains:
+    for domain, code in zip(domains, map_domains(CdpDomain.generate_code, domains)):
         logger.info('Generating module: %s → %s.py', domain.domain,
             domain.module)
-        module_path = output_path / f'{domain.module}.py'
-        with module_path.open('w') as module_file:
-            module_file.write(domain.generate_code())
+        write_file(output_path / f'{domain.module}.py', code)
 
     generate_init(output_path / '__init__.py', domains)
     generate_docs(here.parent.parent / 'docs' / 'api', domains)
-    (output_path / 'README.md').write_text(GENERATED_PACKAGE_NOTICE)
-    (output_path / 'py.typed').touch()
+    write_file(output_path / 'README.md', GENERATED_PACKAGE_NOTICE)
+    write_file(output_path / 'py.typed', '')
 
 
 def cdpgen():
@@ -1058,8 +1225,7 @@ def cdpgen():
     browser_proto = Path(args.browser_protocol)
     js_proto = Path(args.js_protocol)
     output = Path(args.output)
-    if not output.exists():
-        output.mkdir()
+    output.mkdir(parents=True, exist_ok=True)
     # parse the spec files
     domains = list()
     for json_path in (browser_proto, js_proto):
@@ -1068,16 +1234,17 @@ def cdpgen():
     domains.sort(key=operator.attrgetter('domain'))
     fix_protocol_spec(domains)
     # generate python code
-    for domain in domains:
+    for domain, code in zip(domains, map_domains(CdpDomain.generate_code, domains)):
         logger.info('Generating module: %s → %s/%s.py', domain.domain, output, domain.module)
-        (output / f'{domain.module}.py').write_text(domain.generate_code())
-    try:
-        shutil.copyfile(Path(__file__).parent.parent / 'cdp' / 'util.py', output / 'util.py')
-    except shutil.SameFileError:
-        pass
+        write_file(output / f'{domain.module}.py', code)
+    util_path = Path(__file__).parent.parent / 'cdp' / 'util.py'
+    output_util_path = output / 'util.py'
+    # When generating into pycdp/cdp itself, util.py is already in place.
+    if not (output_util_path.exists() and util_path.samefile(output_util_path)):
+        shutil.copyfile(util_path, output_util_path)
     generate_init(output / '__init__.py', domains)
-    (output / 'README.md').write_text(GENERATED_PACKAGE_NOTICE)
-    (output / 'py.typed').touch()
+    write_file(output / 'README.md', GENERATED_PACKAGE_NOTICE)
+    write_file(output / 'py.typed', '')
 
 
 if __name__ == '__main__':
@@ -12,7 +12,9 @@ codegen tests is almost always easier with the values displayed on stdout.
 
 from textwrap import dedent
 
-from .generate import CdpCommand, CdpDomain, CdpEvent, CdpType, docstring
+import inflection # type: ignore
+
+from .generate import CdpCommand, CdpDomain, CdpEvent, CdpType, docstring, underscore
 
 
 def test_docstring():
@@ -210,9 +212,9 @@ def test_cdp_class_type():
             def from_json(cls, json: T_JSON_DICT) -> AXValue:
                 return cls(
                     type_=AXValueType.from_json(json['type']),
-                    value=json['value'] if 'value' in json else None,
-                    related_nodes=[AXRelatedNode.from_json(i) for i in json['relatedNodes']] if 'relatedNodes' in json else None,
-                    sources=[AXValueSource.from_json(i) for i in json['sources']] if 'sources' in json else None,
+                    value=json['value'] if json.get('value', None) is not None else None,
+                    related_nodes=list(map(AXRelatedNode.from_json, json['relatedNodes'])) if json.get('relatedNodes', None) is not None else None,
+                    sources=list(map(AXValueSource.from_json, json['sources'])) if json.get('sources', None) is not None else None,
                 )""")
 
     type = CdpType.from_json(json_type, '')
@@ -289,12 +291,11 @@ def test_cdp_command():
                 params['objectId'] = object_id.to_json()
             if fetch_relatives is not None:
                 params['fetchRelatives'] = fetch_relatives
-            cmd_dict: T_JSON_DICT = {
+            json = yield {
                 'method': 'Accessibility.getPartialAXTree',
                 'params': params,
             }
-            json = yield cmd_dict
-            return [AXNode.from_json(i) for i in json['nodes']]""")
+            return list(map(AXNode.from_json, json['nodes']))""")
 
     cmd = CdpCommand.from_json(json_cmd, 'Accessibility')
     actual = cmd.generate_code()
@@ -311,16 +312,96 @@ def test_cdp_command_no_params_or_returns():
             '''
             Disables the accessibility domain.
             '''
-            cmd_dict: T_JSON_DICT = {
+            yield {
                 'method': 'Accessibility.disable',
-            }
-            json = yield cmd_dict""")
+            }""")
 
     cmd = CdpCommand.from_json(json_cmd, 'Accessibility')
     actual = cmd.generate_code()
     assert expected == actual
 
 
+def test_cdp_command_only_optional_params():
+    json_cmd = {
+        "name": "clearBrowserCache",
+        "description": "Clears browser cache.",
+        "parameters": [
+            {
+                "name": "maxAge",
+                "description": "Maximum age of entries in seconds.",
+                "optional": True,
+                "type": "integer"
+            }
+        ]
+    }
+    expected = dedent("""\
+        def clear_browser_cache(
+                max_age: typing.Optional[int] = None
+            ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+            '''
+            Clears browser cache.
+
+            :param max_age: *(Optional)* Maximum age of entries in seconds.
+            '''
+            params: T_JSON_DICT = dict()
+            if max_age is not None:
+                params['maxAge'] = max_age
+            yield {
+                'method': 'Network.clearBrowserCache',
+                'params': params,
+            }""")
+
+    cmd = CdpCommand.from_json(json_cmd, 'Network')
+    actual = cmd.generate_code()
+    assert expected == actual
+
+
+def test_cdp_command_optional_before_required_param():
+    ''' Required params go in the dict literal, so they come first in the JSON
+    even when the spec lists an optional param before them. '''
+    json_cmd = {
+        "name": "setTimeout",
+        "description": "Sets a timeout.",
+        "parameters": [
+            {
+                "name": "reason",
+                "description": "Why the timeout is set.",
+                "optional": True,
+                "type": "string"
+            },
+            {
+                "name": "timeout",
+                "description": "Timeout in milliseconds.",
+                "type": "number"
+            }
+        ]
+    }
+    expected = dedent("""\
+        def set_timeout(
+                timeout: float,
+                reason: typing.Optional[str] = None
+            ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+            '''
+            Sets a timeout.
+
+            :param reason: *(Optional)* Why the timeout is set.
+            :param timeout: Timeout in milliseconds.
+            '''
+            params: T_JSON_DICT = {
+                'timeout': timeout,
+            }
+            if reason is not None:
+                params['reason'] = reason
+            yield {
+                'method': 'Emulation.setTimeout',
+                'params': params,
+            }""")
+
+    cmd = CdpCommand.from_json(json_cmd, 'Emulation')
+    actual = cmd.generate_code()
+    assert expected == actual
+
+
 def test_cdp_command_return_primitive():
     json_cmd = {
         "name": "getCurrentTime",
@@ -350,13 +431,13 @@ def test_cdp_command_return_primitive():
             :param id_: Id of animation.
             :returns: Current time of the page.
             '''
-            params: T_JSON_DICT = dict()
-            params['id'] = id_
-            cmd_dict: T_JSON_DICT = {
+            params: T_JSON_DICT = {
+                'id': id_,
+            }
+            json = yield {
                 'method': 'Animation.getCurrentTime',
                 'params': params,
             }
-            json = yield cmd_dict
             return float(json['currentTime'])""")
 
     cmd = CdpCommand.from_json(json_cmd, 'Animation')
@@ -390,10 +471,9 @@ def test_cdp_command_return_array_of_primitive():
 
             :returns: Commandline parameters
             '''
-            cmd_dict: T_JSON_DICT = {
+            json = yield {
                 'method': 'Browser.getBrowserCommandLine',
             }
-            json = yield cmd_dict
             return [str(i) for i in json['arguments']]""")
 
     cmd = CdpCommand.from_json(json_cmd, 'Browser')
@@ -425,13 +505,13 @@ def test_cdp_command_array_of_primitive_parameter():
 
             :param animations: List of animation ids to seek.
             '''
-            params: T_JSON_DICT = dict()
-            params['animations'] = [i for i in animations]
-            cmd_dict: T_JSON_DICT = {
+            params: T_JSON_DICT = {
+                'animations': [i for i in animations],
+            }
+            yield {
                 'method': 'Animation.releaseAnimations',
                 'params': params,
-            }
-            json = yield cmd_dict""")
+            }""")
 
     cmd = CdpCommand.from_json(json_cmd, 'Animation')
     actual = cmd.generate_code()
@@ -467,13 +547,13 @@ def test_cdp_command_ref_parameter():
             :param animation_id: Animation id.
             :returns: Corresponding remote object.
             '''
-            params: T_JSON_DICT = dict()
-            params['animationId'] = animation_id
-            cmd_dict: T_JSON_DICT = {
+            params: T_JSON_DICT = {
+                'animationId': animation_id,
+            }
+            json = yield {
                 'method': 'Animation.resolveAnimation',
                 'params': params,
             }
-            json = yield cmd_dict
             return runtime.RemoteObject.from_json(json['remoteObject'])""")
 
     cmd = CdpCommand.from_json(json_cmd, 'Animation')
@@ -554,20 +634,20 @@ def test_cdp_command_multiple_return():
                 1. **originalSize** - Size before re-encoding.
                 2. **encodedSize** - Size after re-encoding.
             '''
-            params: T_JSON_DICT = dict()
-            params['requestId'] = request_id.to_json()
-            params['encoding'] = encoding
+            params: T_JSON_DICT = {
+                'requestId': request_id.to_json(),
+                'encoding': encoding,
+            }
             if quality is not None:
                 params['quality'] = quality
             if size_only is not None:
                 params['sizeOnly'] = size_only
-            cmd_dict: T_JSON_DICT = {
+            json = yield {
                 'method': 'Audits.getEncodedResponse',
                 'params': params,
             }
-            json = yield cmd_dict
             return (
-                str(json['body']) if 'body' in json else None,
+                str(json['body']) if json.get('body', None) is not None else None,
                 int(json['originalSize']),
                 int(json['encodedSize'])
             )""")
@@ -617,16 +697,16 @@ def test_cdp_command_array_of_ref_parameter():
             :param permissions:
             :param browser_context_id: *(Optional)* BrowserContext to override permissions. When omitted, default browser context is used.
             '''
-            params: T_JSON_DICT = dict()
-            params['origin'] = origin
-            params['permissions'] = [i.to_json() for i in permissions]
+            params: T_JSON_DICT = {
+                'origin': origin,
+                'permissions': [i.to_json() for i in permissions],
+            }
             if browser_context_id is not None:
                 params['browserContextId'] = browser_context_id.to_json()
-            cmd_dict: T_JSON_DICT = {
+            yield {
                 'method': 'Browser.grantPermissions',
                 'params': params,
-            }
-            json = yield cmd_dict""")
+            }""")
 
     cmd = CdpCommand.from_json(json_cmd, 'Browser')
     actual = cmd.generate_code()
@@ -835,6 +915,38 @@ def test_cdp_domain_imports():
     assert expected == actual
 
 
+def test_cdp_domain_header_imports():
+    ''' Only the header imports used by the generated code are emitted. '''
+    stream_type = {"id": "StreamHandle", "type": "string"}
+    domain = CdpDomain.from_json({
+        "domain": "IO",
+        "types": [stream_type],
+        "commands": [{"name": "close"}],
+    })
+    assert domain.generate_header_imports() == dedent("""\
+        import typing
+        from .util import T_JSON_DICT""")
+
+    domain = CdpDomain.from_json({
+        "domain": "Log",
+        "types": [
+            {"id": "Level", "type": "string", "enum": ["info", "error"]},
+            {
+                "id": "Entry",
+                "type": "object",
+                "properties": [{"name": "text", "type": "string"}]
+            },
+        ],
+        "commands": [{"name": "clear"}],
+        "events": [{"name": "entryAdded"}],
+    })
+    assert domain.generate_header_imports() == dedent("""\
+        import enum
+        import typing
+        from dataclasses import dataclass
+        from .util import event_class, T_JSON_DICT""")
+
+
 def test_domain_shadows_builtin():
     ''' If a domain name shadows a Python builtin, it should have an underscore
     appended to the module name. '''
@@ -848,6 +960,15 @@ def test_domain_shadows_builtin():
     assert domain.module == 'input_'
 
 
+def test_underscore():
+    ''' The single pass conversion must match ``inflection.underscore``. '''
+    names = ['', 'a', 'A', 'domain', 'getDOMCounters', 'HTTPHeader', 'nodeId',
+        'AXNode', 'IPv6', 'css3D', 'x509Certificate', 'dash-case', 'ABCd',
+        'snake_Case', 'URLs', 'aB1C', 'wasm64', 'JSONTypes']
+    for name in names:
+        assert underscore(name) == inflection.underscore(name), name
+
+
 def test_cdp_domain_sphinx():
     json_domain = {
         "domain": "Animation",
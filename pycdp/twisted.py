@@ -6,11 +6,13 @@ from contextlib import asynccontextmanager
 from twisted.internet import reactor
 from twisted.internet.error import ConnectionRefusedError
 from twisted.web.client import Agent, Response, readBody
-from twisted.internet.defer import DeferredQueue, QueueOverflow, Deferred, CancelledError
+from twisted.internet.defer import (
+    DeferredQueue, QueueOverflow, Deferred, CancelledError, FirstError, ensureDeferred, gatherResults
+)
 from autobahn.twisted.websocket import WebSocketClientProtocol, WebSocketClientFactory
 from pycdp.exceptions import *
 from pycdp.base import IEventLoop
-from pycdp.utils import ContextLoggerMixin, LoggerMixin, retry_on
+from pycdp.utils import ContextLoggerMixin, LoggerMixin, json_dumps_bytes, json_loads, retry_on
 from pycdp import cdp
 
 
@@ -128,15 +130,31 @@ class CDPBase(LoggerMixin):
         if self._session_id:
             request['sessionId'] = self._session_id
         self._logger.debug('sending command %r', request)
-        request_str = json.dumps(request)
+        request_bytes = json_dumps_bytes(request)
         try:
-            self._ws.sendMessage(request_str.encode('UTF-8'))
+            self._ws.sendMessage(request_bytes)
             return await cmd_response
         except CancelledError:
             if cmd_id in self._inflight_cmd:
                 del self._inflight_cmd[cmd_id]
             raise
 
+    async def execute_many(self, *cmds: t.Generator[dict, dict, t.Any]) -> t.List[t.Any]:
+        '''
+        Execute several commands on the server and wait for all results.
+
+        CDP has no JSON-RPC batch requests, so each command is still sent in its
+        own message, but all of them are sent before waiting for any response.
+        This costs a single roundtrip instead of one roundtrip per command.
+
+        :param cmds: any CDP commands
+        :returns: a list with the CDP result of each command, in the same order
+        '''
+        try:
+            return await gatherResults([ensureDeferred(self.execute(cmd)) for cmd in cmds], consumeErrors=True)
+        except FirstError as e:
+            e.subFailure.raiseException()
+
     def listen(self, *event_types: t.Type[T], buffer_size=100) -> t.AsyncIterator[T]:
         '''Return an async iterator that iterates over events matching the
         indicated types.'''
@@ -283,7 +301,7 @@ class CDPConnection(CDPBase):
     def _handleMessage(self, message: bytes, isBinary: bool):
         if isBinary: raise RuntimeError('unexpected binary ws message')
         try:
-            data = json.loads(message)
+            data = json_loads(message)
         except json.JSONDecodeError:
             raise CDPBrowserError({
                 'code': -32700,
@@ -295,7 +313,7 @@ class CDPConnection(CDPBase):
             try:
                 session = self._sessions[session_id]
             except KeyError:
-                self._logger.debug(f'received message for unknown session: {data}')
+                self._logger.debug('received message for unknown session: %s', data)
             session._handle_data(data)
         else:
             self._handle_data(data)
@@ -1,4 +1,5 @@
 import sys
+import json
 import random
 import inspect
 import asyncio
@@ -7,11 +8,40 @@ import functools
 import typing as t
 from types import SimpleNamespace, TracebackType
 from pycdp.base import IEventLoop
+try:
+    import orjson
+except ImportError:
+    orjson = None # type: ignore
 
 
 _T = t.TypeVar('_T')
 
 
+if orjson is not None:
+    # orjson.JSONDecodeError is a subclass of json.JSONDecodeError, callers can
+    # keep catching the latter.
+    json_loads = orjson.loads
+
+    def _orjson_default(obj: t.Any) -> t.Any:
+        # orjson serializes subclasses of str, int, dict and list natively but
+        # not subclasses of float, e.g. network.TimeSinceEpoch.
+        if isinstance(obj, float):
+            return float(obj)
+        raise TypeError(f'Type is not JSON serializable: {type(obj).__name__}')
+
+    def json_dumps_bytes(obj: t.Any) -> bytes:
+        return orjson.dumps(obj, default=_orjson_default)
+
+    def json_dumps(obj: t.Any) -> str:
+        return json_dumps_bytes(obj).decode('UTF-8')
+else:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
+    def json_dumps_bytes(obj: t.Any) -> bytes:
+        return json.dumps(obj).encode('UTF-8')
+
+
 class LoggerMixin:
 
     def __init__(self, *args, **kwargs):
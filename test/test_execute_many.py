@@ -0,0 +1,136 @@
+'''
+Tests for sending several commands at once with ``execute_many()``.
+
+Both clients are driven by a fake WebSocket that only records the requests,
+the responses are fed back by hand so the test controls when they arrive.
+'''
+import json
+import asyncio
+
+import pytest
+
+from pycdp import cdp
+from pycdp.exceptions import CDPBrowserError
+
+
+DOMAINS_RESULT = {'domains': [{'name': 'Page', 'version': '1.3'}]}
+VERSION_RESULT = {
+    'protocolVersion': '1.3',
+    'product': 'Chrome',
+    'revision': '1',
+    'userAgent': 'UA',
+    'jsVersion': '11',
+}
+
+
+def make_commands():
+    return cdp.page.enable(), cdp.schema.get_domains(), cdp.browser.get_version()
+
+
+def check_results(results):
+    enable_result, domains, version = results
+    assert enable_result is None
+    assert domains == [cdp.schema.Domain('Page', '1.3')]
+    assert version == ('1.3', 'Chrome', '1', 'UA', '11')
+
+
+class FakeAsyncIOSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send_str(self, data):
+        self.sent.append(json.loads(data))
+
+
+async def asyncio_send_all(conn, count):
+    task = asyncio.ensure_future(conn.execute_many(*make_commands()))
+    while len(conn._ws.sent) < count:
+        assert not task.done()
+        await asyncio.sleep(0)
+    assert not task.done()
+    return task
+
+
+def test_asyncio_execute_many():
+    from pycdp.asyncio import CDPBase
+
+    async def main():
+        conn = CDPBase(FakeAsyncIOSocket())
+        task = await asyncio_send_all(conn, 3)
+        methods = [request['method'] for request in conn._ws.sent]
+        assert methods == ['Page.enable', 'Schema.getDomains', 'Browser.getVersion']
+        enable_id, domains_id, version_id = (request['id'] for request in conn._ws.sent)
+        # Answer out of order, the results must still follow argument order.
+        conn._handle_data({'id': version_id, 'result': VERSION_RESULT})
+        conn._handle_data({'id': domains_id, 'result': DOMAINS_RESULT})
+        conn._handle_data({'id': enable_id, 'result': {}})
+        check_results(await task)
+
+    asyncio.run(main())
+
+
+def test_asyncio_execute_many_error():
+    from pycdp.asyncio import CDPBase
+
+    async def main():
+        conn = CDPBase(FakeAsyncIOSocket())
+        task = await asyncio_send_all(conn, 3)
+        enable_id, domains_id, version_id = (request['id'] for request in conn._ws.sent)
+        conn._handle_data({'id': enable_id, 'result': {}})
+        conn._handle_data({'id': domains_id, 'error': {'code': -32000, 'message': 'boom'}})
+        conn._handle_data({'id': version_id, 'result': VERSION_RESULT})
+        with pytest.raises(CDPBrowserError) as exc_info:
+            await task
+        assert exc_info.value.message == 'boom'
+
+    asyncio.run(main())
+
+
+class FakeTwistedSocket:
+    closedByMe = False
+    remoteCloseCode = None
+
+    def __init__(self):
+        self.sent = []
+
+    def sendMessage(self, data):
+        self.sent.append(json.loads(data))
+
+
+def twisted_send_all():
+    from twisted.internet.defer import ensureDeferred
+    from pycdp.twisted import CDPBase
+    conn = CDPBase(FakeTwistedSocket())
+    results = []
+    d = ensureDeferred(conn.execute_many(*make_commands()))
+    d.addBoth(results.append)
+    assert len(conn._ws.sent) == 3
+    assert not results
+    return conn, results
+
+
+def test_twisted_execute_many():
+    pytest.importorskip('twisted')
+    pytest.importorskip('autobahn')
+    conn, results = twisted_send_all()
+    methods = [request['method'] for request in conn._ws.sent]
+    assert methods == ['Page.enable', 'Schema.getDomains', 'Browser.getVersion']
+    enable_id, domains_id, version_id = (request['id'] for request in conn._ws.sent)
+    conn._handle_data({'id': version_id, 'result': VERSION_RESULT})
+    conn._handle_data({'id': domains_id, 'result': DOMAINS_RESULT})
+    assert not results
+    conn._handle_data({'id': enable_id, 'result': {}})
+    check_results(results[0])
+
+
+def test_twisted_execute_many_error():
+    pytest.importorskip('twisted')
+    pytest.importorskip('autobahn')
+    conn, results = twisted_send_all()
+    enable_id, domains_id, version_id = (request['id'] for request in conn._ws.sent)
+    conn._handle_data({'id': enable_id, 'result': {}})
+    conn._handle_data({'id': domains_id, 'error': {'code': -32000, 'message': 'boom'}})
+    conn._handle_data({'id': version_id, 'result': VERSION_RESULT})
+    failure = results[0]
+    assert failure.check(CDPBrowserError)
+    assert failure.value.message == 'boom'
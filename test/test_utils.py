@@ -0,0 +1,33 @@
+'''
+Tests for the JSON helpers the clients use to encode and decode CDP messages.
+'''
+import json
+
+import pytest
+
+from pycdp import cdp
+from pycdp import utils
+
+
+def test_json_dumps_float_subclass():
+    ''' Some CDP types subclass float, those must encode like plain floats. '''
+    pytest.importorskip('orjson')
+    assert utils.orjson is not None
+    requests = [
+        next(cdp.network.set_cookie(name='a', value='b',
+            expires=cdp.network.TimeSinceEpoch(1e9))),
+        next(cdp.input_.dispatch_key_event('keyDown',
+            timestamp=cdp.input_.TimeSinceEpoch(1.5))),
+    ]
+    for request in requests:
+        expected = json.loads(json.dumps(request))
+        assert json.loads(utils.json_dumps(request)) == expected
+        assert json.loads(utils.json_dumps_bytes(request)) == expected
+    assert json.loads(utils.json_dumps(requests[0]))['params']['expires'] == 1e9
+
+
+def test_json_dumps_not_serializable():
+    with pytest.raises(TypeError):
+        utils.json_dumps({'value': object()})
+    with pytest.raises(TypeError):
+        utils.json_dumps_bytes({'value': object()})